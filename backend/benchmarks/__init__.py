@@ -0,0 +1 @@
+""" Benchmarks del backend. Se ejecutan desde ``backend/`` con ``python -m benchmarks.<módulo>``. """
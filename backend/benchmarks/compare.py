@@ -0,0 +1,55 @@
+"""
+Comparación de dos ejecuciones de un benchmark guardadas con ``--output``.
+
+Uso: ``python -m benchmarks.compare antes.json despues.json [--metric p95_ms] [--threshold 10]``
+Muestra, para cada operación presente en ambos archivos, la métrica de cada ejecución y el cambio
+porcentual; con ``--threshold`` termina con código 1 si alguna empeora más de ese porcentaje.
+"""
+import argparse
+import sys
+
+from benchmarks.results import load_results
+
+# Métricas en las que un valor mayor es mejor
+HIGHER_IS_BETTER = {"requests_per_second"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--metric", default="p50_ms")
+    parser.add_argument("--threshold", type=float, default=None, help="Empeoramiento máximo permitido (%%)")
+    args = parser.parse_args()
+
+    baseline = load_results(args.baseline)
+    candidate = load_results(args.candidate)
+    if baseline["benchmark"] != candidate["benchmark"]:
+        raise SystemExit(f"Benchmarks distintos: {baseline['benchmark']} y {candidate['benchmark']}")
+    if baseline["parameters"] != candidate["parameters"]:
+        print(f"Aviso: parámetros distintos\n  {baseline['parameters']}\n  {candidate['parameters']}")
+
+    higher_is_better = args.metric in HIGHER_IS_BETTER
+    names = [name for name in baseline["results"] if name in candidate["results"]]
+    width = max([len(name) for name in names] + [9])
+    print(f"{args.metric}: {baseline.get('commit') or args.baseline} -> {candidate.get('commit') or args.candidate}")
+    print(f"{'operación':<{width}}{'antes':>12}{'después':>12}{'cambio':>10}")
+    regressions = []
+    for name in names:
+        before = baseline["results"][name].get(args.metric)
+        after = candidate["results"][name].get(args.metric)
+        if not before or after is None:
+            continue
+        change = (after - before) / before * 100
+        worse = -change if higher_is_better else change
+        if args.threshold is not None and worse > args.threshold:
+            regressions.append(name)
+        print(f"{name:<{width}}{before:>12}{after:>12}{change:>+9.1f}%{' !' if name in regressions else ''}")
+
+    if regressions:
+        print(f"{len(regressions)} operaciones empeoraron más de {args.threshold}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+""" Generador determinista de datos sintéticos para benchmarks. """
+import itertools
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Iterator, List
+
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Engine
+
+from src.domain.entities.author import Gender
+from src.infrastructure.models import (  # noqa: F401 (registro de modelos)
+    department, author, scopus_account, publication, publication_stats, report, sync_watermark, table_version
+)
+from src.infrastructure.models.author import AuthorModel
+from src.infrastructure.models.base import Base
+from src.infrastructure.models.department import DepartmentModel
+from src.infrastructure.models.scopus_account import ScopusAccountModel
+from src.infrastructure.migrations import VERSION_TABLE, upgrade_database
+from src.infrastructure.search.normalization import full_search_name
+
+FIRST_NAMES = [
+    "José", "María", "Luis", "Ana", "Andrés", "Sofía", "Martín", "Lucía", "Tomás", "Inés",
+    "Raúl", "Mónica", "Iván", "Verónica", "Sebastián", "Belén", "Óscar", "Nathalia", "Julián", "Carolina",
+]
+LAST_NAMES = [
+    "Pérez", "Gómez", "Muñoz", "Ávila", "Zúñiga", "Rodríguez", "Chávez", "Benítez", "Ordóñez", "Núñez",
+    "Guzmán", "Cevallos", "Andrade", "Salazar", "Villacís", "Jácome", "Proaño", "Yánez", "Espín", "Logroño",
+]
+_COEFFICIENTS = [2, 1, 2, 1, 2, 1, 2, 1, 2]
+
+
+def generate_dni(number: int) -> str:
+    """ Genera una cédula ecuatoriana válida y única para cada número de secuencia. """
+    province = number % 24 + 1
+    body = f"{province:02d}{number // 24 % 10 ** 7:07d}"
+    total = 0
+    for digit, coefficient in zip(body, _COEFFICIENTS):
+        product = int(digit) * coefficient
+        total += product - 9 if product >= 10 else product
+    return body + str((10 - total % 10) % 10)
+
+
+def generate_author_rows(count: int, department_ids: List[int], seed: int = 42) -> Iterator[dict]:
+    """ Genera filas de la tabla ``authors`` listas para un INSERT masivo. """
+    rng = random.Random(seed)
+    for number in range(count):
+        first_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(FIRST_NAMES)}"
+        last_name = f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        yield {
+            "dni": generate_dni(number),
+            "title": rng.choice([None, "Ing.", "Dr.", "MSc."]),
+            "first_name": first_name,
+            "last_name": last_name,
+            "birth_date": date(1950, 1, 1) + timedelta(days=rng.randrange(18000)),
+            "gender": rng.choice(list(Gender)),
+            "position": rng.choice(["Profesor Titular", "Profesor Agregado", "Profesor Auxiliar"]),
+            "department_id": rng.choice(department_ids),
+            "search_name": full_search_name(first_name, last_name),
+        }
+
+
+FACULTIES = ["Ingeniería de Sistemas", "Ingeniería Eléctrica", "Ciencias", "Ingeniería Civil", "Geología y Petróleos",
+             "Ingeniería Química", "Ingeniería Mecánica", "Ciencias Administrativas"]
+INSERT_BATCH_SIZE = 5000
+
+
+@dataclass(frozen=True)
+class UniversityDataset:
+    """ Tamaño de un conjunto de datos sintético; los IDs generados van de 1 al total de cada tabla. """
+    departments: int
+    authors: int
+    accounts: int
+    seed: int = 42
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def generate_department_rows(count: int) -> Iterator[dict]:
+    """ Genera filas de la tabla ``departments`` con siglas únicas. """
+    for number in range(1, count + 1):
+        yield {
+            "dep_code": f"D{number:03d}",
+            "dep_name": f"Departamento {number}",
+            "fac_name": FACULTIES[number % len(FACULTIES)],
+        }
+
+
+def generate_account_rows(count: int, authors: int, seed: int = 42) -> Iterator[dict]:
+    """
+    Genera filas de ``scopus_accounts``: las primeras ``authors`` cuentas asignan una a cada autor y las
+    restantes se reparten al azar, de modo que algunos autores tienen varias cuentas.
+    """
+    rng = random.Random(seed)
+    for number in range(count):
+        yield {
+            "username": str(57_000_000_000 + number),
+            "affiliation": "Escuela Politécnica Nacional",
+            "author_id": number + 1 if number < authors else rng.randrange(1, authors + 1),
+        }
+
+
+def _insert_batches(connection, model, rows: Iterator[dict]) -> None:
+    while batch := list(itertools.islice(rows, INSERT_BATCH_SIZE)):
+        connection.execute(insert(model), batch)
+
+
+def recreate_schema(engine: Engine) -> None:
+    """ Borra todas las tablas y crea el esquema con las mismas migraciones que aplica el despliegue. """
+    Base.metadata.drop_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text(f"DROP TABLE IF EXISTS {VERSION_TABLE}"))
+    upgrade_database(engine)
+
+
+def seed_university(engine: Engine, dataset: UniversityDataset) -> None:
+    """
+    Recrea el esquema con las migraciones y carga ``dataset``: departamentos, autores con cédulas válidas repartidos entre
+    ellos y cuentas Scopus. Con la misma semilla se generan siempre los mismos datos.
+    """
+    if dataset.departments < 1 or (dataset.accounts and dataset.authors < 1):
+        raise ValueError("Se necesita al menos un departamento, y autores si hay cuentas.")
+    recreate_schema(engine)
+    with engine.begin() as connection:
+        _insert_batches(connection, DepartmentModel, generate_department_rows(dataset.departments))
+        _insert_batches(connection, AuthorModel, generate_author_rows(
+            dataset.authors, list(range(1, dataset.departments + 1)), dataset.seed
+        ))
+        _insert_batches(connection, ScopusAccountModel, generate_account_rows(
+            dataset.accounts, dataset.authors, dataset.seed
+        ))
@@ -0,0 +1,124 @@
+"""
+Benchmark del costo por fila de validar DNIs al leer y al cargar autores.
+
+Uso: ``python -m benchmarks.dni_benchmark --authors 100000 --database-url postgresql://...``
+Sin ``--database-url`` se usa un archivo SQLite temporal. Mide, en microsegundos por fila:
+
+- la validación original (bucle con lista de coeficientes), la validación con tablas precalculadas y la
+  validación en bloque de ``validate_dnis``;
+- la construcción del value object con validación (``DNI(...)``) y sin ella (``DNI.trusted``);
+- la lectura completa de los autores con ``AuthorRepoImpl.get_all``, validando cada DNI leído con el
+  bucle original (antes) y con ``DNI.trusted`` (ahora).
+"""
+import argparse
+import itertools
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import generate_author_rows
+from src.domain.value_objects.author import DNI, is_valid_dni, validate_dnis
+from src.infrastructure.models import department, author, scopus_account  # noqa: F401 (registro de modelos)
+from src.infrastructure.models.author import AuthorModel
+from src.infrastructure.models.base import Base
+from src.infrastructure.models.department import DepartmentModel
+from src.infrastructure.repositories import author_repo_impl
+from src.infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+
+INSERT_BATCH_SIZE = 5000
+
+
+def _legacy_validate_dni(value: str) -> bool:
+    """ Validación anterior de ``DNI.validate_dni``, como referencia. """
+    valid_dni = False
+    if value.isdigit() and len(value) == 10:
+        state_digit = int(value[0:2])
+        if 1 <= state_digit <= 24:
+            coefficients = [2, 1, 2, 1, 2, 1, 2, 1, 2]
+            total = 0
+            for i in range(9):
+                digit = int(value[i]) * coefficients[i]
+                if digit >= 10:
+                    digit -= 9
+                total += digit
+            check_digit = (10 - (total % 10)) % 10
+            if check_digit == int(value[9]):
+                valid_dni = True
+    return valid_dni
+
+
+def _legacy_dni(value: str) -> DNI:
+    """ Construcción anterior del DNI al hidratar: vacío, formato y dígito verificador en cada lectura. """
+    if value is None or not value.strip() or not _legacy_validate_dni(value):
+        raise ValueError("DNI incorrecto.")
+    return DNI.trusted(value)
+
+
+def _seed(engine, authors: int) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(DepartmentModel), [
+            {"dep_code": f"D{i:03d}", "dep_name": f"Departamento {i}", "fac_name": "Facultad"} for i in range(1, 51)
+        ])
+        rows = generate_author_rows(authors, list(range(1, 51)))
+        while batch := list(itertools.islice(rows, INSERT_BATCH_SIZE)):
+            connection.execute(insert(AuthorModel), batch)
+
+
+def _per_row_us(call, rows: int, repeat: int) -> float:
+    """Mejor tiempo de ``repeat`` ejecuciones, en microsegundos por fila."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - started)
+    return best / rows * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--authors", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'dni_benchmark.db')}"
+    engine = create_engine(url)
+    print(f"Generando {args.authors} autores en {engine.dialect.name}...")
+    _seed(engine, args.authors)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        dnis = [row.dni for row in session.query(AuthorModel.dni)]
+    rows = len(dnis)
+
+    def read_all():
+        with session_factory() as read_session:
+            AuthorRepoImpl(read_session).get_all()
+
+    def read_all_validating():
+        # Hidratación anterior: cada DNI leído se vuelve a validar con el bucle original
+        with mock.patch.object(author_repo_impl, "DNI", SimpleNamespace(trusted=_legacy_dni)):
+            read_all()
+
+    measurements = [
+        ("validación original", lambda: [_legacy_validate_dni(dni) for dni in dnis]),
+        ("validación con tablas", lambda: [is_valid_dni(dni) for dni in dnis]),
+        ("validate_dnis (bloque)", lambda: validate_dnis(dnis)),
+        ("DNI(...)", lambda: [DNI(dni) for dni in dnis]),
+        ("DNI.trusted(...)", lambda: [DNI.trusted(dni) for dni in dnis]),
+        ("get_all (antes)", read_all_validating),
+        ("get_all (DNI.trusted)", read_all),
+    ]
+    print(f"{'operación':<26}{'µs/fila':>10}")
+    for name, call in measurements:
+        print(f"{name:<26}{_per_row_us(call, rows, args.repeat):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
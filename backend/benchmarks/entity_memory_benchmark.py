@@ -0,0 +1,120 @@
+"""
+Benchmark de memoria de las entidades de dominio.
+
+Uso: ``python -m benchmarks.entity_memory_benchmark --count 100000``
+Mide con tracemalloc la memoria que retienen ``count`` entidades una vez descartadas las filas de las que
+se crearon (cadenas, fechas y enteros incluidos), para:
+
+- las entidades con ``__dict__`` por instancia (como eran antes de usar ``slots=True``);
+- las entidades actuales, con ``__slots__``;
+- ``AuthorColumns``, un arreglo por campo.
+"""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass, fields, make_dataclass
+from typing import Callable, List
+
+from benchmarks.datagen import generate_author_rows
+from src.domain.entities.author import Author
+from src.domain.entities.author_columns import AuthorColumns
+from src.domain.entities.department import Department
+from src.domain.entities.scopus_account import ScopusAccount
+from src.domain.value_objects.author import DNI
+
+
+def _with_dict(entity_class, frozen: bool = False):
+    """ Copia de la entidad con los mismos campos y sin __slots__, como referencia. """
+    return make_dataclass(f"{entity_class.__name__}ConDict",
+                          [(field.name, field.type) for field in fields(entity_class)], frozen=frozen)
+
+
+LegacyAuthor = _with_dict(Author)
+LegacyDNI = _with_dict(DNI, frozen=True)
+LegacyDepartment = _with_dict(Department)
+LegacyScopusAccount = _with_dict(ScopusAccount)
+
+
+@dataclass
+class _Measure:
+    entity: str
+    variant: str
+    bytes_per_entity: float
+
+
+def _author_rows(count: int) -> List[tuple]:
+    return [
+        (number + 1, row["dni"], row["title"], row["first_name"], row["last_name"], row["birth_date"],
+         row["gender"], row["position"], row["department_id"])
+        for number, row in enumerate(generate_author_rows(count, list(range(1, 51))))
+    ]
+
+
+def _department_rows(count: int) -> List[tuple]:
+    return [(number, f"D{number:05d}", f"Departamento de prueba {number}", f"Facultad {number % 9}")
+            for number in range(1, count + 1)]
+
+
+def _account_rows(count: int) -> List[tuple]:
+    return [(number, str(57_000_000_000 + number), f"Escuela Politécnica Nacional {number % 3}", number)
+            for number in range(1, count + 1)]
+
+
+def _retained_bytes(make_rows: Callable[[], List[tuple]], build: Callable[[List[tuple]], object]) -> int:
+    """Memoria que sigue asignada tras construir las entidades y liberar las filas de origen."""
+    gc.collect()
+    tracemalloc.start()
+    rows = make_rows()
+    entities = build(rows)
+    del rows
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    count = args.count
+
+    def authors(author_class, dni_class):
+        return lambda rows: [
+            author_class(author_id, dni_class(dni), title, name, surname, birth_date, gender, position, dep_id)
+            for author_id, dni, title, name, surname, birth_date, gender, position, dep_id in rows
+        ]
+
+    def columns(rows):
+        authors_by_column = AuthorColumns()
+        for row in rows:
+            authors_by_column.append_values(*row)
+        return authors_by_column
+
+    cases = [
+        ("Author", "con __dict__", lambda: _author_rows(count), authors(LegacyAuthor, LegacyDNI)),
+        ("Author", "slots=True", lambda: _author_rows(count), authors(Author, DNI.trusted)),
+        ("Author", "AuthorColumns", lambda: _author_rows(count), columns),
+        ("Department", "con __dict__", lambda: _department_rows(count),
+         lambda rows: [LegacyDepartment(*row) for row in rows]),
+        ("Department", "slots=True", lambda: _department_rows(count), lambda rows: [Department(*row) for row in rows]),
+        ("ScopusAccount", "con __dict__", lambda: _account_rows(count),
+         lambda rows: [LegacyScopusAccount(*row) for row in rows]),
+        ("ScopusAccount", "slots=True", lambda: _account_rows(count),
+         lambda rows: [ScopusAccount(*row) for row in rows]),
+    ]
+    measures = [
+        _Measure(entity, variant, _retained_bytes(make_rows, build) / count)
+        for entity, variant, make_rows, build in cases
+    ]
+
+    print(f"{count} entidades")
+    print(f"{'entidad':<15}{'variante':<16}{'bytes/entidad':>14}{'MiB total':>11}")
+    for measure in measures:
+        print(f"{measure.entity:<15}{measure.variant:<16}{measure.bytes_per_entity:>14.0f}"
+              f"{measure.bytes_per_entity * count / 2 ** 20:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
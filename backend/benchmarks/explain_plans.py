@@ -0,0 +1,231 @@
+"""
+Planes de ejecución de las consultas de los repositorios.
+
+Uso: ``python -m benchmarks.explain_plans --authors 20000 [--database-url URL] [--skip-seed]``
+
+Carga el conjunto de datos sintético (por defecto en un archivo SQLite temporal), ejecuta cada operación
+de ``operations`` con una sesión nueva, captura las sentencias SQL que emite con sus parámetros y corre
+``EXPLAIN`` sobre cada una: ``EXPLAIN (FORMAT JSON)`` en PostgreSQL y ``EXPLAIN QUERY PLAN`` en SQLite.
+
+Un recorrido secuencial de una tabla con al menos ``--min-rows`` filas es un problema, salvo en las
+tablas que la operación lee completas a propósito (listas completas, streaming, índice de nombres) y en
+la búsqueda por nombre sobre SQLite, que no tiene índice trigram. Termina con código 1 si encuentra
+alguno e imprime el plan de la sentencia.
+"""
+import argparse
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Tuple
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.datagen import LAST_NAMES, UniversityDataset, seed_university
+from benchmarks.results import print_table
+from src.infrastructure.models.base import Base
+from src.infrastructure.repositories.author_query_repo_impl import AuthorQueryRepoImpl
+from src.infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+from src.infrastructure.repositories.department_repo_impl import DepartmentRepoImpl
+from src.infrastructure.repositories.publication_stats_repo_impl import PublicationStatsRepoImpl
+from src.infrastructure.repositories.report_repo_impl import ReportRepoImpl
+from src.infrastructure.repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+from src.infrastructure.repositories.sync_watermark_repo_impl import SyncWatermarkRepoImpl
+from src.infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
+
+# "SCAN authors" o "SCAN scopus_accounts AS other", sin "USING INDEX"
+_SQLITE_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+# Las inserciones con VALUES no tienen plan que revisar
+_INSERT_VALUES = re.compile(r"^\s*INSERT\b(?!.*\bSELECT\b)", re.IGNORECASE | re.DOTALL)
+
+
+@dataclass(frozen=True)
+class Operation:
+    """ Llamada a un repositorio y las tablas que puede recorrer completas. """
+    name: str
+    run: Callable[[Session], object]
+    full_tables: FrozenSet[str] = frozenset()
+    sqlite_scans: FrozenSet[str] = frozenset()
+
+
+def operations(dataset: UniversityDataset) -> List[Operation]:
+    """ Consultas de los repositorios, con argumentos dentro del conjunto de datos. """
+    author_id = max(1, dataset.authors // 2)
+    dep_id = max(1, dataset.departments // 2)
+    author_ids = list(range(1, min(dataset.authors, 100) + 1))
+    username = str(57_000_000_000 + author_id - 1)
+    dni_lookup = lambda s: AuthorRepoImpl(s).get_by_id(author_id).dni.value
+    authors, accounts = frozenset({"authors"}), frozenset({"scopus_accounts"})
+    return [
+        Operation("AuthorRepoImpl.get_by_id", lambda s: AuthorRepoImpl(s).get_by_id(author_id)),
+        Operation("AuthorRepoImpl.get_by_ids", lambda s: AuthorRepoImpl(s).get_by_ids(author_ids)),
+        Operation("AuthorRepoImpl.get_by_dni", lambda s: AuthorRepoImpl(s).get_by_dni(dni_lookup(s))),
+        Operation("AuthorRepoImpl.get_existing_dnis", lambda s: AuthorRepoImpl(s).get_existing_dnis([dni_lookup(s)])),
+        Operation("AuthorRepoImpl.get_existing_ids", lambda s: AuthorRepoImpl(s).get_existing_ids(author_ids)),
+        Operation("AuthorRepoImpl.get_page", lambda s: AuthorRepoImpl(s).get_page(author_id, 100)),
+        Operation("AuthorRepoImpl.get_by_department_id", lambda s: AuthorRepoImpl(s).get_by_department_id(dep_id)),
+        Operation("AuthorRepoImpl.get_columns[departamento]", lambda s: AuthorRepoImpl(s).get_columns(dep_id)),
+        Operation("AuthorRepoImpl.search_by_name", lambda s: AuthorRepoImpl(s).search_by_name(LAST_NAMES[0], 50),
+                  sqlite_scans=authors),
+        Operation("AuthorRepoImpl.get_all", lambda s: AuthorRepoImpl(s).get_all(), full_tables=authors),
+        Operation("AuthorRepoImpl.iter_batches", lambda s: next(AuthorRepoImpl(s).iter_batches(500)),
+                  full_tables=authors),
+        Operation("AuthorRepoImpl.get_columns", lambda s: AuthorRepoImpl(s).get_columns(), full_tables=authors),
+        Operation("AuthorRepoImpl.get_name_entries", lambda s: AuthorRepoImpl(s).get_name_entries(),
+                  full_tables=authors),
+        Operation("AuthorRepoImpl.update_fields",
+                  lambda s: AuthorRepoImpl(s).update_fields(author_id, {"position": "Profesor Titular"})),
+        Operation("AuthorQueryRepoImpl.get_rows[departamento]",
+                  lambda s: AuthorQueryRepoImpl(s).get_rows(department_id=dep_id)),
+        Operation("AuthorQueryRepoImpl.get_rows[página]",
+                  lambda s: AuthorQueryRepoImpl(s).get_rows(after_id=author_id, limit=100)),
+        Operation("AuthorQueryRepoImpl.get_rows", lambda s: AuthorQueryRepoImpl(s).get_rows(),
+                  full_tables=authors | accounts),
+        Operation("ScopusAccountRepoImpl.get_by_id", lambda s: ScopusAccountRepoImpl(s).get_by_id(author_id)),
+        Operation("ScopusAccountRepoImpl.get_by_author_id",
+                  lambda s: ScopusAccountRepoImpl(s).get_by_author_id(author_id)),
+        Operation("ScopusAccountRepoImpl.get_by_author_ids",
+                  lambda s: ScopusAccountRepoImpl(s).get_by_author_ids(author_ids)),
+        Operation("ScopusAccountRepoImpl.get_by_username",
+                  lambda s: ScopusAccountRepoImpl(s).get_by_username(username)),
+        Operation("ScopusAccountRepoImpl.get_existing_usernames",
+                  lambda s: ScopusAccountRepoImpl(s).get_existing_usernames([username])),
+        Operation("ScopusAccountRepoImpl.get_page", lambda s: ScopusAccountRepoImpl(s).get_page(author_id, 100)),
+        Operation("ScopusAccountRepoImpl.get_all", lambda s: ScopusAccountRepoImpl(s).get_all(),
+                  full_tables=accounts),
+        Operation("ScopusAccountRepoImpl.iter_batches", lambda s: next(ScopusAccountRepoImpl(s).iter_batches(500)),
+                  full_tables=accounts),
+        Operation("ScopusAccountRepoImpl.update_fields",
+                  lambda s: ScopusAccountRepoImpl(s).update_fields(author_id, {"username": username})),
+        Operation("DepartmentRepoImpl.get_by_id", lambda s: DepartmentRepoImpl(s).get_by_id(dep_id)),
+        Operation("DepartmentRepoImpl.get_page", lambda s: DepartmentRepoImpl(s).get_page(dep_id, 100)),
+        Operation("DepartmentRepoImpl.get_all", lambda s: DepartmentRepoImpl(s).get_all(),
+                  full_tables=frozenset({"departments"})),
+        Operation("PublicationStatsRepoImpl.get_department_stats",
+                  lambda s: PublicationStatsRepoImpl(s).get_department_stats(dep_id)),
+        Operation("PublicationStatsRepoImpl.get_author_stats",
+                  lambda s: PublicationStatsRepoImpl(s).get_author_stats(dep_id)),
+        Operation("SyncWatermarkRepoImpl.get_by_scopus_ids",
+                  lambda s: SyncWatermarkRepoImpl(s).get_by_scopus_ids(author_ids)),
+        Operation("ReportRepoImpl.get_recent", lambda s: ReportRepoImpl(s).get_recent(dep_id, 20)),
+        Operation("ReportRepoImpl.count_active", lambda s: ReportRepoImpl(s).count_active(dep_id)),
+        Operation("TableVersionRepoImpl.department_data_version",
+                  lambda s: TableVersionRepoImpl(s).department_data_version(dep_id)),
+    ]
+
+
+def capture(session_factory, engine: Engine, operation: Operation) -> List[Tuple[str, object]]:
+    """ Sentencias (con sus parámetros) que ejecuta la operación, sin las inserciones con VALUES. """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and not _INSERT_VALUES.match(statement):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with session_factory() as session:
+            operation.run(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def explain(engine: Engine, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    """ Plan de la sentencia (una línea por nodo) y las tablas que recorre secuencialmente. """
+    with engine.connect() as connection:
+        if engine.dialect.name == "postgresql":
+            plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+            lines, scans = [], []
+            _walk_postgres_plan(plan[0]["Plan"], 0, lines, scans)
+            return lines, scans
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    lines = [row[-1] for row in rows]
+    scans = [match.group(1) for match in map(_SQLITE_SCAN.match, lines) if match]
+    return lines, scans
+
+
+def _walk_postgres_plan(node: dict, depth: int, lines: List[str], scans: List[str]) -> None:
+    relation = node.get("Relation Name")
+    index = node.get("Index Name")
+    lines.append("  " * depth + node["Node Type"] + (f" on {relation}" if relation else "") +
+                 (f" using {index}" if index else ""))
+    if node["Node Type"] == "Seq Scan" and relation:
+        scans.append(relation)
+    for child in node.get("Plans", []):
+        _walk_postgres_plan(child, depth + 1, lines, scans)
+
+
+def table_sizes(engine: Engine) -> Dict[str, int]:
+    with engine.connect() as connection:
+        return {table.name: connection.execute(select(func.count()).select_from(table)).scalar()
+                for table in Base.metadata.sorted_tables}
+
+
+def check(engine: Engine, dataset: UniversityDataset, min_rows: int) -> Tuple[Dict[str, dict], List[str]]:
+    """ Tabla de resultados por operación y la descripción de cada recorrido secuencial no permitido. """
+    sizes = table_sizes(engine)
+    large = {name for name, rows in sizes.items() if rows >= min_rows}
+    session_factory = sessionmaker(bind=engine)
+    table, failures = {}, []
+    for operation in operations(dataset):
+        allowed = operation.full_tables | (operation.sqlite_scans if engine.dialect.name == "sqlite" else frozenset())
+        statements = capture(session_factory, engine, operation)
+        flagged, all_scans = 0, set()
+        for statement, parameters in statements:
+            lines, scans = explain(engine, statement, parameters)
+            all_scans.update(scans)
+            bad = sorted({name for name in scans if name in large and name not in allowed})
+            if bad:
+                flagged += 1
+                plan = "\n".join(f"    {line}" for line in lines)
+                failures.append(f"{operation.name}: recorrido secuencial de {', '.join(bad)} "
+                                f"({', '.join(str(sizes[name]) for name in bad)} filas)\n"
+                                f"  {' '.join(statement.split())[:500]}\n{plan}")
+        table[operation.name] = {
+            "sentencias": len(statements),
+            "recorridos": ", ".join(sorted(all_scans)) or "-",
+            "estado": "FALLA" if flagged else "ok",
+        }
+    return table, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--departments", type=int, default=50)
+    parser.add_argument("--authors", type=int, default=20_000)
+    parser.add_argument("--accounts", type=int, default=None, help="Por defecto, 1.3 por autor")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--min-rows", type=int, default=1_000, help="Filas desde las que una tabla es grande")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--skip-seed", action="store_true", help="Usar los datos ya cargados")
+    args = parser.parse_args()
+    accounts = args.accounts if args.accounts is not None else int(args.authors * 1.3)
+    dataset = UniversityDataset(args.departments, args.authors, accounts, args.seed)
+    # Sin caché de repositorios todas las operaciones llegan a la BD
+    os.environ["CACHE_BACKEND"] = "none"
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'explain_plans.db')}"
+    engine = create_engine(url)
+    if not args.skip_seed:
+        print(f"Generando {dataset} en {engine.dialect.name}...")
+        seed_university(engine, dataset)
+    if engine.dialect.name == "postgresql":
+        # Estadísticas al día para que el planificador vea el tamaño real de las tablas
+        with engine.begin() as connection:
+            connection.exec_driver_sql("ANALYZE")
+
+    table, failures = check(engine, dataset, args.min_rows)
+    print_table(table, ["sentencias", "recorridos", "estado"])
+    if failures:
+        print(f"\n{len(failures)} recorrido(s) secuencial(es) en tablas grandes:\n")
+        print("\n\n".join(failures))
+        sys.exit(1)
+    print(f"\nSin recorridos secuenciales inesperados en tablas de {args.min_rows} filas o más.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark de la lectura y serialización de listados grandes de autores.
+
+Uso: ``python -m benchmarks.hydration_benchmark --authors 100000 --database-url postgresql://...``
+Sin ``--database-url`` se usa un archivo SQLite temporal. Compara, en microsegundos por autor:
+
+- entidades: modelo ORM -> entidad ``Author`` -> ``AuthorResponseDTO`` y la validación y serialización
+  del ``response_model`` del endpoint (lo que hacía ``GET /authors/``);
+- proyección: filas Core con las columnas de la respuesta serializadas directamente a JSON.
+
+La mitad de los autores tiene una cuenta Scopus; se verifica que ambos caminos producen el mismo JSON.
+"""
+import argparse
+import itertools
+import os
+import tempfile
+import time
+from typing import List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import generate_author_rows
+from src.application.dto.author_dto import AuthorResponseDTO
+from src.application.services.author_service import AuthorService
+from src.infrastructure.api.projection import json_response
+from src.infrastructure.models import department, author, scopus_account  # noqa: F401 (registro de modelos)
+from src.infrastructure.models.author import AuthorModel
+from src.infrastructure.models.base import Base
+from src.infrastructure.models.department import DepartmentModel
+from src.infrastructure.models.scopus_account import ScopusAccountModel
+from src.infrastructure.repositories.author_query_repo_impl import AuthorQueryRepoImpl
+from src.infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+from src.infrastructure.repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+
+INSERT_BATCH_SIZE = 5000
+RESPONSE_ADAPTER = TypeAdapter(List[AuthorResponseDTO])
+
+
+def _seed(engine, authors: int) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(DepartmentModel), [
+            {"dep_code": f"D{i:03d}", "dep_name": f"Departamento {i}", "fac_name": "Facultad"} for i in range(1, 51)
+        ])
+        rows = generate_author_rows(authors, list(range(1, 51)))
+        while batch := list(itertools.islice(rows, INSERT_BATCH_SIZE)):
+            connection.execute(insert(AuthorModel), batch)
+        accounts = ({"username": str(57_000_000_000 + author_id), "affiliation": "EPN", "author_id": author_id}
+                    for author_id in range(1, authors + 1, 2))
+        while batch := list(itertools.islice(accounts, INSERT_BATCH_SIZE)):
+            connection.execute(insert(ScopusAccountModel), batch)
+
+
+def _service(session) -> AuthorService:
+    return AuthorService(AuthorRepoImpl(session), ScopusAccountRepoImpl(session),
+                         query_repository=AuthorQueryRepoImpl(session))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--authors", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'hydration_benchmark.db')}"
+    engine = create_engine(url)
+    print(f"Generando {args.authors} autores en {engine.dialect.name}...")
+    _seed(engine, args.authors)
+    session_factory = sessionmaker(bind=engine)
+
+    def entities() -> bytes:
+        with session_factory() as session:
+            dtos = _service(session).get_authors()
+            return JSONResponse(RESPONSE_ADAPTER.dump_python(RESPONSE_ADAPTER.validate_python(dtos), mode="json")).body
+
+    def projection() -> bytes:
+        with session_factory() as session:
+            return json_response(_service(session).get_author_rows()).body
+
+    if entities() != projection():
+        raise SystemExit("Los dos caminos producen JSON distinto")
+
+    timings = {}
+    for name, call in (("entidades", entities), ("proyección", projection)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            call()
+            best = min(best, time.perf_counter() - started)
+        timings[name] = best / args.authors * 1e6
+        print(f"{name:<12}{timings[name]:>10.2f} µs/autor")
+    print(f"aceleración  {timings['entidades'] / timings['proyección']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
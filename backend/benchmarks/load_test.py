@@ -0,0 +1,162 @@
+"""
+Prueba de carga HTTP de los endpoints de lectura.
+
+Uso: ``python -m benchmarks.load_test --authors 5000 --requests 200 --concurrency 16 --output carga.json``
+
+Sin ``--base-url`` la aplicación (``main.app``) corre en el mismo proceso con httpx.ASGITransport, sobre
+``--database-url`` (por defecto un archivo SQLite temporal) con el conjunto de datos sintético; la
+latencia incluye entonces el cliente, que comparte el event loop. Con ``--base-url`` se prueba un
+servidor ya levantado (p. ej. uvicorn con varios workers) y ``--database-url`` solo se usa para cargar
+los datos, que se omite con ``--skip-seed``.
+
+Cada endpoint recibe ``--requests`` peticiones con ``--concurrency`` clientes simultáneos, uno tras otro,
+y se informan p50/p95/p99, peticiones por segundo y errores (respuestas que no son 2xx).
+"""
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+from sqlalchemy import create_engine
+
+from benchmarks.datagen import LAST_NAMES, UniversityDataset, seed_university
+from benchmarks.results import print_table, save_results, summarize
+
+# Endpoint: nombre y función que arma la URL con IDs y términos aleatorios
+Endpoint = Tuple[str, Callable[[random.Random], str]]
+
+
+def scenario(dataset: UniversityDataset) -> List[Endpoint]:
+    """ Endpoints de lectura probados, con argumentos dentro del conjunto de datos. """
+    def author_id(rng):
+        return rng.randint(1, dataset.authors)
+
+    def dep_id(rng):
+        return rng.randint(1, dataset.departments)
+
+    def account_id(rng):
+        return rng.randint(1, dataset.accounts)
+
+    return [
+        ("GET /authors/?limit=100", lambda rng: f"/authors/?cursor={author_id(rng)}&limit=100"),
+        ("GET /authors/", lambda rng: "/authors/"),
+        ("GET /authors/{id}", lambda rng: f"/authors/{author_id(rng)}"),
+        ("GET /authors/department/{id}", lambda rng: f"/authors/department/{dep_id(rng)}"),
+        ("GET /authors/search/{term}", lambda rng: f"/authors/search/{rng.choice(LAST_NAMES)}"),
+        ("GET /authors/scopus-ids/{term}", lambda rng: f"/authors/scopus-ids/{rng.choice(LAST_NAMES)}"),
+        ("GET /deps/", lambda rng: "/deps/"),
+        ("GET /deps/{id}", lambda rng: f"/deps/{dep_id(rng)}"),
+        ("GET /deps/{id}/stats", lambda rng: f"/deps/{dep_id(rng)}/stats"),
+        ("GET /scopus-accounts/?limit=100", lambda rng: f"/scopus-accounts/?cursor={account_id(rng)}&limit=100"),
+        ("GET /scopus-accounts/{id}", lambda rng: f"/scopus-accounts/{account_id(rng)}"),
+        ("GET /scopus-accounts/author/{id}", lambda rng: f"/scopus-accounts/author/{author_id(rng)}"),
+    ]
+
+
+async def _load_endpoint(client: httpx.AsyncClient, name: str, build_url: Callable[[random.Random], str],
+                         requests: int, concurrency: int) -> dict:
+    rng = random.Random(name)
+    urls = [build_url(rng) for _ in range(requests)]
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors = 0
+    queue = iter(urls)
+
+    async def client_loop():
+        nonlocal errors
+        for url in queue:
+            started = time.perf_counter()
+            try:
+                response = await client.get(url)
+                status = str(response.status_code)
+            except httpx.HTTPError:
+                status = "error"
+            latencies.append((time.perf_counter() - started) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+            if not status.startswith("2"):
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        **summarize(latencies),
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "errors": errors,
+        "status_codes": statuses,
+    }
+
+
+async def run_scenario(client: httpx.AsyncClient, dataset: UniversityDataset, requests: int, concurrency: int,
+                       selected: List[str]) -> Dict[str, dict]:
+    """ Prueba cada endpoint seleccionado (todos si no se indica ninguno) y devuelve sus resultados. """
+    results = {}
+    for name, build_url in scenario(dataset):
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        await client.get(build_url(random.Random(0)))  # calentamiento
+        results[name] = await _load_endpoint(client, name, build_url, requests, concurrency)
+    return results
+
+
+async def _run_in_process(args, dataset: UniversityDataset) -> Dict[str, dict]:
+    # La configuración se lee al importar la aplicación
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("DB_ECHO", "false")
+    os.environ.setdefault("REPORT_WORKERS", "0")
+    os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+    import main
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=120) as client:
+            return await run_scenario(client, dataset, args.requests, args.concurrency, args.only)
+
+
+async def _run_remote(args, dataset: UniversityDataset) -> Dict[str, dict]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=120) as client:
+        return await run_scenario(client, dataset, args.requests, args.concurrency, args.only)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--departments", type=int, default=50)
+    parser.add_argument("--authors", type=int, default=5_000)
+    parser.add_argument("--accounts", type=int, default=None, help="Por defecto, 1.3 por autor")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=200, help="Peticiones por endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--only", action="append", default=[], help="Probar solo los endpoints que contengan el texto")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--base-url", default=None, help="Servidor ya levantado; sin él se usa main.app en proceso")
+    parser.add_argument("--skip-seed", action="store_true", help="Usar los datos ya cargados")
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args()
+    accounts = args.accounts if args.accounts is not None else int(args.authors * 1.3)
+    dataset = UniversityDataset(args.departments, args.authors, accounts, args.seed)
+    args.database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'load_test.db')}"
+
+    engine = create_engine(args.database_url)
+    dialect = engine.dialect.name
+    if not args.skip_seed:
+        print(f"Generando {dataset} en {dialect}...")
+        seed_university(engine, dataset)
+    engine.dispose()
+
+    runner = _run_remote if args.base_url else _run_in_process
+    results = asyncio.run(runner(args, dataset))
+    print_table(results, ["p50_ms", "p95_ms", "p99_ms", "requests_per_second", "errors"])
+    if args.output:
+        parameters = {**dataset.as_dict(), "requests": args.requests, "concurrency": args.concurrency,
+                      "base_url": args.base_url}
+        save_results(args.output, "load_test", parameters, results, dialect)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
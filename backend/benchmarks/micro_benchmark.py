@@ -0,0 +1,138 @@
+"""
+Micro-benchmarks de los repositorios y servicios de autores, departamentos y cuentas Scopus.
+
+Uso: ``python -m benchmarks.micro_benchmark --departments 50 --authors 20000 --accounts 26000 --output r.json``
+Sin ``--database-url`` se usa un archivo SQLite temporal. Cada operación se ejecuta ``--repeat`` veces con
+una sesión nueva (como en una petición), sobre IDs y términos elegidos con una semilla fija, y se informan
+sus percentiles. Con ``--output`` los resultados se guardan en JSON para ``python -m benchmarks.compare``.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.datagen import LAST_NAMES, UniversityDataset, seed_university
+from benchmarks.results import print_table, save_results, summarize
+from src.application.services.author_service import AuthorService
+from src.application.services.department_service import DepartmentService
+from src.application.services.scopus_account_service import ScopusAccountService
+from src.infrastructure.repositories.author_query_repo_impl import AuthorQueryRepoImpl
+from src.infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+from src.infrastructure.repositories.department_repo_impl import DepartmentRepoImpl
+from src.infrastructure.repositories.publication_stats_repo_impl import PublicationStatsRepoImpl
+from src.infrastructure.repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+from src.infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
+
+# Operación: recibe la sesión y un generador aleatorio, y ejecuta una llamada
+Operation = Callable[[Session, random.Random], object]
+
+
+def _author_service(session: Session) -> AuthorService:
+    return AuthorService(AuthorRepoImpl(session), ScopusAccountRepoImpl(session), None, DepartmentRepoImpl(session),
+                         TableVersionRepoImpl(session), AuthorQueryRepoImpl(session))
+
+
+def _department_service(session: Session) -> DepartmentService:
+    return DepartmentService(DepartmentRepoImpl(session), TableVersionRepoImpl(session),
+                             PublicationStatsRepoImpl(session))
+
+
+def _scopus_service(session: Session) -> ScopusAccountService:
+    return ScopusAccountService(ScopusAccountRepoImpl(session), AuthorRepoImpl(session), TableVersionRepoImpl(session))
+
+
+def operations(dataset: UniversityDataset) -> List[Tuple[str, Operation]]:
+    """ Operaciones medidas, con sus argumentos elegidos dentro del conjunto de datos. """
+    def author_id(rng):
+        return rng.randint(1, dataset.authors)
+
+    def dep_id(rng):
+        return rng.randint(1, dataset.departments)
+
+    def surname(rng):
+        return rng.choice(LAST_NAMES)
+
+    return [
+        ("AuthorRepoImpl.get_by_id", lambda s, rng: AuthorRepoImpl(s).get_by_id(author_id(rng))),
+        ("AuthorRepoImpl.get_by_ids[100]",
+         lambda s, rng: AuthorRepoImpl(s).get_by_ids([author_id(rng) for _ in range(100)])),
+        ("AuthorRepoImpl.get_page[100]", lambda s, rng: AuthorRepoImpl(s).get_page(author_id(rng), 100)),
+        ("AuthorRepoImpl.get_by_department_id", lambda s, rng: AuthorRepoImpl(s).get_by_department_id(dep_id(rng))),
+        ("AuthorRepoImpl.search_by_name", lambda s, rng: AuthorRepoImpl(s).search_by_name(surname(rng), 50)),
+        ("AuthorRepoImpl.get_all", lambda s, rng: AuthorRepoImpl(s).get_all()),
+        ("AuthorRepoImpl.get_columns", lambda s, rng: AuthorRepoImpl(s).get_columns()),
+        ("AuthorQueryRepoImpl.get_rows", lambda s, rng: AuthorQueryRepoImpl(s).get_rows()),
+        ("AuthorService.get_author_by_id", lambda s, rng: _author_service(s).get_author_by_id(author_id(rng))),
+        ("AuthorService.get_authors", lambda s, rng: _author_service(s).get_authors()),
+        ("AuthorService.get_author_rows", lambda s, rng: _author_service(s).get_author_rows()),
+        ("AuthorService.get_authors_page[100]",
+         lambda s, rng: _author_service(s).get_authors_page(author_id(rng), 100)),
+        ("AuthorService.get_authors_by_department",
+         lambda s, rng: _author_service(s).get_authors_by_department(dep_id(rng))),
+        ("AuthorService.search_authors_by_name",
+         lambda s, rng: _author_service(s).search_authors_by_name(surname(rng), 50)),
+        ("AuthorService.get_scopus_account_ids_by_author_name",
+         lambda s, rng: _author_service(s).get_scopus_account_ids_by_author_name(surname(rng), 50)),
+        ("DepartmentService.get_departments", lambda s, rng: _department_service(s).get_departments()),
+        ("DepartmentService.get_department_by_id",
+         lambda s, rng: _department_service(s).get_department_by_id(dep_id(rng))),
+        ("ScopusAccountService.get_scopus_accounts", lambda s, rng: _scopus_service(s).get_scopus_accounts()),
+        ("ScopusAccountService.get_scopus_accounts_by_author",
+         lambda s, rng: _scopus_service(s).get_scopus_accounts_by_author(author_id(rng))),
+    ]
+
+
+def run(session_factory, dataset: UniversityDataset, repeat: int, selected: List[str]) -> Dict[str, dict]:
+    """ Ejecuta las operaciones seleccionadas (todas si no se indica ninguna) y resume sus tiempos. """
+    results = {}
+    for name, operation in operations(dataset):
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        rng = random.Random(name)
+        samples = []
+        for iteration in range(repeat + 1):
+            with session_factory() as session:
+                started = time.perf_counter()
+                operation(session, rng)
+                elapsed = (time.perf_counter() - started) * 1000
+            # La primera ejecución calienta cachés de compilación de SQLAlchemy y del motor
+            if iteration:
+                samples.append(elapsed)
+        results[name] = summarize(samples)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--departments", type=int, default=50)
+    parser.add_argument("--authors", type=int, default=20_000)
+    parser.add_argument("--accounts", type=int, default=None, help="Por defecto, 1.3 por autor")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--only", action="append", default=[], help="Medir solo las operaciones que contengan el texto")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args()
+    accounts = args.accounts if args.accounts is not None else int(args.authors * 1.3)
+    dataset = UniversityDataset(args.departments, args.authors, accounts, args.seed)
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'micro_benchmark.db')}"
+    engine = create_engine(url)
+    print(f"Generando {dataset} en {engine.dialect.name}...")
+    seed_university(engine, dataset)
+
+    results = run(sessionmaker(bind=engine), dataset, args.repeat, args.only)
+    print_table(results, ["p50_ms", "p95_ms", "p99_ms", "mean_ms"])
+    if args.output:
+        save_results(args.output, "micro_benchmark", {**dataset.as_dict(), "repeat": args.repeat}, results,
+                     engine.dialect.name)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Control de regresiones en el número de consultas SQL de cada endpoint.
+
+Uso: ``python -m benchmarks.query_budget --sizes 50,500,5000``. Los mismos casos corren en la suite de pruebas
+(``tests/test_query_budget.py``, un test por caso y tamaño) con ``python -m pytest`` desde ``backend``.
+
+Para cada tamaño de ``--sizes`` (número de autores; los departamentos y las cuentas Scopus crecen en
+proporción) carga el conjunto de datos sintético en ``--database-url`` (por defecto un archivo SQLite
+temporal), levanta ``main.app`` en el mismo proceso y llama una vez a cada caso de ``cases``: todas las
+rutas de autores, departamentos y cuentas Scopus, primero las lecturas y luego las escrituras. Las
+sentencias que ejecutan los motores de la aplicación durante cada petición se cuentan y se comparan con
+el presupuesto del caso.
+
+Falla (código de salida 1) e imprime las sentencias capturadas si un caso supera su presupuesto, si su
+número de consultas cambia con el tamaño de los datos (no es O(1)), si responde con un estado distinto
+del esperado o si una ruta de esos controladores no tiene caso. La caché de repositorios se desactiva
+para contar siempre el camino hacia la BD.
+
+Los presupuestos incluyen la consulta de versión que calcula el ETag. Las listas completas leen las
+cuentas Scopus en bloques de ``chunked`` (10 000 IDs), así que sobre ese tamaño suman una consulta por
+bloque; los tamaños por defecto quedan por debajo.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import httpx
+from sqlalchemy import event
+
+from benchmarks.datagen import UniversityDataset, generate_dni, seed_university
+from benchmarks.results import print_table, save_results
+from src.infrastructure.api.streaming import STREAM_BATCH_SIZE
+from src.infrastructure.sql_metrics import MAX_STATEMENT_LENGTH
+
+# Primer username de las cuentas creadas por los casos, fuera del rango de ``generate_account_rows``
+NEW_USERNAME_BASE = 58_000_000_000
+BULK_ROWS = 20
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Una petición a una ruta, con el máximo de consultas SQL que puede ejecutar.
+
+    Las respuestas en streaming leen los datos por lotes de ``STREAM_BATCH_SIZE`` filas y cada lote puede
+    sumar una consulta: ``stream_batches`` amplía el presupuesto en ese número de consultas.
+    """
+    method: str
+    route: str
+    url: str
+    budget: int
+    variant: str = ""
+    stream_batches: int = 0
+    json: Optional[object] = None
+    content: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    status: int = 200
+
+    @property
+    def allowed(self) -> int:
+        return self.budget + self.stream_batches
+
+    @property
+    def name(self) -> str:
+        label = f"{self.method} {self.route}"
+        return f"{label} [{self.variant}]" if self.variant else label
+
+
+def _author_payload(number: int, department_id: int) -> dict:
+    return {
+        "dni": generate_dni(number), "title": "Dr.", "first_name": "Presupuesto", "last_name": f"Consulta {number}",
+        "birth_date": date(1980, 1, 1).isoformat(), "gender": "F", "position": "Profesor Auxiliar",
+        "department_id": department_id,
+    }
+
+
+def cases(dataset: UniversityDataset) -> List[Case]:
+    """ Casos en orden de ejecución: lecturas sobre los datos cargados y luego escrituras. """
+    new_dep_id = dataset.departments + 1
+    new_author_id = dataset.authors + 1
+    new_account_id = dataset.accounts + 1
+    bulk_authors = [_author_payload(dataset.authors + 100 + index, 1) for index in range(BULK_ROWS)]
+    bulk_accounts = "\n".join(
+        json.dumps({"username": str(NEW_USERNAME_BASE + 100 + index), "affiliation": "Presupuesto",
+                    "author_id": index + 1})
+        for index in range(BULK_ROWS)
+    )
+    return [
+        # Autores
+        Case("GET", "/authors/", "/authors/", 3),
+        Case("GET", "/authors/", "/authors/?cursor=1&limit=100", 3, "página"),
+        Case("GET", "/authors/", "/authors/?stream=true", 2, "stream",
+             stream_batches=math.ceil(dataset.authors / STREAM_BATCH_SIZE)),
+        Case("GET", "/authors/{author_id}", "/authors/1", 3),
+        Case("GET", "/authors/department/{department_id}", "/authors/department/1", 3),
+        Case("GET", "/authors/search/{search_term}", "/authors/search/Pérez", 2),
+        Case("GET", "/authors/scopus-ids/{search_term}", "/authors/scopus-ids/Pérez", 2),
+        Case("GET", "/authors/name-index/check", "/authors/name-index/check", 1),
+        # Departamentos
+        Case("GET", "/deps/", "/deps/", 2),
+        Case("GET", "/deps/", "/deps/?cursor=1&limit=100", 2, "página"),
+        Case("GET", "/deps/", "/deps/?stream=true", 2, "stream"),
+        Case("GET", "/deps/{dep_id}", "/deps/1", 2),
+        Case("GET", "/deps/{dep_id}/stats", "/deps/1/stats", 3),
+        Case("GET", "/deps/{dep_id}/stats/authors", "/deps/1/stats/authors", 3),
+        # Cuentas Scopus
+        Case("GET", "/scopus-accounts/", "/scopus-accounts/", 2),
+        Case("GET", "/scopus-accounts/", "/scopus-accounts/?cursor=1&limit=100", 2, "página"),
+        Case("GET", "/scopus-accounts/", "/scopus-accounts/?stream=true", 2, "stream"),
+        Case("GET", "/scopus-accounts/{scopus_id}", "/scopus-accounts/1", 2),
+        Case("GET", "/scopus-accounts/author/{author_id}", "/scopus-accounts/author/1", 3),
+        # Escrituras
+        Case("POST", "/deps/", "/deps/", 3,
+             json={"dep_code": "QB-NEW", "dep_name": "Presupuesto de consultas", "fac_name": "Pruebas"}),
+        Case("POST", "/authors/", "/authors/", 5, json=_author_payload(dataset.authors + 1, new_dep_id)),
+        Case("POST", "/scopus-accounts/", "/scopus-accounts/", 5,
+             json={"username": str(NEW_USERNAME_BASE), "affiliation": "Presupuesto", "author_id": new_author_id}),
+        Case("POST", "/authors/bulk", "/authors/bulk", 4, json=bulk_authors),
+        Case("POST", "/scopus-accounts/bulk", "/scopus-accounts/bulk", 4, content=bulk_accounts,
+             headers={"Content-Type": "application/x-ndjson"}),
+        Case("PUT", "/deps/{dep_id}", f"/deps/{new_dep_id}", 2, json={"dep_name": "Presupuesto actualizado"}),
+        Case("PUT", "/authors/{author_id}", f"/authors/{new_author_id}", 3, json={"position": "Profesor Titular"}),
+        Case("PUT", "/scopus-accounts/{scopus_id}", f"/scopus-accounts/{new_account_id}", 2,
+             json={"affiliation": "Presupuesto actualizado"}),
+        Case("DELETE", "/scopus-accounts/{scopus_id}", f"/scopus-accounts/{new_account_id}", 9),
+        Case("DELETE", "/authors/{author_id}", f"/authors/{new_author_id}", 7),
+        Case("DELETE", "/deps/{dep_id}", f"/deps/{new_dep_id}", 2),
+    ]
+
+
+def guarded_routes() -> Set[Tuple[str, str]]:
+    """ Método y ruta de cada endpoint de los controladores controlados. """
+    from src.infrastructure.api.controllers import author_controller, department_controller, scopus_account_controller
+    return {
+        (method, route.path)
+        for controller in (author_controller, department_controller, scopus_account_controller)
+        for route in controller.router.routes
+        for method in route.methods
+    }
+
+
+@contextmanager
+def capture_statements(engines) -> Iterator[List[str]]:
+    """ Lista de las sentencias SQL que ejecutan los motores indicados mientras el bloque está activo. """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split())[:MAX_STATEMENT_LENGTH])
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", record)
+
+
+@dataclass
+class Measurement:
+    queries: int
+    status: int
+    statements: List[str]
+    body: str
+
+
+async def measure(client: httpx.AsyncClient, engines, dataset: UniversityDataset) -> Dict[str, Measurement]:
+    """ Ejecuta cada caso una vez y registra sus sentencias. """
+    measurements = {}
+    for case in cases(dataset):
+        with capture_statements(engines) as statements:
+            response = await client.request(case.method, case.url, json=case.json, content=case.content,
+                                            headers=case.headers)
+        measurements[case.name] = Measurement(len(statements), response.status_code, list(statements),
+                                              response.text[:300])
+    return measurements
+
+
+def dataset_for(authors: int, seed: int) -> UniversityDataset:
+    """ Conjunto de datos con ``authors`` autores; departamentos y cuentas crecen en proporción. """
+    return UniversityDataset(max(2, authors // 100), authors, int(authors * 1.3), seed)
+
+
+def default_database_url() -> str:
+    return f"sqlite:///{os.path.join(tempfile.gettempdir(), 'query_budget.db')}"
+
+
+async def run_cases(database_url: str,
+                    datasets: List[UniversityDataset]) -> Tuple[Dict[UniversityDataset, Dict[str, Measurement]], set]:
+    """ Carga cada conjunto de datos, mide todos los casos sobre él y devuelve además las rutas controladas. """
+    # La configuración se lee al importar la aplicación
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["CACHE_BACKEND"] = "none"
+    os.environ.setdefault("DB_ECHO", "false")
+    os.environ.setdefault("REPORT_WORKERS", "0")
+    os.environ.setdefault("SLOW_REQUEST_MS", "60000")
+    import main
+    from src.infrastructure import db
+
+    engine, async_engine = db.get_engine(), db.get_async_engine()
+    engines = [engine] + ([async_engine.sync_engine] if async_engine is not None else [])
+    runs = {}
+    for dataset in datasets:
+        print(f"Generando {dataset} en {engine.dialect.name}...")
+        seed_university(engine, dataset)
+        engine.dispose()
+        async with main.app.router.lifespan_context(main.app):
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://query-budget", timeout=120) as client:
+                runs[dataset] = await measure(client, engines, dataset)
+    return runs, guarded_routes()
+
+
+def format_statements(statements: List[str]) -> str:
+    return "\n".join(f"    {index}. {statement}" for index, statement in enumerate(statements, start=1))
+
+
+def check(runs: Dict[UniversityDataset, Dict[str, Measurement]], routes: set) -> Tuple[Dict[str, dict], List[str]]:
+    """ Tabla de consultas por caso y tamaño, y la descripción de cada incumplimiento. """
+    datasets = list(runs)
+    cases_by_dataset = {dataset: {case.name: case for case in cases(dataset)} for dataset in datasets}
+    table, failures = {}, []
+    for name, first_case in cases_by_dataset[datasets[0]].items():
+        problems, fixed_counts = [], set()
+        for dataset in datasets:
+            case, measurement = cases_by_dataset[dataset][name], runs[dataset][name]
+            if measurement.status != case.status:
+                problems.append(f"n={dataset.authors}: estado {measurement.status} (se esperaba {case.status}): "
+                                f"{measurement.body}")
+            if measurement.queries > case.allowed:
+                problems.append(f"n={dataset.authors}: {measurement.queries} consultas, presupuesto {case.allowed}")
+            fixed_counts.add(measurement.queries - case.stream_batches)
+        if len(fixed_counts) > 1:
+            problems.append("el número de consultas crece con los datos")
+        if problems:
+            worst = max(datasets, key=lambda dataset: runs[dataset][name].queries)
+            failures.append(f"{name}: " + "; ".join(problems) + f"\n  Sentencias con n={worst.authors}:\n"
+                            + format_statements(runs[worst][name].statements))
+        budget = f"{first_case.budget}+lotes" if first_case.stream_batches else first_case.budget
+        table[name] = {**{f"n={dataset.authors}": runs[dataset][name].queries for dataset in datasets},
+                       "presupuesto": budget, "estado": "FALLA" if problems else "ok"}
+    covered = {(case.method, case.route) for case in cases_by_dataset[datasets[0]].values()}
+    for method, path in sorted(routes - covered):
+        failures.append(f"{method} {path}: ruta sin caso ni presupuesto")
+    return table, failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="50,500,5000", help="Números de autores separados por comas")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--output", default=None, help="Archivo JSON de resultados")
+    args = parser.parse_args()
+    sizes = sorted({int(size) for size in args.sizes.split(",") if size.strip()})
+    datasets = [dataset_for(size, args.seed) for size in sizes]
+
+    runs, routes = asyncio.run(run_cases(args.database_url or default_database_url(), datasets))
+    table, failures = check(runs, routes)
+    print_table(table, [f"n={size}" for size in sizes] + ["presupuesto", "estado"])
+    if args.output:
+        save_results(args.output, "query_budget", {"sizes": sizes, "seed": args.seed}, table)
+        print(f"Resultados guardados en {args.output}")
+    if failures:
+        print(f"\n{len(failures)} incumplimiento(s) del presupuesto de consultas:\n")
+        print("\n\n".join(failures))
+        sys.exit(1)
+    print(f"\nPresupuestos de consultas respetados en {len(table)} caso(s) y {len(routes)} ruta(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Benchmark de memoria de la generación de reportes.
+
+Uso: ``python -m benchmarks.report_benchmark --sizes 2000,10000,50000 --database-url postgresql://...``
+Sin ``--database-url`` se usa un archivo SQLite temporal. Cada tamaño es un departamento con ese número
+de publicaciones (unas 20 por autor). Se mide el pico de memoria de Python (tracemalloc) al generar
+cada formato y, como referencia, al cargar todas las filas en una lista: el primero debe mantenerse
+plano al crecer el reporte y el segundo crece con él.
+"""
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import generate_author_rows, generate_dni
+from src.domain.entities.report import Report
+from src.infrastructure.models import (  # noqa: F401 (registro de modelos)
+    department, author, scopus_account, publication, publication_stats, report, sync_watermark, table_version
+)
+from src.infrastructure.models.author import AuthorModel
+from src.infrastructure.models.base import Base, DocumentTypeEnum, SourceTypeEnum
+from src.infrastructure.models.department import DepartmentModel
+from src.infrastructure.models.publication import AuthorshipModel, PublicationModel
+from src.infrastructure.models.scopus_account import ScopusAccountModel
+from src.infrastructure.reports.generator import generate_report
+from src.infrastructure.reports.source import iter_report_rows
+
+PUBLICATIONS_PER_AUTHOR = 20
+INSERT_BATCH_SIZE = 5000
+FORMATS = ("csv", "xlsx", "pdf")
+
+
+def _publication_rows(first_number: int, count: int, rng: random.Random):
+    document_types = list(DocumentTypeEnum)
+    for number in range(first_number, first_number + count):
+        published = date(2000, 1, 1) + timedelta(days=rng.randrange(9000))
+        yield {
+            "eid": f"2-s2.0-{number}",
+            "doi": f"10.1000/{number}",
+            "title": f"Documento {number}: " + " ".join(rng.choice(["análisis", "modelo", "redes", "datos", "óptimo",
+                                                                   "sistemas", "evaluación", "método"])
+                                                        for _ in range(rng.randrange(6, 20))),
+            "publication_date": published,
+            "year": published.year,
+            "source_title": f"Revista {rng.randrange(500)}",
+            "document_type": rng.choice(document_types),
+            "source_type": SourceTypeEnum.SCOPUS,
+            "cited_by": rng.randrange(100),
+            "content_hash": f"{number:064d}",
+        }
+
+
+def _seed(engine, sizes) -> None:
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    rng = random.Random(7)
+    next_author = 0
+    next_publication = 1
+    with engine.begin() as connection:
+        for dep_id, size in enumerate(sizes, start=1):
+            connection.execute(insert(DepartmentModel), {
+                "dep_id": dep_id, "dep_code": f"D{dep_id:03d}", "dep_name": f"Departamento {dep_id}",
+                "fac_name": "Facultad",
+            })
+            authors = max(size // PUBLICATIONS_PER_AUTHOR, 1)
+            rows = [dict(row, dni=generate_dni(next_author + i)) for i, row in
+                    enumerate(generate_author_rows(authors, [dep_id], seed=dep_id))]
+            next_author += authors
+            connection.execute(insert(AuthorModel), rows)
+            author_ids = connection.execute(
+                select(AuthorModel.author_id).where(AuthorModel.department_id == dep_id)
+            ).scalars().all()
+            connection.execute(insert(ScopusAccountModel), [
+                {"username": str(57_000_000_000 + author_id), "affiliation": "EPN", "author_id": author_id}
+                for author_id in author_ids
+            ])
+            scopus_ids = connection.execute(
+                select(ScopusAccountModel.scopus_id).where(ScopusAccountModel.author_id.in_(author_ids))
+            ).scalars().all()
+
+            publications = _publication_rows(next_publication, size, rng)
+            while batch := list(itertools.islice(publications, INSERT_BATCH_SIZE)):
+                connection.execute(insert(PublicationModel), batch)
+            pub_ids = range(next_publication, next_publication + size)
+            next_publication += size
+            # Cada publicación tiene un autor del departamento y una de cada diez, dos
+            authorships = [{"pub_id": pub_id, "scopus_id": rng.choice(scopus_ids)} for pub_id in pub_ids]
+            authorships += [{"pub_id": pub_id, "scopus_id": rng.choice(scopus_ids)} for pub_id in pub_ids[::10]]
+            authorships = list({(row["pub_id"], row["scopus_id"]): row for row in authorships}.values())
+            for start in range(0, len(authorships), INSERT_BATCH_SIZE):
+                connection.execute(insert(AuthorshipModel), authorships[start:start + INSERT_BATCH_SIZE])
+
+
+def _measure(call):
+    """Pico de memoria de Python (MiB) y tiempo (s) de la llamada."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 2 ** 20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="2000,10000,50000", help="Publicaciones por departamento")
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'report_benchmark.db')}"
+    engine = create_engine(url)
+    print(f"Generando {sum(sizes)} publicaciones en {engine.dialect.name}...")
+    _seed(engine, sizes)
+    session_factory = sessionmaker(bind=engine)
+    os.environ.setdefault("REPORTS_DIR", tempfile.mkdtemp(prefix="report_benchmark_"))
+
+    print(f"{'publicaciones':>13} {'formato':>12} {'pico MiB':>9} {'tiempo s':>9} {'archivo MiB':>12}")
+    for dep_id, size in enumerate(sizes, start=1):
+        for file_format in FORMATS:
+            report = Report(report_id=dep_id, dep_id=dep_id, report_type="draft", file_format=file_format)
+            with session_factory() as session:
+                path, peak, elapsed = _measure(lambda: generate_report(session, report, lambda *_: True))
+            file_mib = os.path.getsize(path) / 2 ** 20
+            os.remove(path)
+            print(f"{size:>13} {file_format:>12} {peak:>9.2f} {elapsed:>9.2f} {file_mib:>12.2f}")
+        # Referencia: las mismas filas cargadas en memoria antes de escribir
+        with session_factory() as session:
+            report = Report(report_id=dep_id, dep_id=dep_id, report_type="draft")
+            rows, peak, elapsed = _measure(lambda: list(iter_report_rows(session, report)))
+        print(f"{size:>13} {'filas en lista':>12} {peak:>9.2f} {elapsed:>9.2f} {'-':>12}")
+
+
+if __name__ == "__main__":
+    main()
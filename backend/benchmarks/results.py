@@ -0,0 +1,75 @@
+"""
+Resultados de benchmarks en JSON, para comparar ejecuciones con ``python -m benchmarks.compare``.
+
+Cada archivo guarda el nombre del benchmark, sus parámetros, el entorno (commit, Python, motor de BD) y
+una entrada por operación o endpoint con sus percentiles en milisegundos.
+"""
+import json
+import math
+import os
+import platform
+import subprocess
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+
+def percentile(sorted_samples: Sequence[float], fraction: float) -> float:
+    """ Percentil por rango más cercano de una lista ya ordenada. """
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """ Percentiles p50/p95/p99, media y máximo (ms) de una serie de tiempos. """
+    ordered = sorted(samples_ms)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "mean_ms": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def save_results(path: str, benchmark: str, parameters: dict, results: Dict[str, dict],
+                 database: Optional[str] = None) -> None:
+    """ Escribe los resultados con los datos del entorno en ``path``. """
+    document = {
+        "benchmark": benchmark,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "database": database,
+        "parameters": parameters,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def print_table(results: Dict[str, dict], columns: Sequence[str]) -> None:
+    """ Imprime una fila por operación con las columnas indicadas. """
+    width = max([len(name) for name in results] + [9])
+    widths = [max([12, len(column) + 2] + [len(str(values.get(column, ""))) + 2 for values in results.values()])
+              for column in columns]
+    print(f"{'operación':<{width}}" + "".join(f"{column:>{size}}" for column, size in zip(columns, widths)))
+    for name, values in results.items():
+        print(f"{name:<{width}}" + "".join(f"{values.get(column, ''):>{size}}" for column, size in zip(columns, widths)))
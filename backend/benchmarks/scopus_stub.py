@@ -0,0 +1,108 @@
+"""
+Servidor local que imita la API de búsqueda de Scopus, para ejecutar la sincronización sin red.
+
+Uso: ``python -m benchmarks.scopus_stub --port 8099 --latency-ms 150`` y luego
+``SCOPUS_API_URL=http://127.0.0.1:8099``. Los documentos son deterministas por autor y una parte se
+comparte entre autores para simular coautorías. Una fracción (``--new-ratio``) figura como cargada hoy,
+de modo que las consultas con ``LOAD-DATE AFT`` devuelven solo esos documentos.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+DOCUMENT_TYPES = ["Article", "Conference Paper", "Review", "Book Chapter", "Editorial", "Letter"]
+SHARED_POOL = 5000
+_AUTHOR_ID = re.compile(r"AU-ID\((\d+)\)")
+_LOADED_AFTER = re.compile(r"LOAD-DATE AFT (\d{8})")
+
+
+def author_documents(author_id: str, new_ratio: float = 0.0) -> List[dict]:
+    """ Documentos del autor: entre 5 y 80, con EIDs propios y compartidos, y su fecha de carga. """
+    rng = random.Random(author_id)
+    today = date.today().strftime("%Y%m%d")
+    documents = []
+    for i in range(rng.randint(5, 80)):
+        shared = rng.random() < 0.3
+        number = rng.randrange(SHARED_POOL) if shared else int(author_id) * 1000 + i
+        # Los datos dependen solo del número, para que un documento compartido sea igual para todos sus autores
+        year = 2000 + number % 26
+        documents.append({
+            "eid": f"2-s2.0-{number}",
+            "dc:title": f"Documento {number}",
+            "prism:publicationName": f"Revista {number % 97}",
+            "prism:coverDate": f"{year}-{number % 12 + 1:02d}-01",
+            "prism:doi": f"10.1000/{number}",
+            "subtypeDescription": DOCUMENT_TYPES[number % len(DOCUMENT_TYPES)],
+            "citedby-count": str(number % 50),
+            "load-date": today if rng.random() < new_ratio else f"{year}0101",
+        })
+    return documents
+
+
+def make_handler(latency_seconds: float, throttle_ratio: float, new_ratio: float):
+    class ScopusStubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = parse_qs(url.query)
+            query = params.get("query", [""])[0]
+            match = _AUTHOR_ID.search(query)
+            if url.path != "/content/search/scopus" or not match:
+                self._send(400, {"service-error": {"status": {"statusText": "Consulta inválida"}}})
+                return
+            time.sleep(latency_seconds)
+            if random.random() < throttle_ratio:
+                self._send(429, {"error-response": {"error-message": "Too many requests"}}, {"Retry-After": "0.2"})
+                return
+            start = int(params.get("start", ["0"])[0])
+            count = int(params.get("count", ["25"])[0])
+            documents = author_documents(match.group(1), new_ratio)
+            loaded_after = _LOADED_AFTER.search(query)
+            if loaded_after:
+                documents = [document for document in documents if document["load-date"] > loaded_after.group(1)]
+            page = documents[start:start + count] or [{"error": "Result set was empty"}]
+            self._send(200, {"search-results": {"opensearch:totalResults": str(len(documents)), "entry": page}})
+
+        def _send(self, status: int, body: dict, headers: dict = None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return ScopusStubHandler
+
+
+def start_stub_server(port: int = 0, latency_ms: float = 100, throttle_ratio: float = 0.0,
+                      new_ratio: float = 0.03) -> ThreadingHTTPServer:
+    """ Inicia el servidor en un hilo y lo devuelve (``server.server_address`` tiene el puerto). """
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(latency_ms / 1000, throttle_ratio, new_ratio))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--latency-ms", type=float, default=100)
+    parser.add_argument("--throttle-ratio", type=float, default=0.0, help="Fracción de respuestas 429")
+    parser.add_argument("--new-ratio", type=float, default=0.03, help="Fracción de documentos cargados hoy")
+    args = parser.parse_args()
+    stub = ThreadingHTTPServer(
+        ("127.0.0.1", args.port), make_handler(args.latency_ms / 1000, args.throttle_ratio, args.new_ratio)
+    )
+    print(f"Stub de Scopus en http://127.0.0.1:{args.port}")
+    stub.serve_forever()
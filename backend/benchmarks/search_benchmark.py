@@ -0,0 +1,68 @@
+"""
+Benchmark de la búsqueda de autores por nombre.
+
+Uso: ``python -m benchmarks.search_benchmark --authors 100000 --database-url postgresql://...``
+Sin ``--database-url`` se usa un archivo SQLite temporal (ruta de respaldo, sin índice trigram).
+"""
+import argparse
+import itertools
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.datagen import generate_author_rows, recreate_schema
+from src.infrastructure.models.author import AuthorModel
+from src.infrastructure.models.department import DepartmentModel
+from src.infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+
+SEARCH_TERMS = ["perez", "maria gomez", "ZUÑIGA", "sofia ordonez", "nunez", "andres", "villacis jose", "xyz"]
+INSERT_BATCH_SIZE = 5000
+
+
+def _seed(engine, authors: int) -> None:
+    recreate_schema(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(DepartmentModel), [
+            {"dep_code": f"D{i:03d}", "dep_name": f"Departamento {i}", "fac_name": "Facultad"} for i in range(1, 51)
+        ])
+        rows = generate_author_rows(authors, list(range(1, 51)))
+        while batch := list(itertools.islice(rows, INSERT_BATCH_SIZE)):
+            connection.execute(insert(AuthorModel), batch)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--authors", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    url = args.database_url or f"sqlite:///{os.path.join(tempfile.gettempdir(), 'search_benchmark.db')}"
+    engine = create_engine(url)
+    print(f"Generando {args.authors} autores en {engine.dialect.name}...")
+    _seed(engine, args.authors)
+
+    session = sessionmaker(bind=engine)()
+    repository = AuthorRepoImpl(session)
+    print(f"{'término':<16}{'resultados':>12}{'p50 ms':>10}{'p95 ms':>10}")
+    for term in SEARCH_TERMS:
+        timings = []
+        results = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = repository.search_by_name(term, args.limit)
+            timings.append((time.perf_counter() - start) * 1000)
+            session.expunge_all()
+        timings.sort()
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        print(f"{term:<16}{len(results):>12}{statistics.median(timings):>10.2f}{p95:>10.2f}")
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,20 +2,35 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.infrastructure.db import engine
-from src.infrastructure.models.base import Base
-from src.infrastructure.api.controllers import department_controller, author_controller, scopus_account_controller
+from src.infrastructure.cache.repository_cache import cache_metrics
+from src.infrastructure.db import get_async_engine, get_engine, get_session_factory
+from src.infrastructure.migrations import check_schema_revision
+from src.infrastructure.pool_metrics import pool_metrics
+from src.infrastructure.reports.cache import report_file_cache
+from src.infrastructure.reports.worker import report_workers
+from src.infrastructure.search.name_index import name_index_enabled, name_index_refresher
+from src.infrastructure.api.request_metrics import RequestMetricsMiddleware
+from src.infrastructure.api.controllers import (
+    department_controller, author_controller, scopus_account_controller, publication_controller, report_controller
+)
 # Importar todos los modelos para que se registren
-from src.infrastructure.models import department, author, scopus_account
+from src.infrastructure.models import (
+    department, author, scopus_account, publication, publication_stats, report, sync_watermark, table_version
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup
-    Base.metadata.create_all(bind=engine)
+    # Startup: el esquema se crea y actualiza con ``python -m src.infrastructure.migrations upgrade``
+    check_schema_revision(get_engine())
+    session_factory = get_session_factory()
+    if name_index_enabled():
+        name_index_refresher.start(session_factory)
+    report_workers.start(session_factory)
     yield
     # Shutdown
-    pass
+    report_workers.stop()
+    name_index_refresher.stop()
 
 
 app = FastAPI(
@@ -34,13 +49,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Cabecera Server-Timing y registro de peticiones lentas con sus consultas SQL
+app.add_middleware(RequestMetricsMiddleware)
+
 # Agregar routers
 app.include_router(department_controller.router)
 app.include_router(author_controller.router)
 app.include_router(scopus_account_controller.router)
+app.include_router(publication_controller.router)
+app.include_router(report_controller.router)
 
 
 @app.get("/health")
 async def health_check():
     """Endpoint de salud."""
     return {"status": "healthy", "message": "API funcionando correctamente"}
+
+
+@app.get("/health/db-pool")
+async def db_pool_status():
+    """Métricas de los pools de conexiones (checkouts, espera y ocupación)."""
+    return {"sync": pool_metrics(get_engine()), "async": pool_metrics(get_async_engine())}
+
+
+@app.get("/health/cache")
+async def cache_status():
+    """Aciertos, fallos e invalidaciones de la caché de repositorios y de la caché de reportes."""
+    return {**cache_metrics(), "report_files": report_file_cache.stats()}
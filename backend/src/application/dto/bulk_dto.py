@@ -0,0 +1,28 @@
+""" DTOS para operaciones masivas. """
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, ValidationError
+
+# Clave con la que el lector de la carga marca una fila mal formada; su valor es el motivo del rechazo
+ROW_ERROR_KEY = "__row_error__"
+
+
+class BulkRowErrorDTO(BaseModel):
+    """ DTO para el error de una fila rechazada en una operación masiva. """
+    row: int = Field(..., description="Número de fila (desde 1)")
+    key: Optional[str] = Field(None, description="Identificador de la fila (DNI o username)")
+    error: str = Field(..., description="Motivo del rechazo")
+
+    @classmethod
+    def from_validation_error(cls, row: int, key: Optional[str], error: ValidationError) -> "BulkRowErrorDTO":
+        """ Resume los errores de validación de pydantic en una sola línea. """
+        message = "; ".join(f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors())
+        return cls(row=row, key=key, error=message)
+
+
+class BulkResultDTO(BaseModel):
+    """ DTO para el resultado de una operación masiva. """
+    total: int
+    created: int
+    failed: int
+    errors: List[BulkRowErrorDTO] = []
@@ -27,3 +27,16 @@ class DepartmentResponseDTO(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class PublicationStatDTO(BaseModel):
+    """ DTO para el número de publicaciones de un departamento por año, tipo de documento y fuente. """
+    year: int
+    document_type: str
+    source_type: str
+    publications: int
+
+
+class AuthorPublicationStatDTO(PublicationStatDTO):
+    """ DTO para el número de publicaciones de un autor del departamento. """
+    author_id: int
@@ -0,0 +1,15 @@
+""" DTOS para paginación por cursor. """
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+T = TypeVar("T")
+
+
+class PageDTO(BaseModel, Generic[T]):
+    """ DTO para una página de resultados paginada por cursor (keyset). """
+    items: List[T]
+    next_cursor: Optional[int] = Field(None, description="Cursor para solicitar la siguiente página")
@@ -0,0 +1,39 @@
+""" DTOS para Reporte. """
+from datetime import datetime
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class ReportCreateDTO(BaseModel):
+    """ DTO para solicitar un reporte. """
+    dep_id: int = Field(..., description="ID del departamento")
+    report_type: Literal["draft", "final"] = Field("draft", description="Borrador o versión final")
+    file_format: Literal["xlsx", "pdf", "csv"] = Field("xlsx", description="Formato del archivo")
+    year_from: Optional[int] = Field(None, description="Primer año incluido")
+    year_to: Optional[int] = Field(None, description="Último año incluido")
+
+    @model_validator(mode="after")
+    def check_years(self):
+        if self.year_from is not None and self.year_to is not None and self.year_from > self.year_to:
+            raise ValueError("El año inicial no puede ser mayor que el año final.")
+        return self
+
+
+class ReportResponseDTO(BaseModel):
+    """ DTO para el estado de un reporte. """
+    report_id: int
+    dep_id: int
+    report_type: str
+    file_format: str
+    status: str
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    progress: int = Field(..., description="Porcentaje de avance")
+    processed: int = Field(..., description="Autores procesados")
+    total: int = Field(..., description="Autores del departamento")
+    cancel_requested: bool
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,38 @@
+""" DTOS para la sincronización de publicaciones desde Scopus. """
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SyncAccountErrorDTO(BaseModel):
+    """ DTO para una cuenta Scopus que no se pudo sincronizar. """
+    scopus_id: int
+    username: str
+    error: str
+
+
+class SyncResultDTO(BaseModel):
+    """ DTO para el resultado de una sincronización. """
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    accounts_total: int = 0
+    accounts_synced: int = 0
+    accounts_failed: int = 0
+    accounts_full: int = Field(0, description="Cuentas descargadas por completo")
+    accounts_delta: int = Field(0, description="Cuentas descargadas desde su marca de sincronización")
+    accounts_unchanged: int = Field(0, description="Cuentas cuyo resultado no cambió y no se escribieron")
+    publications_written: int = Field(0, description="Publicaciones insertadas o actualizadas")
+    publications_unchanged: int = Field(0, description="Publicaciones recibidas sin cambios, no escritas")
+    api_calls: int = 0
+    retries: int = 0
+    api_calls_saved: int = Field(0, description="Llamadas estimadas que habría requerido una descarga completa")
+    estimated_seconds_saved: float = 0.0
+    elapsed_seconds: float = 0.0
+    errors: List[SyncAccountErrorDTO] = []
+
+
+class SyncStatusDTO(BaseModel):
+    """ DTO para el estado de la sincronización en segundo plano. """
+    running: bool
+    last_result: Optional[SyncResultDTO] = None
@@ -1,19 +1,62 @@
 """ Servicio para la gestión de autores. """
-from typing import List
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
 
 from ..dto.author_dto import AuthorCreateDTO, AuthorUpdateDTO, AuthorResponseDTO, ScopusAccountResponseDTO
+from ..dto.bulk_dto import ROW_ERROR_KEY, BulkResultDTO, BulkRowErrorDTO
+from ..dto.pagination_dto import PageDTO
 from ...domain.entities.author import Author
+from ...domain.entities.scopus_account import ScopusAccount
+from ...domain.exceptions.domain_exceptions import DomainException
+from ...domain.repositories.author_name_index import IAuthorNameIndex
+from ...domain.repositories.author_query_repository import IAuthorQueryRepository
 from ...domain.repositories.author_repository import IAuthorRepository
+from ...domain.repositories.department_repository import IDepartmentRepository
 from ...domain.repositories.scopus_account_repository import IScopusAccountRepository
-from ...domain.value_objects.author import DNI
+from ...domain.repositories.table_version_repository import ITableVersionRepository
+from ...domain.value_objects.author import DNI, validate_dnis
+
+
+def _build_author(dto: AuthorCreateDTO, dni: Optional[DNI] = None) -> Author:
+    """
+    Construye la entidad Author (aplicando las reglas de dominio) a partir del DTO de creación.
+    Recibe el DNI ya construido cuando se validó antes en bloque.
+    """
+    return Author(
+        author_id=None,
+        dni=dni or DNI(dto.dni),
+        title=dto.title,
+        name=dto.first_name,
+        surname=dto.last_name,
+        birth_date=dto.birth_date,
+        gender=dto.gender,
+        position=dto.position,
+        department_id=dto.department_id
+    )
 
 
 class AuthorService:
     """ Servicio para la gestión de autores. """
 
-    def __init__(self, author_repository: IAuthorRepository, scopus_repository: IScopusAccountRepository):
+    def __init__(self, author_repository: IAuthorRepository, scopus_repository: IScopusAccountRepository,
+                 name_index: Optional[IAuthorNameIndex] = None,
+                 department_repository: Optional[IDepartmentRepository] = None,
+                 version_repository: Optional[ITableVersionRepository] = None,
+                 query_repository: Optional[IAuthorQueryRepository] = None):
         self.author_repository = author_repository
         self.scopus_repository = scopus_repository
+        self.name_index = name_index
+        self.department_repository = department_repository
+        self.version_repository = version_repository
+        self.query_repository = query_repository
+
+    def get_data_version(self) -> Optional[str]:
+        """Versión de los datos de autores (incluye sus cuentas Scopus, que forman parte de la respuesta)."""
+        if self.version_repository is None:
+            return None
+        return self.version_repository.version_tag(["authors", "scopus_accounts"])
 
     def create_author(self, dto: AuthorCreateDTO) -> AuthorResponseDTO:
         """Crea un nuevo autor."""
@@ -22,25 +65,97 @@ class AuthorService:
         if existing_author:
             raise ValueError(f"Ya existe un autor con DNI {dto.dni}")
 
-        author = Author(
-            author_id=None,
-            dni=DNI(dto.dni),
-            title=dto.title,
-            name=dto.first_name,
-            surname=dto.last_name,
-            birth_date=dto.birth_date,
-            gender=dto.gender,
-            position=dto.position,
-            department_id=dto.department_id
-        )
+        author = _build_author(dto)
         
         created_author = self.author_repository.create(author)
         return self._to_response_dto(created_author)
 
+    def bulk_create_authors(self, rows: List[dict]) -> BulkResultDTO:
+        """Crea autores de forma masiva: valida todas las filas, verifica DNIs en bloque e inserta las válidas."""
+        errors: List[BulkRowErrorDTO] = []
+        candidates: List[Tuple[int, Author]] = []
+        seen_dnis = set()
+
+        # Validación de formato de todas las filas y de sus DNIs en bloque
+        dtos: List[Tuple[int, Optional[str], AuthorCreateDTO]] = []
+        for row_number, row in enumerate(rows, start=1):
+            key = str(row.get("dni")) if row.get("dni") is not None else None
+            if ROW_ERROR_KEY in row:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error=str(row[ROW_ERROR_KEY])))
+                continue
+            try:
+                dtos.append((row_number, key, AuthorCreateDTO.model_validate(row)))
+            except ValidationError as e:
+                errors.append(BulkRowErrorDTO.from_validation_error(row_number, key, e))
+        valid_dnis = validate_dnis([dto.dni for _, _, dto in dtos])
+
+        # Reglas de dominio; los DNIs inválidos se construyen con validación para obtener su error
+        for (row_number, key, dto), dni_is_valid in zip(dtos, valid_dnis):
+            try:
+                author = _build_author(dto, DNI.trusted(dto.dni) if dni_is_valid else None)
+            except (ValueError, DomainException) as e:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error=str(e)))
+                continue
+            if author.dni.value in seen_dnis:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error="DNI duplicado dentro de la carga"))
+                continue
+            seen_dnis.add(author.dni.value)
+            candidates.append((row_number, author))
+
+        # Verificaciones contra la BD con consultas por conjunto
+        existing_dnis = self.author_repository.get_existing_dnis([author.dni.value for _, author in candidates])
+        existing_departments = None
+        if self.department_repository is not None:
+            existing_departments = self.department_repository.get_existing_ids(
+                [author.department_id for _, author in candidates]
+            )
+
+        valid_authors = []
+        for row_number, author in candidates:
+            if author.dni.value in existing_dnis:
+                errors.append(BulkRowErrorDTO(
+                    row=row_number, key=author.dni.value, error=f"Ya existe un autor con DNI {author.dni.value}"
+                ))
+            elif existing_departments is not None and author.department_id not in existing_departments:
+                errors.append(BulkRowErrorDTO(
+                    row=row_number, key=author.dni.value, error=f"El departamento {author.department_id} no existe"
+                ))
+            else:
+                valid_authors.append(author)
+
+        self.author_repository.bulk_create(valid_authors)
+        errors.sort(key=lambda error: error.row)
+        return BulkResultDTO(total=len(rows), created=len(valid_authors), failed=len(errors), errors=errors)
+
     def get_authors(self) -> List[AuthorResponseDTO]:
         """Obtiene todos los autores."""
         authors = self.author_repository.get_all()
-        return [self._to_response_dto(author) for author in authors]
+        return self._to_response_dtos(authors)
+
+    def get_authors_page(self, cursor: Optional[int], limit: int) -> PageDTO[AuthorResponseDTO]:
+        """Obtiene una página de autores posterior al cursor indicado."""
+        authors = self.author_repository.get_page(cursor, limit + 1)
+        next_cursor = authors[limit - 1].author_id if len(authors) > limit else None
+        return PageDTO[AuthorResponseDTO](items=self._to_response_dtos(authors[:limit]), next_cursor=next_cursor)
+
+    def get_author_rows(self) -> List[Dict[str, Any]]:
+        """Obtiene todos los autores como filas con los campos de AuthorResponseDTO, listas para serializar."""
+        return self._author_rows()
+
+    def get_author_rows_page(self, cursor: Optional[int], limit: int) -> Dict[str, Any]:
+        """Obtiene una página de autores como filas, con los campos de PageDTO."""
+        rows = self._author_rows(after_id=cursor, limit=limit + 1)
+        next_cursor = rows[limit - 1]["author_id"] if len(rows) > limit else None
+        return {"items": rows[:limit], "next_cursor": next_cursor}
+
+    def get_department_author_rows(self, department_id: int) -> List[Dict[str, Any]]:
+        """Obtiene los autores de un departamento como filas."""
+        return self._author_rows(department_id=department_id)
+
+    def stream_authors(self, batch_size: int) -> Iterator[AuthorResponseDTO]:
+        """Genera todos los autores por lotes, con memoria constante."""
+        for authors in self.author_repository.iter_batches(batch_size):
+            yield from self._to_response_dtos(authors)
 
     def get_author_by_id(self, author_id: int) -> AuthorResponseDTO:
         """Obtiene un autor por su ID."""
@@ -52,67 +167,57 @@ class AuthorService:
     def get_authors_by_department(self, department_id: int) -> List[AuthorResponseDTO]:
         """Obtiene autores por ID de departamento."""
         authors = self.author_repository.get_by_department_id(department_id)
-        return [self._to_response_dto(author) for author in authors]
+        return self._to_response_dtos(authors)
 
     def update_author(self, author_id: int, dto: AuthorUpdateDTO) -> AuthorResponseDTO:
-        """Actualiza un autor existente."""
-        author = self.author_repository.get_by_id(author_id)
-        if not author:
-            raise ValueError("Autor no encontrado")
-
-        # Verificar DNI único si se está actualizando
-        if dto.dni and dto.dni != author.dni.value:
-            existing_author = self.author_repository.get_by_dni(dto.dni)
-            if existing_author and existing_author.author_id != author_id:
-                raise ValueError(f"Ya existe un autor con DNI {dto.dni}")
-
+        """Actualiza un autor existente con una sola sentencia; la unicidad del DNI la garantiza la BD."""
         # Actualizar campos si se proporcionan
+        fields = {}
         if dto.dni:
-            author.dni = DNI(dto.dni)
+            fields["dni"] = DNI(dto.dni)
         if dto.title is not None:
-            author.title = dto.title
+            fields["title"] = dto.title
         if dto.first_name:
-            author.name = dto.first_name
+            fields["name"] = dto.first_name
         if dto.last_name:
-            author.surname = dto.last_name
+            fields["surname"] = dto.last_name
         if dto.birth_date:
-            author.birth_date = dto.birth_date
+            fields["birth_date"] = dto.birth_date
         if dto.gender:
-            author.gender = dto.gender
+            fields["gender"] = dto.gender
         if dto.position:
-            author.position = dto.position
+            fields["position"] = dto.position
         if dto.department_id:
-            author.department_id = dto.department_id
+            fields["department_id"] = dto.department_id
 
-        updated_author = self.author_repository.update(author)
+        updated_author = self.author_repository.update_fields(author_id, fields)
+        if not updated_author:
+            raise ValueError("Autor no encontrado")
         return self._to_response_dto(updated_author)
 
     def delete_author(self, author_id: int) -> None:
         """Elimina un autor."""
-        author = self.author_repository.get_by_id(author_id)
-        if not author:
-            raise ValueError("Autor no encontrado")
-        
         self.author_repository.delete(author_id)
 
-    def search_authors_by_name(self, search_term: str) -> List[AuthorResponseDTO]:
-        """Busca autores por nombre completo."""
+    def search_authors_by_name(self, search_term: str, limit: Optional[int] = None) -> List[AuthorResponseDTO]:
+        """Busca autores por nombre completo, ordenados por relevancia."""
         if not search_term or not search_term.strip():
             raise ValueError("El término de búsqueda no puede estar vacío")
         
-        authors = self.author_repository.search_by_name(search_term)
-        return [self._to_response_dto(author) for author in authors]
+        authors = self._search_by_name(search_term, limit)
+        return self._to_response_dtos(authors)
 
-    def get_scopus_account_ids_by_author_name(self, search_term: str) -> List[dict]:
+    def get_scopus_account_ids_by_author_name(self, search_term: str, limit: Optional[int] = None) -> List[dict]:
         """Obtiene los ID de cuentas Scopus por nombre de autor."""
         if not search_term or not search_term.strip():
             raise ValueError("El término de búsqueda no puede estar vacío")
         
-        authors = self.author_repository.search_by_name(search_term)
+        authors = self._search_by_name(search_term, limit)
+        accounts_by_author = self._load_scopus_accounts(authors)
         result = []
         
         for author in authors:
-            scopus_accounts = self.scopus_repository.get_by_author_id(author.author_id or 0)
+            scopus_accounts = accounts_by_author.get(author.author_id or 0, [])
             scopus_ids = [account.scopus_id for account in scopus_accounts if account.scopus_id]
             
             if scopus_ids:  # Solo incluir autores que tienen cuentas Scopus
@@ -125,10 +230,72 @@ class AuthorService:
         
         return result
 
+    def check_name_index(self) -> dict:
+        """Compara el índice de nombres con la base de datos y lo reconstruye si difiere."""
+        if self.name_index is None:
+            return {"enabled": False}
+        current = self._authors_version()
+        entries = self.author_repository.get_name_entries()
+        consistent = self.name_index.is_consistent_with(entries)
+        if not consistent and current is not None:
+            self.name_index.rebuild(entries, current)
+        return {"enabled": True, "consistent": consistent, "size": self.name_index.size()}
+
+    def _search_by_name(self, search_term: str, limit: Optional[int]) -> List[Author]:
+        """
+        Busca en el índice de nombres en memoria si está habilitado y al día con la tabla de autores, o en la
+        base de datos (mientras otro proceso o una escritura reciente dejan el índice atrás).
+        """
+        if self.name_index is None or self.name_index.version is None:
+            return self.author_repository.search_by_name(search_term, limit)
+        if self.name_index.version != self._authors_version():
+            return self.author_repository.search_by_name(search_term, limit)
+        return self.author_repository.get_by_ids(self.name_index.search(search_term, limit))
+
+    def _authors_version(self) -> Optional[int]:
+        """Versión actual de la tabla de autores; None sin repositorio de versiones."""
+        if self.version_repository is None:
+            return None
+        return self.version_repository.get_versions(["authors"])["authors"]
+
+    def _author_rows(self, department_id: Optional[int] = None, after_id: Optional[int] = None,
+                     limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Lee las filas con la proyección de solo lectura; sin ella, las deriva de las entidades."""
+        if self.query_repository is not None:
+            return self.query_repository.get_rows(department_id, after_id, limit)
+        if department_id is not None:
+            authors = self.author_repository.get_by_department_id(department_id)
+        elif limit is not None:
+            authors = self.author_repository.get_page(after_id, limit)
+        else:
+            authors = self.author_repository.get_all()
+        return [dto.model_dump() for dto in self._to_response_dtos(authors)]
+
+    def _load_scopus_accounts(self, authors: List[Author]) -> Dict[int, List[ScopusAccount]]:
+        """Carga en una sola consulta las cuentas Scopus de los autores, agrupadas por autor."""
+        author_ids = [author.author_id for author in authors if author.author_id]
+        accounts_by_author: Dict[int, List[ScopusAccount]] = defaultdict(list)
+        for account in self.scopus_repository.get_by_author_ids(author_ids):
+            accounts_by_author[account.author_id].append(account)
+        return accounts_by_author
+
+    def _to_response_dtos(self, authors: List[Author]) -> List[AuthorResponseDTO]:
+        """Convierte una lista de autores a DTOs de respuesta con un número constante de consultas."""
+        accounts_by_author = self._load_scopus_accounts(authors)
+        return [
+            self._build_response_dto(author, accounts_by_author.get(author.author_id or 0, []))
+            for author in authors
+        ]
+
     def _to_response_dto(self, author: Author) -> AuthorResponseDTO:
         """Convierte una entidad Author a DTO de respuesta."""
         # Obtener las cuentas Scopus del autor
         scopus_accounts = self.scopus_repository.get_by_author_id(author.author_id or 0)
+        return self._build_response_dto(author, scopus_accounts)
+
+    @staticmethod
+    def _build_response_dto(author: Author, scopus_accounts: List[ScopusAccount]) -> AuthorResponseDTO:
+        """Construye el DTO de respuesta a partir del autor y sus cuentas Scopus ya cargadas."""
         scopus_dtos = [
             ScopusAccountResponseDTO(
                 scopus_id=account.scopus_id,
@@ -149,4 +316,4 @@ class AuthorService:
             position=author.position,
             department_id=author.department_id,
             scopus_accounts=scopus_dtos
-        )
\ No newline at end of file
+        )
@@ -1,14 +1,47 @@
 """ Servicio para la gestión de departamentos. """
-from ...application.dto.department_dto import DepartmentCreateDTO, DepartmentResponseDTO, DepartmentUpdateDTO
+from typing import Iterator, Optional
+
+from ...application.dto.department_dto import (
+    AuthorPublicationStatDTO, DepartmentCreateDTO, DepartmentResponseDTO, DepartmentUpdateDTO, PublicationStatDTO
+)
+from ...application.dto.pagination_dto import PageDTO
 from ...domain.entities.department import Department
 from ...domain.repositories.department_repository import IDepartmentRepository
+from ...domain.repositories.publication_stats_repository import IPublicationStatsRepository
+from ...domain.repositories.table_version_repository import ITableVersionRepository
+
+
+def _to_response_dto(department: Department) -> DepartmentResponseDTO:
+    """Convierte una entidad Department a DTO de respuesta."""
+    return DepartmentResponseDTO(
+        dep_id=department.dep_id,
+        dep_code=department.dep_code,
+        dep_name=department.dep_name,
+        fac_name=department.fac_name
+    )
 
 
 class DepartmentService:
     """ Servicio para la gestión de departamentos. """
 
-    def __init__(self, repository: IDepartmentRepository):
+    def __init__(self, repository: IDepartmentRepository,
+                 version_repository: Optional[ITableVersionRepository] = None,
+                 stats_repository: Optional[IPublicationStatsRepository] = None):
         self.repository = repository
+        self.version_repository = version_repository
+        self.stats_repository = stats_repository
+
+    def get_data_version(self) -> Optional[str]:
+        """Versión de los datos de departamentos."""
+        if self.version_repository is None:
+            return None
+        return self.version_repository.version_tag(["departments"])
+
+    def get_stats_version(self) -> Optional[str]:
+        """Versión de los conteos de publicaciones."""
+        if self.version_repository is None:
+            return None
+        return self.version_repository.version_tag(["departments", "publication_stats"])
 
     def create_department(self, dto: DepartmentCreateDTO) -> DepartmentResponseDTO:
         department = Department(
@@ -36,6 +69,18 @@ class DepartmentService:
             ) for dep in departments
         ]
 
+    def get_departments_page(self, cursor: Optional[int], limit: int) -> PageDTO[DepartmentResponseDTO]:
+        departments = self.repository.get_page(cursor, limit + 1)
+        next_cursor = departments[limit - 1].dep_id if len(departments) > limit else None
+        return PageDTO[DepartmentResponseDTO](
+            items=[_to_response_dto(dep) for dep in departments[:limit]],
+            next_cursor=next_cursor
+        )
+
+    def stream_departments(self, batch_size: int) -> Iterator[DepartmentResponseDTO]:
+        for departments in self.repository.iter_batches(batch_size):
+            yield from (_to_response_dto(dep) for dep in departments)
+
     def get_department_by_id(self, dep_id: int) -> DepartmentResponseDTO:
         department = self.repository.get_by_id(dep_id)
         return DepartmentResponseDTO(
@@ -46,15 +91,14 @@ class DepartmentService:
         )
 
     def update_department(self, dep_id: int, dep_dto: DepartmentUpdateDTO) -> DepartmentResponseDTO:
-        department = self.repository.get_by_id(dep_id)
-        if not department:
-            raise ValueError("Departamento no encontrado.")
-
-        if dep_dto.dep_code: department.dep_code = dep_dto.dep_code
-        if dep_dto.dep_name: department.dep_name = dep_dto.dep_name
-        if dep_dto.fac_name: department.fac_name = dep_dto.fac_name
+        fields = {}
+        if dep_dto.dep_code: fields["dep_code"] = dep_dto.dep_code
+        if dep_dto.dep_name: fields["dep_name"] = dep_dto.dep_name
+        if dep_dto.fac_name: fields["fac_name"] = dep_dto.fac_name
 
-        updated = self.repository.update(department)
+        updated = self.repository.update_fields(dep_id, fields)
+        if not updated:
+            raise ValueError("Departamento no encontrado.")
         return DepartmentResponseDTO(
             dep_id=updated.dep_id,
             dep_code=updated.dep_code,
@@ -64,3 +108,28 @@ class DepartmentService:
 
     def delete_department(self, dep_id: int):
         return self.repository.delete(dep_id)
+
+    def get_department_stats(self, dep_id: int, year_from: Optional[int] = None,
+                             year_to: Optional[int] = None) -> list[PublicationStatDTO]:
+        self.repository.get_by_id(dep_id)
+        return [
+            PublicationStatDTO(
+                year=stat.year,
+                document_type=stat.document_type,
+                source_type=stat.source_type,
+                publications=stat.publications
+            ) for stat in self.stats_repository.get_department_stats(dep_id, year_from, year_to)
+        ]
+
+    def get_department_author_stats(self, dep_id: int, year_from: Optional[int] = None,
+                                    year_to: Optional[int] = None) -> list[AuthorPublicationStatDTO]:
+        self.repository.get_by_id(dep_id)
+        return [
+            AuthorPublicationStatDTO(
+                author_id=stat.author_id,
+                year=stat.year,
+                document_type=stat.document_type,
+                source_type=stat.source_type,
+                publications=stat.publications
+            ) for stat in self.stats_repository.get_author_stats(dep_id, year_from, year_to)
+        ]
@@ -0,0 +1,94 @@
+""" Servicio para la solicitud y consulta de reportes. """
+from typing import List, Optional
+
+from ...application.dto.report_dto import ReportCreateDTO, ReportResponseDTO
+from ...domain.entities.report import Report
+from ...domain.exceptions.domain_exceptions import ReportLimitExceededException
+from ...domain.repositories.department_repository import IDepartmentRepository
+from ...domain.repositories.report_file_cache import IReportFileCache
+from ...domain.repositories.report_repository import IReportRepository
+from ...domain.repositories.table_version_repository import ITableVersionRepository
+
+# Reportes pendientes o en generación admitidos por departamento
+DEFAULT_MAX_ACTIVE_PER_DEPARTMENT = 3
+
+
+def _to_response_dto(report: Report) -> ReportResponseDTO:
+    """Convierte una entidad Report a DTO de respuesta."""
+    return ReportResponseDTO(
+        report_id=report.report_id,
+        dep_id=report.dep_id,
+        report_type=report.report_type,
+        file_format=report.file_format,
+        status=report.status,
+        year_from=report.year_from,
+        year_to=report.year_to,
+        progress=report.progress,
+        processed=report.processed,
+        total=report.total,
+        cancel_requested=report.cancel_requested,
+        error=report.error,
+        created_at=report.created_at,
+        started_at=report.started_at,
+        finished_at=report.finished_at
+    )
+
+
+class ReportService:
+    """ Servicio para encolar, consultar y cancelar reportes; la generación la hacen los workers. """
+
+    def __init__(self, report_repository: IReportRepository, department_repository: IDepartmentRepository,
+                 max_active_per_department: int = DEFAULT_MAX_ACTIVE_PER_DEPARTMENT,
+                 version_repository: Optional[ITableVersionRepository] = None,
+                 report_cache: Optional[IReportFileCache] = None):
+        self.report_repository = report_repository
+        self.department_repository = department_repository
+        self.max_active_per_department = max_active_per_department
+        self.version_repository = version_repository
+        self.report_cache = report_cache
+
+    def create_report(self, dto: ReportCreateDTO) -> ReportResponseDTO:
+        """Encola el reporte, o lo registra como completado si hay uno idéntico sobre los mismos datos."""
+        self.department_repository.get_by_id(dto.dep_id)
+        report = Report(
+            report_id=None,  # Se asignará automáticamente por la BD
+            dep_id=dto.dep_id,
+            report_type=dto.report_type,
+            file_format=dto.file_format,
+            year_from=dto.year_from,
+            year_to=dto.year_to,
+            data_version=self.version_repository.department_data_version(dto.dep_id)
+            if self.version_repository else None
+        )
+        cached_path = self.report_cache.get(report) if self.report_cache else None
+        if cached_path:
+            report.status = "completed"
+            report.file_path = cached_path
+        elif self.report_repository.count_active(dto.dep_id) >= self.max_active_per_department:
+            raise ReportLimitExceededException(dto.dep_id, self.max_active_per_department)
+        return _to_response_dto(self.report_repository.create(report))
+
+    def get_report(self, report_id: int) -> ReportResponseDTO:
+        return _to_response_dto(self._get(report_id))
+
+    def get_reports(self, dep_id: Optional[int], limit: int) -> List[ReportResponseDTO]:
+        return [_to_response_dto(report) for report in self.report_repository.get_recent(dep_id, limit)]
+
+    def cancel_report(self, report_id: int) -> ReportResponseDTO:
+        report = self.report_repository.request_cancel(report_id)
+        if report is None:
+            raise ValueError("El reporte no fue encontrado.")
+        return _to_response_dto(report)
+
+    def get_report_file(self, report_id: int) -> str:
+        """Ruta del archivo generado; ValueError si el reporte no existe y LookupError si no está listo."""
+        report = self._get(report_id)
+        if report.status != "completed" or not report.file_path:
+            raise LookupError(f"El reporte está en estado '{report.status}'.")
+        return report.file_path
+
+    def _get(self, report_id: int) -> Report:
+        report = self.report_repository.get_by_id(report_id)
+        if report is None:
+            raise ValueError("El reporte no fue encontrado.")
+        return report
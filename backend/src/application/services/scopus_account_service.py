@@ -1,8 +1,15 @@
 """ Servicio para la gestión de cuentas Scopus. """
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
 from ...domain.entities.scopus_account import ScopusAccount
+from ...domain.exceptions.domain_exceptions import DomainException
 from ...domain.repositories.scopus_account_repository import IScopusAccountRepository
 from ...domain.repositories.author_repository import IAuthorRepository
+from ...domain.repositories.table_version_repository import ITableVersionRepository
+from ..dto.bulk_dto import ROW_ERROR_KEY, BulkResultDTO, BulkRowErrorDTO
+from ..dto.pagination_dto import PageDTO
 from ..dto.scopus_account_dto import ScopusAccountCreateDTO, ScopusAccountUpdateDTO, ScopusAccountResponseDTO
 
 
@@ -19,9 +26,17 @@ def _to_response_dto(account: ScopusAccount) -> ScopusAccountResponseDTO:
 class ScopusAccountService:
     """ Servicio para la gestión de cuentas Scopus. """
 
-    def __init__(self, scopus_repository: IScopusAccountRepository, author_repository: IAuthorRepository):
+    def __init__(self, scopus_repository: IScopusAccountRepository, author_repository: IAuthorRepository,
+                 version_repository: Optional[ITableVersionRepository] = None):
         self.scopus_repository = scopus_repository
         self.author_repository = author_repository
+        self.version_repository = version_repository
+
+    def get_data_version(self) -> Optional[str]:
+        """Versión de los datos de cuentas Scopus."""
+        if self.version_repository is None:
+            return None
+        return self.version_repository.version_tag(["scopus_accounts"])
 
     def create_scopus_account(self, dto: ScopusAccountCreateDTO) -> ScopusAccountResponseDTO:
         """Crea una nueva cuenta Scopus."""
@@ -45,11 +60,79 @@ class ScopusAccountService:
         created_account = self.scopus_repository.create(scopus_account)
         return _to_response_dto(created_account)
 
+    def bulk_create_scopus_accounts(self, rows: List[dict]) -> BulkResultDTO:
+        """Vincula cuentas Scopus de forma masiva, validando autores y usernames con una consulta por conjunto."""
+        errors: List[BulkRowErrorDTO] = []
+        candidates: List[Tuple[int, ScopusAccount]] = []
+        seen_usernames = set()
+
+        for row_number, row in enumerate(rows, start=1):
+            key = str(row.get("username")) if row.get("username") is not None else None
+            if ROW_ERROR_KEY in row:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error=str(row[ROW_ERROR_KEY])))
+                continue
+            try:
+                dto = ScopusAccountCreateDTO.model_validate(row)
+                account = ScopusAccount(
+                    scopus_id=None,
+                    username=dto.username,
+                    affiliation=dto.affiliation,
+                    author_id=dto.author_id
+                )
+            except ValidationError as e:
+                errors.append(BulkRowErrorDTO.from_validation_error(row_number, key, e))
+                continue
+            except (ValueError, DomainException) as e:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error=str(e)))
+                continue
+            if account.username in seen_usernames:
+                errors.append(BulkRowErrorDTO(row=row_number, key=key, error="Username duplicado dentro de la carga"))
+                continue
+            seen_usernames.add(account.username)
+            candidates.append((row_number, account))
+
+        existing_authors = self.author_repository.get_existing_ids([account.author_id for _, account in candidates])
+        existing_usernames = self.scopus_repository.get_existing_usernames(
+            [account.username for _, account in candidates]
+        )
+
+        valid_accounts = []
+        for row_number, account in candidates:
+            if account.author_id not in existing_authors:
+                errors.append(BulkRowErrorDTO(
+                    row=row_number, key=account.username, error=f"El autor {account.author_id} no existe"
+                ))
+            elif account.username in existing_usernames:
+                errors.append(BulkRowErrorDTO(
+                    row=row_number, key=account.username,
+                    error=f"Ya existe una cuenta Scopus con el username {account.username}"
+                ))
+            else:
+                valid_accounts.append(account)
+
+        self.scopus_repository.bulk_create(valid_accounts)
+        errors.sort(key=lambda error: error.row)
+        return BulkResultDTO(total=len(rows), created=len(valid_accounts), failed=len(errors), errors=errors)
+
     def get_scopus_accounts(self) -> List[ScopusAccountResponseDTO]:
         """Obtiene todas las cuentas Scopus."""
         accounts = self.scopus_repository.get_all()
         return [_to_response_dto(account) for account in accounts]
 
+    def get_scopus_accounts_page(self, cursor: Optional[int], limit: int) -> PageDTO[ScopusAccountResponseDTO]:
+        """Obtiene una página de cuentas Scopus posterior al cursor indicado."""
+        accounts = self.scopus_repository.get_page(cursor, limit + 1)
+        next_cursor = accounts[limit - 1].scopus_id if len(accounts) > limit else None
+        return PageDTO[ScopusAccountResponseDTO](
+            items=[_to_response_dto(account) for account in accounts[:limit]],
+            next_cursor=next_cursor
+        )
+
+    def stream_scopus_accounts(self, batch_size: int) -> Iterator[ScopusAccountResponseDTO]:
+        """Genera todas las cuentas Scopus por lotes, con memoria constante."""
+        for accounts in self.scopus_repository.iter_batches(batch_size):
+            yield from (_to_response_dto(account) for account in accounts)
+
     def get_scopus_account_by_id(self, scopus_id: int) -> ScopusAccountResponseDTO:
         """Obtiene una cuenta Scopus por su ID."""
         account = self.scopus_repository.get_by_id(scopus_id)
@@ -68,38 +151,21 @@ class ScopusAccountService:
         return [_to_response_dto(account) for account in accounts]
 
     def update_scopus_account(self, scopus_id: int, dto: ScopusAccountUpdateDTO) -> ScopusAccountResponseDTO:
-        """Actualiza una cuenta Scopus existente."""
-        account = self.scopus_repository.get_by_id(scopus_id)
-        if not account:
-            raise ValueError("Cuenta Scopus no encontrada")
-
-        # Verificar username único si se está actualizando
-        if dto.username and dto.username != account.username:
-            existing_account = self.scopus_repository.get_by_username(dto.username)
-            if existing_account and existing_account.scopus_id != scopus_id:
-                raise ValueError(f"Ya existe una cuenta Scopus con el username {dto.username}")
-
-        # Verificar que el nuevo autor existe si se está actualizando
-        if dto.author_id and dto.author_id != account.author_id:
-            author = self.author_repository.get_by_id(dto.author_id)
-            if not author:
-                raise ValueError("El autor especificado no existe")
-
+        """Actualiza una cuenta Scopus existente; username y autor se validan en la misma sentencia."""
         # Actualizar campos si se proporcionan
+        fields = {}
         if dto.username:
-            account.username = dto.username
+            fields["username"] = dto.username
         if dto.affiliation:
-            account.affiliation = dto.affiliation
+            fields["affiliation"] = dto.affiliation
         if dto.author_id:
-            account.author_id = dto.author_id
+            fields["author_id"] = dto.author_id
 
-        updated_account = self.scopus_repository.update(account)
+        updated_account = self.scopus_repository.update_fields(scopus_id, fields)
+        if not updated_account:
+            raise ValueError("Cuenta Scopus no encontrada")
         return _to_response_dto(updated_account)
 
     def delete_scopus_account(self, scopus_id: int) -> None:
         """Elimina una cuenta Scopus."""
-        account = self.scopus_repository.get_by_id(scopus_id)
-        if not account:
-            raise ValueError("Cuenta Scopus no encontrada")
-        
         self.scopus_repository.delete(scopus_id)
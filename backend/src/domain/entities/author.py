@@ -17,9 +17,9 @@ class Gender(Enum):
     FEMENINO = "F"
 
 
-@dataclass
+@dataclass(slots=True)
 class Author:
-    """ Entidad que representa un autor. """
+    """ Entidad que representa un autor (con __slots__: sin __dict__ por instancia). """
     author_id: Optional[int]
     dni: DNI
     title: Optional[str]
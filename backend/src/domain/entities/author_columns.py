@@ -0,0 +1,89 @@
+""" Módulo que define el contenedor por columnas de autores. """
+import sys
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .author import Author, Gender
+from ..value_objects.author import DNI
+
+_GENDER_BY_CODE = {ord(gender.value): gender for gender in Gender}
+
+
+class AuthorColumns:
+    """
+    Conjunto grande de autores guardado por columnas: un arreglo por campo en lugar de un objeto por autor.
+
+    Los IDs, departamentos y fechas de nacimiento (como ordinal) se guardan en arreglos de enteros, el
+    género como un byte y el título y el cargo, que se repiten mucho, como cadenas internadas. Sirve para
+    operaciones masivas sobre el padrón completo; ``author(i)`` reconstruye la entidad cuando se necesita.
+    """
+
+    __slots__ = ("author_ids", "dnis", "titles", "names", "surnames", "birth_dates", "genders", "positions",
+                 "department_ids")
+
+    def __init__(self):
+        # 0 para los autores aún sin ID
+        self.author_ids = array("q")
+        self.dnis: List[str] = []
+        self.titles: List[Optional[str]] = []
+        self.names: List[str] = []
+        self.surnames: List[str] = []
+        self.birth_dates = array("l")
+        self.genders = bytearray()
+        self.positions: List[str] = []
+        self.department_ids = array("q")
+
+    @classmethod
+    def from_authors(cls, authors: Iterable[Author]) -> "AuthorColumns":
+        """ Crea el contenedor a partir de entidades ya validadas. """
+        columns = cls()
+        for author in authors:
+            columns.append(author)
+        return columns
+
+    def append(self, author: Author) -> None:
+        """ Agrega una entidad ya validada. """
+        self.append_values(author.author_id, author.dni.value, author.title, author.name, author.surname,
+                           author.birth_date, author.gender, author.position, author.department_id)
+
+    def append_values(self, author_id: Optional[int], dni: str, title: Optional[str], name: str, surname: str,
+                      birth_date: date, gender: Gender, position: str, department_id: int) -> None:
+        """ Agrega un autor a partir de valores ya validados (p. ej. leídos de la BD), sin crear la entidad. """
+        self.author_ids.append(author_id or 0)
+        self.dnis.append(dni)
+        self.titles.append(sys.intern(title) if title else title)
+        self.names.append(name)
+        self.surnames.append(surname)
+        self.birth_dates.append(birth_date.toordinal())
+        self.genders.append(ord(gender.value))
+        self.positions.append(sys.intern(position))
+        self.department_ids.append(department_id)
+
+    def __len__(self) -> int:
+        return len(self.author_ids)
+
+    def author(self, index: int) -> Author:
+        """ Reconstruye la entidad del autor en la posición indicada. """
+        return Author(
+            author_id=self.author_ids[index] or None,
+            dni=DNI.trusted(self.dnis[index]),
+            title=self.titles[index],
+            name=self.names[index],
+            surname=self.surnames[index],
+            birth_date=date.fromordinal(self.birth_dates[index]),
+            gender=_GENDER_BY_CODE[self.genders[index]],
+            position=self.positions[index],
+            department_id=self.department_ids[index],
+        )
+
+    def __iter__(self) -> Iterator[Author]:
+        return (self.author(index) for index in range(len(self)))
+
+    def index_by_dni(self) -> Dict[str, int]:
+        """ Posición de cada autor por DNI, para cruzar cargas masivas con el padrón. """
+        return {dni: index for index, dni in enumerate(self.dnis)}
+
+    def select_department(self, department_id: int) -> List[int]:
+        """ Posiciones de los autores del departamento indicado. """
+        return [index for index, dep_id in enumerate(self.department_ids) if dep_id == department_id]
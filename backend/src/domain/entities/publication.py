@@ -0,0 +1,33 @@
+""" Módulo que define la entidad Publicación. """
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from ..exceptions.domain_exceptions import EmptyFieldException
+
+
+@dataclass
+class Publication:
+    """ Entidad que representa una publicación indexada, identificada por su EID de Scopus. """
+
+    pub_id: Optional[int]
+    eid: str
+    title: str
+    publication_date: Optional[date]
+    source_title: Optional[str]
+    document_type: str
+    source_type: str
+    doi: Optional[str] = None
+    cited_by: int = 0
+
+    def __post_init__(self):
+        if not self.eid or not self.eid.strip():
+            raise EmptyFieldException("EID")
+        if not self.title or not self.title.strip():
+            raise EmptyFieldException("título")
+
+    @property
+    def year(self) -> Optional[int]:
+        return self.publication_date.year if self.publication_date else None
+
+    def __str__(self):
+        return f"{self.title} ({self.eid})"
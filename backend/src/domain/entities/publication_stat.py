@@ -0,0 +1,17 @@
+""" Módulo que define los conteos precalculados de publicaciones. """
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class PublicationStat:
+    """ Número de publicaciones de un departamento (o de uno de sus autores) por año, tipo de documento y fuente. """
+
+    dep_id: int
+    # None en los conteos del departamento completo
+    author_id: Optional[int]
+    # 0 cuando la publicación no tiene fecha
+    year: int
+    document_type: str
+    source_type: str
+    publications: int
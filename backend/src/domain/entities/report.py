@@ -0,0 +1,39 @@
+""" Módulo que define la entidad Reporte. """
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass
+class Report:
+    """ Solicitud de generación de un reporte de publicaciones de un departamento. """
+
+    report_id: Optional[int]
+    dep_id: int
+    # Valores de ReportTypeEnum ("draft" / "final")
+    report_type: str
+    # Valores de ReportFormatEnum ("xlsx" / "pdf" / "csv")
+    file_format: str = "xlsx"
+    # Valores de ReportStatusEnum
+    status: str = "pending"
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    # Versión de los datos del departamento al solicitar el reporte; el worker la reemplaza por la de los
+    # datos con los que lo genera (clave de la caché de reportes)
+    data_version: Optional[str] = None
+    # Autores procesados y total de autores del departamento
+    processed: int = 0
+    total: int = 0
+    cancel_requested: bool = False
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> int:
+        """ Porcentaje de avance. """
+        if self.status == "completed":
+            return 100
+        return int(self.processed * 100 / self.total) if self.total else 0
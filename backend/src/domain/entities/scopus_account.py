@@ -4,7 +4,7 @@ from typing import Optional
 from ..exceptions.domain_exceptions import EmptyFieldException
 
 
-@dataclass
+@dataclass(slots=True)
 class ScopusAccount:
     """ Entidad que representa una cuenta de Scopus asociada a un autor. """
 
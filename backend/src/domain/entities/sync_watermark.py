@@ -0,0 +1,17 @@
+""" Módulo que define la marca de sincronización de una cuenta Scopus. """
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class SyncWatermark:
+    """ Hasta dónde se sincronizó una cuenta Scopus y con qué contenido. """
+
+    scopus_id: int
+    username: str
+    # Las siguientes sincronizaciones piden solo documentos cargados después de esta fecha
+    loaded_after: date
+    # Huella del último resultado descargado; si no cambia no se escribe nada
+    content_hash: str
+    document_count: int
+    full_synced_on: date
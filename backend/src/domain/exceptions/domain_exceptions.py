@@ -12,3 +12,17 @@ class EmptyFieldException(DomainException):
     def __init__(self, field: str):
         super().__init__(f"El campo '{field}' no puede estar vacío.")
         self.field = field
+
+
+class DuplicateValueException(DomainException):
+    """ Excepción lanzada cuando un valor que debe ser único ya lo usa otro registro. """
+    pass
+
+
+class ReportLimitExceededException(DomainException):
+    """ Excepción lanzada cuando un departamento ya tiene el máximo de reportes en cola o en generación. """
+
+    def __init__(self, dep_id: int, limit: int):
+        super().__init__(f"El departamento {dep_id} ya tiene {limit} reportes pendientes o en generación.")
+        self.dep_id = dep_id
+        self.limit = limit
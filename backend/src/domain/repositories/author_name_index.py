@@ -0,0 +1,36 @@
+""" Interfaz del índice de nombres de autores en memoria. """
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Tuple
+
+
+class IAuthorNameIndex(ABC):
+    """ Índice de nombres de autores que resuelve búsquedas sin consultar la base de datos. """
+
+    @abstractmethod
+    def search(self, search_term: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Obtener los IDs de autores cuyo nombre contiene cada palabra del término, con la misma semántica y
+        orden que la búsqueda por nombre del repositorio de autores.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def version(self) -> Optional[int]:
+        """ Versión de la tabla de autores con la que se construyó; None si aún no se construyó. """
+        pass
+
+    @abstractmethod
+    def rebuild(self, entries: Iterable[Tuple[int, str]], version: int) -> None:
+        """ Reconstruir el índice a partir de pares (ID de autor, nombre completo) leídos en ``version``. """
+        pass
+
+    @abstractmethod
+    def is_consistent_with(self, entries: Iterable[Tuple[int, str]]) -> bool:
+        """ Comparar el contenido del índice con los pares (ID de autor, nombre completo) de la BD. """
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """ Número de autores indexados. """
+        pass
@@ -0,0 +1,19 @@
+""" Interfaz de las consultas de solo lectura de autores. """
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class IAuthorQueryRepository(ABC):
+    """
+    Consultas de listados de autores que devuelven filas planas, sin construir entidades de dominio.
+
+    Cada fila es un diccionario con los campos de la respuesta de autor (``author_id``, ``dni``, ``title``,
+    ``first_name``, ``last_name``, ``birth_date``, ``gender``, ``position``, ``department_id`` y
+    ``scopus_accounts``, con ``scopus_id``, ``username`` y ``affiliation`` por cuenta), en ese orden.
+    """
+
+    @abstractmethod
+    def get_rows(self, department_id: Optional[int] = None, after_id: Optional[int] = None,
+                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """ Obtener las filas de los autores ordenadas por ID, opcionalmente de un departamento o paginadas. """
+        pass
@@ -1,6 +1,6 @@
 """ Interfaz del repositorio para la entidad Author. """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from ...domain.entities.author import Author
 
 
@@ -12,21 +12,56 @@ class IAuthorRepository(ABC):
         """ Agregar un autor. """
         pass
 
+    @abstractmethod
+    def bulk_create(self, authors: List[Author]) -> List[Author]:
+        """ Agregar varios autores en una sola transacción. """
+        pass
+
     @abstractmethod
     def get_all(self) -> List[Author]:
         """ Obtener todos los autores. """
         pass
 
+    @abstractmethod
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Author]:
+        """ Obtener una página de autores ordenada por ID, posterior al cursor indicado. """
+        pass
+
+    @abstractmethod
+    def iter_batches(self, batch_size: int) -> Iterator[List[Author]]:
+        """ Recorrer todos los autores por lotes usando un cursor del servidor. """
+        pass
+
     @abstractmethod
     def get_by_id(self, author_id: int) -> Optional[Author]:
         """ Obtener un autor por su ID. """
         pass
 
+    @abstractmethod
+    def get_by_ids(self, author_ids: List[int]) -> List[Author]:
+        """ Obtener varios autores por sus IDs, en el mismo orden. """
+        pass
+
+    @abstractmethod
+    def get_name_entries(self) -> List[Tuple[int, str]]:
+        """ Obtener los pares (ID, nombre completo) de todos los autores. """
+        pass
+
     @abstractmethod
     def get_by_dni(self, dni: str) -> Optional[Author]:
         """ Obtiene un autor por su DNI. """
         pass
 
+    @abstractmethod
+    def get_existing_ids(self, author_ids: List[int]) -> Set[int]:
+        """ Obtener cuáles de los IDs indicados corresponden a autores existentes. """
+        pass
+
+    @abstractmethod
+    def get_existing_dnis(self, dnis: List[str]) -> Set[str]:
+        """ Obtener cuáles de los DNIs indicados ya están registrados. """
+        pass
+
     @abstractmethod
     def get_by_department_id(self, department_id: int) -> List[Author]:
         """ Obtiene autores por ID de departamento. """
@@ -37,12 +72,17 @@ class IAuthorRepository(ABC):
         """ Actualizar un autor existente. """
         pass
 
+    @abstractmethod
+    def update_fields(self, author_id: int, fields: Dict[str, Any]) -> Optional[Author]:
+        """ Actualizar solo los campos indicados (nombres de atributo de Author); None si no existe. """
+        pass
+
     @abstractmethod
     def delete(self, author_id: int) -> None:
         """ Eliminar un autor. """
         pass
 
     @abstractmethod
-    def search_by_name(self, search_term: str) -> List[Author]:
-        """ Buscar autores por nombre completo. """
+    def search_by_name(self, search_term: str, limit: Optional[int] = None) -> List[Author]:
+        """ Buscar autores por nombre completo, ordenados por relevancia. """
         pass
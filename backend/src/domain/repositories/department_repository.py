@@ -1,6 +1,6 @@
 """ Interfaz del repositorio para la entidad de Departamento. """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from ..entities.department import Department
 
@@ -18,17 +18,36 @@ class IDepartmentRepository(ABC):
         """ Obtener todos los departamentos. """
         pass
 
+    @abstractmethod
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Department]:
+        """ Obtener una página de departamentos ordenada por ID, posterior al cursor indicado. """
+        pass
+
+    @abstractmethod
+    def iter_batches(self, batch_size: int) -> Iterator[List[Department]]:
+        """ Recorrer todos los departamentos por lotes usando un cursor del servidor. """
+        pass
+
     @abstractmethod
     def get_by_id(self, dep_id: int) -> Department:
         """ Obtener un departamento por su id. """
         pass
 
+    @abstractmethod
+    def get_existing_ids(self, dep_ids: List[int]) -> Set[int]:
+        """ Obtener cuáles de los IDs indicados corresponden a departamentos existentes. """
+        pass
 
     @abstractmethod
     def update(self, department: Department) -> Department:
         """ Actualizar un departamento. """
         pass
 
+    @abstractmethod
+    def update_fields(self, dep_id: int, fields: Dict[str, Any]) -> Optional[Department]:
+        """ Actualizar solo los campos indicados; None si el departamento no existe. """
+        pass
+
     @abstractmethod
     def delete(self, dep_id: int) -> None:
         """ Eliminar un departamento. """
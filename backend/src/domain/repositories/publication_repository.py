@@ -0,0 +1,43 @@
+""" Interfaz del repositorio para la entidad de Publicación. """
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from ..entities.publication import Publication
+
+
+@dataclass
+class AccountPublications:
+    """ Publicaciones descargadas para una cuenta Scopus. """
+    scopus_id: int
+    publications: List[Publication]
+    # Descarga completa: la autoría de la cuenta se reemplaza; incremental: se agrega
+    replace: bool = True
+
+
+@dataclass
+class SaveResult:
+    """ Resultado de guardar un lote de publicaciones. """
+    written: int = 0
+    unchanged: int = 0
+    # Publicaciones distintas (por EID) de cada cuenta del lote después de guardarlo
+    document_counts: Dict[int, int] = field(default_factory=dict)
+
+
+class IPublicationRepository(ABC):
+    """ Repositorio de publicaciones y de su autoría por cuenta Scopus. """
+
+    @abstractmethod
+    def save_account_publications(self, batch: List[AccountPublications]) -> SaveResult:
+        """
+        Guardar las publicaciones descargadas de varias cuentas Scopus en una sola transacción.
+
+        Inserta o actualiza cada publicación por su EID, omitiendo las que no cambiaron, actualiza
+        la autoría de cada cuenta y devuelve cuántas publicaciones distintas tiene cada una.
+        """
+        pass
+
+    @abstractmethod
+    def count(self) -> int:
+        """ Obtener el número de publicaciones registradas. """
+        pass
@@ -0,0 +1,26 @@
+""" Interfaz del repositorio de estadísticas de publicaciones. """
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from ..entities.publication_stat import PublicationStat
+
+
+class IPublicationStatsRepository(ABC):
+    """ Repositorio de conteos de publicaciones precalculados por departamento y por autor. """
+
+    @abstractmethod
+    def get_department_stats(self, dep_id: int, year_from: Optional[int] = None,
+                             year_to: Optional[int] = None) -> List[PublicationStat]:
+        """ Obtener los conteos del departamento; cada publicación se cuenta una vez aunque tenga varios autores. """
+        pass
+
+    @abstractmethod
+    def get_author_stats(self, dep_id: int, year_from: Optional[int] = None,
+                         year_to: Optional[int] = None) -> List[PublicationStat]:
+        """ Obtener los conteos de cada autor del departamento. """
+        pass
+
+    @abstractmethod
+    def rebuild(self) -> None:
+        """ Recalcular todos los conteos a partir de las publicaciones registradas. """
+        pass
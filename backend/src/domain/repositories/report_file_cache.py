@@ -0,0 +1,22 @@
+""" Interfaz de la caché de archivos de reportes. """
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..entities.report import Report
+
+
+class IReportFileCache(ABC):
+    """ Archivos de reportes generados, indexados por parámetros y versión de los datos del departamento. """
+
+    @abstractmethod
+    def get(self, report: Report) -> Optional[str]:
+        """
+        Si hay un reporte idéntico ya generado con la misma versión de datos, crear un archivo propio para
+        este reporte con su contenido y devolver su ruta.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, report: Report, path: str) -> str:
+        """ Guardar en la caché el archivo generado para el reporte; devuelve la ruta que conserva el reporte. """
+        pass
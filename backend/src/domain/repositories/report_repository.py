@@ -0,0 +1,57 @@
+""" Interfaz del repositorio para la entidad Reporte. """
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from ..entities.report import Report
+
+
+class IReportRepository(ABC):
+    """ Repositorio de reportes, que también hace de cola de trabajos para los workers. """
+
+    @abstractmethod
+    def create(self, report: Report) -> Report:
+        """ Registrar un reporte pendiente, o ya completado si se sirvió desde la caché de reportes. """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, report_id: int) -> Optional[Report]:
+        """ Obtener un reporte por su ID. """
+        pass
+
+    @abstractmethod
+    def get_recent(self, dep_id: Optional[int], limit: int) -> List[Report]:
+        """ Obtener los últimos reportes solicitados, de un departamento o de todos. """
+        pass
+
+    @abstractmethod
+    def count_active(self, dep_id: int) -> int:
+        """ Obtener el número de reportes pendientes o en generación del departamento. """
+        pass
+
+    @abstractmethod
+    def request_cancel(self, report_id: int) -> Optional[Report]:
+        """
+        Cancelar un reporte: si está pendiente se cancela de inmediato; si se está generando se marca
+        para que el worker lo detenga. None si el reporte no existe.
+        """
+        pass
+
+    @abstractmethod
+    def claim_next(self, worker_id: str, stale_before: datetime) -> Optional[Report]:
+        """
+        Tomar el reporte pendiente más antiguo (o uno en generación cuyo worker dejó de dar señales
+        antes de ``stale_before``) y marcarlo en generación por el worker indicado.
+        """
+        pass
+
+    @abstractmethod
+    def update_progress(self, report_id: int, worker_id: str, processed: int, total: int) -> bool:
+        """ Registrar el avance; devuelve False si se solicitó la cancelación o el worker perdió el reporte. """
+        pass
+
+    @abstractmethod
+    def finish(self, report_id: int, worker_id: str, status: str,
+               file_path: Optional[str] = None, error: Optional[str] = None) -> None:
+        """ Registrar el estado final del reporte generado por el worker indicado. """
+        pass
@@ -1,6 +1,6 @@
 """ Interfaz del repositorio para la entidad de Cuenta Scopus. """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 from ...domain.entities.scopus_account import ScopusAccount
 
@@ -12,11 +12,26 @@ class IScopusAccountRepository(ABC):
         """ Agregar una cuenta de Scopus. """
         pass
 
+    @abstractmethod
+    def bulk_create(self, scopus_accounts: List[ScopusAccount]) -> List[ScopusAccount]:
+        """ Agregar varias cuentas Scopus en una sola transacción. """
+        pass
+
     @abstractmethod
     def get_all(self) -> List[ScopusAccount]:
         """ Obtener todas las cuentas Scopus. """
         pass
 
+    @abstractmethod
+    def get_page(self, after_id: Optional[int], limit: int) -> List[ScopusAccount]:
+        """ Obtener una página de cuentas Scopus ordenada por ID, posterior al cursor indicado. """
+        pass
+
+    @abstractmethod
+    def iter_batches(self, batch_size: int) -> Iterator[List[ScopusAccount]]:
+        """ Recorrer todos los cuentas Scopus por lotes usando un cursor del servidor. """
+        pass
+
     @abstractmethod
     def get_by_id(self, scopus_id: int) -> Optional[ScopusAccount]:
         """ Obtener una cuenta Scopus por su ID. """
@@ -27,16 +42,31 @@ class IScopusAccountRepository(ABC):
         """ Obtener cuentas Scopus por ID de autor. """
         pass
 
+    @abstractmethod
+    def get_by_author_ids(self, author_ids: List[int]) -> List[ScopusAccount]:
+        """ Obtener en una sola consulta las cuentas Scopus de varios autores. """
+        pass
+
     @abstractmethod
     def get_by_username(self, username: str) -> Optional[ScopusAccount]:
         """ Obtener una cuenta Scopus por nombre de usuario. """
         pass
 
+    @abstractmethod
+    def get_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        """ Obtener cuáles de los nombres de usuario indicados ya están registrados. """
+        pass
+
     @abstractmethod
     def update(self, scopus_account: ScopusAccount) -> ScopusAccount:
         """ Actualizar una cuenta Scopus existente."""
         pass
 
+    @abstractmethod
+    def update_fields(self, scopus_id: int, fields: Dict[str, Any]) -> Optional[ScopusAccount]:
+        """ Actualizar solo los campos indicados; None si la cuenta no existe. """
+        pass
+
     @abstractmethod
     def delete(self, scopus_id: int) -> None:
         """ Eliminar una cuenta Scopus. """
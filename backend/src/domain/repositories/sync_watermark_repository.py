@@ -0,0 +1,24 @@
+""" Interfaz del repositorio de marcas de sincronización. """
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from ..entities.sync_watermark import SyncWatermark
+
+
+class ISyncWatermarkRepository(ABC):
+    """ Repositorio de marcas de sincronización por cuenta Scopus. """
+
+    @abstractmethod
+    def get_by_scopus_ids(self, scopus_ids: List[int]) -> Dict[int, SyncWatermark]:
+        """ Obtener las marcas de las cuentas indicadas, por ID de cuenta. """
+        pass
+
+    @abstractmethod
+    def save_many(self, watermarks: List[SyncWatermark]) -> None:
+        """ Insertar o reemplazar varias marcas en una sola transacción. """
+        pass
+
+    @abstractmethod
+    def delete_by_scopus_ids(self, scopus_ids: List[int]) -> None:
+        """ Eliminar las marcas de las cuentas indicadas para forzar una descarga completa. """
+        pass
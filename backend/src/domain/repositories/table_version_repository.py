@@ -0,0 +1,35 @@
+""" Interfaz del repositorio de versiones de tablas. """
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+
+def department_data_key(dep_id: int) -> str:
+    """ Nombre del contador de cambios en los datos de reporte de un departamento. """
+    return f"department_data:{dep_id}"
+
+
+class ITableVersionRepository(ABC):
+    """ Contadores de cambios por tabla, usados para validar respuestas en caché (ETag). """
+
+    @abstractmethod
+    def get_versions(self, table_names: List[str]) -> Dict[str, int]:
+        """
+        Obtener la versión actual de cada tabla indicada (0 si nunca se modificó).
+
+        Dentro de una transacción se repite la primera lectura de cada tabla hasta la siguiente escritura:
+        el ETag de una respuesta y las entradas de caché de su cuerpo usan así la misma versión.
+        """
+        pass
+
+    def version_tag(self, table_names: List[str]) -> str:
+        """ Resumen de las versiones de las tablas indicadas, para construir el ETag. """
+        versions = self.get_versions(table_names)
+        return ";".join(f"{table_name}.{versions[table_name]}" for table_name in sorted(versions))
+
+    def department_data_version(self, dep_id: int) -> str:
+        """
+        Versión de los datos de un departamento (autores, cuentas Scopus y publicaciones de sus autores):
+        el contador en decimal, que crece con cada escritura, así que dos versiones se pueden comparar.
+        """
+        key = department_data_key(dep_id)
+        return str(self.get_versions([key])[key])
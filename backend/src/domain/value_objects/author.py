@@ -1,9 +1,45 @@
 """ Value Objects relacionados con el dominio de Autor. """
 from dataclasses import dataclass
+from typing import Iterable, List
 from ..exceptions.domain_exceptions import EmptyFieldException
 
+# Códigos de provincia válidos (dos primeros dígitos)
+_PROVINCES = frozenset(f"{province:02d}" for province in range(1, 25))
+# Aporte de un dígito en posición par (coeficiente 2, restando 9 si el producto es de dos cifras)
+_DOUBLED = tuple(digit * 2 - 9 if digit >= 5 else digit * 2 for digit in range(10))
+# Aporte de cada par y de cada grupo de cuatro dígitos (coeficientes 2, 1, 2, 1): la suma de los
+# nueve coeficientes más el dígito verificador se obtiene con tres consultas sobre el número completo
+_PAIRS = tuple(_DOUBLED[pair // 10] + pair % 10 for pair in range(100))
+_QUADS = tuple(_PAIRS[quad // 100] + _PAIRS[quad % 100] for quad in range(10000))
 
-@dataclass(frozen=True)
+
+def _has_dni_format(value: str) -> bool:
+    return len(value) == 10 and value.isascii() and value.isdigit() and value[:2] in _PROVINCES
+
+
+def is_valid_dni(value: str) -> bool:
+    """ Verifica el formato, la provincia y el dígito verificador (módulo 10) de una cédula. """
+    if not _has_dni_format(value):
+        return False
+    number = int(value)
+    return (_QUADS[number // 1000000] + _QUADS[number // 100 % 10000] + _PAIRS[number % 100]) % 10 == 0
+
+
+def validate_dnis(values: Iterable[str]) -> List[bool]:
+    """ Valida un lote de cédulas (p. ej. una carga masiva); devuelve un indicador por valor. """
+    quads, pairs, provinces = _QUADS, _PAIRS, _PROVINCES
+    results = []
+    for value in values:
+        if (value is None or len(value) != 10 or not value.isascii() or not value.isdigit()
+                or value[:2] not in provinces):
+            results.append(False)
+            continue
+        number = int(value)
+        results.append((quads[number // 1000000] + quads[number // 100 % 10000] + pairs[number % 100]) % 10 == 0)
+    return results
+
+
+@dataclass(frozen=True, slots=True)
 class DNI:
     """ Value Object que representa un DNI. """
     value: str
@@ -14,19 +50,12 @@ class DNI:
         if not self.validate_dni():
             raise ValueError("DNI incorrecto.")
 
+    @classmethod
+    def trusted(cls, value: str) -> "DNI":
+        """ Crea el DNI sin validarlo; solo para valores ya validados (p. ej. leídos de la BD). """
+        dni = object.__new__(cls)
+        object.__setattr__(dni, "value", value)
+        return dni
+
     def validate_dni(self) -> bool:
-        valid_dni = False
-        if self.value.isdigit() and len(self.value) == 10:
-            state_digit = int(self.value[0:2])
-            if 1 <= state_digit <= 24:
-                coefficients = [2, 1, 2, 1, 2, 1, 2, 1, 2]
-                total = 0
-                for i in range(9):
-                    digit = int(self.value[i]) * coefficients[i]
-                    if digit >= 10:
-                        digit -= 9
-                    total += digit
-                check_digit = (10 - (total % 10)) % 10
-                if check_digit == int(self.value[9]):
-                    valid_dni = True
-        return valid_dni
+        return is_valid_dni(self.value)
@@ -0,0 +1,58 @@
+""" Lectura de cargas masivas en formato CSV, JSON Lines o arreglo JSON. """
+import csv
+import io
+import json
+from typing import List, Optional
+
+from ...application.dto.bulk_dto import ROW_ERROR_KEY
+
+CSV_MEDIA_TYPES = ("text/csv", "application/csv")
+JSONL_MEDIA_TYPES = ("application/x-ndjson", "application/jsonl", "application/x-jsonlines")
+JSON_MEDIA_TYPE = "application/json"
+
+# Máximo de filas aceptadas por petición
+MAX_BULK_ROWS = 100_000
+
+
+def parse_bulk_rows(body: bytes, content_type: Optional[str]) -> List[dict]:
+    """ Convierte el cuerpo de la petición en una lista de filas (diccionarios). """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    text = body.decode("utf-8-sig")
+    if media_type in CSV_MEDIA_TYPES:
+        rows = [_csv_row(row) for row in csv.DictReader(io.StringIO(text))]
+    elif media_type in JSONL_MEDIA_TYPES:
+        rows = []
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Línea {line_number}: JSON inválido ({e.msg})")
+            if not isinstance(row, dict):
+                raise ValueError(f"Línea {line_number}: se esperaba un objeto JSON")
+            rows.append(row)
+    elif media_type == JSON_MEDIA_TYPE:
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON inválido ({e.msg})")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("Se esperaba un arreglo JSON de objetos")
+    else:
+        raise ValueError(
+            f"Formato no soportado: '{media_type}'. Use text/csv, application/x-ndjson o application/json."
+        )
+
+    if len(rows) > MAX_BULK_ROWS:
+        raise ValueError(f"La carga supera el máximo de {MAX_BULK_ROWS} filas.")
+    return rows
+
+
+def _csv_row(row: dict) -> dict:
+    """ Limpia una fila CSV; si tiene más campos que el encabezado (DictReader los deja en la clave None) se marca. """
+    extra = row.pop(None, None)
+    cleaned = {key.strip(): (value.strip() or None) if isinstance(value, str) else value for key, value in row.items()}
+    if extra:
+        cleaned[ROW_ERROR_KEY] = f"La fila tiene {len(extra)} campo(s) más que el encabezado"
+    return cleaned
@@ -0,0 +1,51 @@
+"""
+Peticiones condicionales (ETag / If-None-Match).
+
+El ETag se deriva de la versión de las tablas que componen la respuesta y de la URL, de modo que se
+resuelve un 304 sin cargar ni serializar los datos. HTTP_CACHE_MAX_AGE (segundos, 0 por defecto)
+define cuánto pueden reutilizar la respuesta el navegador y el proxy sin revalidarla.
+"""
+import hashlib
+import os
+from typing import Optional, TypeVar
+
+from fastapi import Request, Response
+
+R = TypeVar("R", bound=Response)
+
+
+def _cache_control() -> str:
+    max_age = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+    return f"public, max-age={max_age}, must-revalidate"
+
+
+def entity_tag(request: Request, data_version: Optional[str]) -> Optional[str]:
+    """ ETag fuerte para la URL solicitada con la versión de datos indicada; None si no hay versión. """
+    if data_version is None:
+        return None
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha256(f"{data_version}|{request.url.path}?{query}".encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """ Indica si alguno de los ETags de If-None-Match coincide (comparación débil, RFC 9110). """
+    header = request.headers.get("if-none-match")
+    if etag is None or not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def set_cache_headers(response: R, etag: Optional[str]) -> R:
+    """ Agrega ETag y Cache-Control a la respuesta. """
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = _cache_control()
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    """ Respuesta 304 sin cuerpo. """
+    return set_cache_headers(Response(status_code=304), etag)
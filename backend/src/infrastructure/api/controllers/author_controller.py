@@ -1,49 +1,110 @@
 """ Controlador REST para la gestión de autores. """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Union
 
 from ....application.dto.author_dto import AuthorCreateDTO, AuthorUpdateDTO, AuthorResponseDTO
+from ....application.dto.bulk_dto import BulkResultDTO
+from ....application.dto.pagination_dto import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageDTO
 from ....application.services.author_service import AuthorService
-from ....infrastructure.db import get_session
+from ....infrastructure.api.conditional import entity_tag, etag_matches, not_modified, set_cache_headers
+from ....infrastructure.api.streaming import STREAM_BATCH_SIZE, ndjson_response
+from ....infrastructure.api.bulk_upload import parse_bulk_rows
+from ....infrastructure.api.projection import json_response
+from ....infrastructure.api.service_runner import ServiceRunner, service_runner
+from ....infrastructure.cache.cached_repositories import CachedAuthorRepository, CachedScopusAccountRepository
+from ....infrastructure.cache.repository_cache import cache_enabled
+from ....infrastructure.repositories.author_query_repo_impl import AuthorQueryRepoImpl
 from ....infrastructure.repositories.author_repo_impl import AuthorRepoImpl
+from ....infrastructure.repositories.department_repo_impl import DepartmentRepoImpl
 from ....infrastructure.repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+from ....infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
+from ....infrastructure.search.name_index import author_name_index, name_index_enabled
 
 router = APIRouter(prefix="/authors", tags=["Autores"])
 
+# Máximo de resultados por búsqueda de nombre
+DEFAULT_SEARCH_LIMIT = 50
 
-def get_author_service(session: Session = Depends(get_session)) -> AuthorService:
+
+def build_author_service(session: Session) -> AuthorService:
     """ Factory para crear el servicio de autores. """
     author_repo = AuthorRepoImpl(session)
     scopus_repo = ScopusAccountRepoImpl(session)
-    return AuthorService(author_repo, scopus_repo)
+    department_repo = DepartmentRepoImpl(session)
+    version_repo = TableVersionRepoImpl(session)
+    if cache_enabled():
+        author_repo = CachedAuthorRepository(author_repo, version_repo)
+        scopus_repo = CachedScopusAccountRepository(scopus_repo, version_repo)
+    name_index = author_name_index if name_index_enabled() else None
+    return AuthorService(
+        author_repo, scopus_repo, name_index, department_repo, version_repo, AuthorQueryRepoImpl(session)
+    )
+
+
+author_service_runner = service_runner(build_author_service)
 
 
 @router.post("/", response_model=AuthorResponseDTO)
-def create_author(dto: AuthorCreateDTO, service: AuthorService = Depends(get_author_service)):
+async def create_author(dto: AuthorCreateDTO, run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Crea un nuevo autor. """
     try:
-        return service.create_author(dto)
+        return await run(lambda service: service.create_author(dto))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
-@router.get("/", response_model=List[AuthorResponseDTO])
-def get_authors(service: AuthorService = Depends(get_author_service)):
-    """ Obtiene todos los autores. """
+@router.post("/bulk", response_model=BulkResultDTO)
+async def bulk_create_authors(request: Request, run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
+    """ Crea autores de forma masiva (text/csv, application/x-ndjson o application/json). """
     try:
-        return service.get_authors()
+        rows = parse_bulk_rows(await request.body(), request.headers.get("content-type"))
+        return await run(lambda service: service.bulk_create_authors(rows))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/", response_model=Union[List[AuthorResponseDTO], PageDTO[AuthorResponseDTO]])
+async def get_authors(
+        request: Request,
+        cursor: Optional[int] = Query(None, description="ID del último autor de la página anterior"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamaño de página"),
+        stream: bool = Query(False, description="Transmitir todos los autores como NDJSON"),
+        run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
+    """
+    Obtiene los autores: lista completa, paginada por cursor o en streaming.
+    Las listas se leen con la proyección de solo lectura y se responden ya serializadas.
+    """
+    try:
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        if stream:
+            return set_cache_headers(
+                ndjson_response(run.stream(lambda service: service.stream_authors(STREAM_BATCH_SIZE))), etag
+            )
+        if cursor is not None or limit is not None:
+            page = await run(lambda service: service.get_author_rows_page(cursor, limit or DEFAULT_PAGE_SIZE))
+            return set_cache_headers(json_response(page), etag)
+        return set_cache_headers(json_response(await run(lambda service: service.get_author_rows())), etag)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
 @router.get("/{author_id}", response_model=AuthorResponseDTO)
-def get_author_by_id(author_id: int, service: AuthorService = Depends(get_author_service)):
+async def get_author_by_id(author_id: int, request: Request, response: Response,
+                           run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Obtiene un autor por su ID. """
     try:
-        return service.get_author_by_id(author_id)
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_author_by_id(author_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -51,19 +112,24 @@ def get_author_by_id(author_id: int, service: AuthorService = Depends(get_author
 
 
 @router.get("/department/{department_id}", response_model=List[AuthorResponseDTO])
-def get_authors_by_department(department_id: int, service: AuthorService = Depends(get_author_service)):
+async def get_authors_by_department(department_id: int, request: Request,
+                                    run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Obtiene autores por departamento. """
     try:
-        return service.get_authors_by_department(department_id)
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        rows = await run(lambda service: service.get_department_author_rows(department_id))
+        return set_cache_headers(json_response(rows), etag)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
 @router.put("/{author_id}", response_model=AuthorResponseDTO)
-def update_author(author_id: int, dto: AuthorUpdateDTO, service: AuthorService = Depends(get_author_service)):
+async def update_author(author_id: int, dto: AuthorUpdateDTO, run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Actualiza un autor existente. """
     try:
-        return service.update_author(author_id, dto)
+        return await run(lambda service: service.update_author(author_id, dto))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -71,10 +137,10 @@ def update_author(author_id: int, dto: AuthorUpdateDTO, service: AuthorService =
 
 
 @router.delete("/{author_id}")
-def delete_author(author_id: int, service: AuthorService = Depends(get_author_service)):
+async def delete_author(author_id: int, run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Elimina un autor. """
     try:
-        service.delete_author(author_id)
+        await run(lambda service: service.delete_author(author_id))
         return {"mensaje": "Autor eliminado correctamente"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -83,10 +149,13 @@ def delete_author(author_id: int, service: AuthorService = Depends(get_author_se
 
 
 @router.get("/search/{search_term}", response_model=List[AuthorResponseDTO])
-def search_authors_by_name(search_term: str, service: AuthorService = Depends(get_author_service)):
-    """ Busca autores por nombre completo. """
+async def search_authors_by_name(
+        search_term: str,
+        limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE, description="Máximo de resultados"),
+        run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
+    """ Busca autores por nombre completo, ordenados por relevancia. """
     try:
-        return service.search_authors_by_name(search_term)
+        return await run(lambda service: service.search_authors_by_name(search_term, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -94,11 +163,23 @@ def search_authors_by_name(search_term: str, service: AuthorService = Depends(ge
 
 
 @router.get("/scopus-ids/{search_term}")
-def get_scopus_ids_by_author_name(search_term: str, service: AuthorService = Depends(get_author_service)):
+async def get_scopus_ids_by_author_name(
+        search_term: str,
+        limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=MAX_PAGE_SIZE, description="Máximo de autores"),
+        run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
     """ Obtiene los IDS de cuentas Scopus pertenecientes a un autor. """
     try:
-        return service.get_scopus_account_ids_by_author_name(search_term)
+        return await run(lambda service: service.get_scopus_account_ids_by_author_name(search_term, limit))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/name-index/check")
+async def check_name_index(run: ServiceRunner[AuthorService] = Depends(author_service_runner)):
+    """ Verifica el índice de nombres en memoria contra la base de datos y lo reconstruye si difiere. """
+    try:
+        return await run(lambda service: service.check_name_index())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
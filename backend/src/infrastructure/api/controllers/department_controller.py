@@ -1,47 +1,128 @@
 """ Controlador REST para la gestión de departamentos. """
-from fastapi import APIRouter, HTTPException
+from typing import Optional, Union
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.params import Depends
 from sqlalchemy.orm import Session
 
-from ....application.dto.department_dto import DepartmentResponseDTO, DepartmentCreateDTO, DepartmentUpdateDTO
+from ....application.dto.department_dto import (
+    AuthorPublicationStatDTO, DepartmentResponseDTO, DepartmentCreateDTO, DepartmentUpdateDTO, PublicationStatDTO
+)
+from ....application.dto.pagination_dto import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageDTO
 from ....application.services.department_service import DepartmentService
-from ....infrastructure.db import get_session
+from ....domain.exceptions.domain_exceptions import DuplicateValueException
+from ....infrastructure.api.conditional import entity_tag, etag_matches, not_modified, set_cache_headers
+from ....infrastructure.api.streaming import STREAM_BATCH_SIZE, ndjson_response
+from ....infrastructure.api.service_runner import ServiceRunner, service_runner
+from ....infrastructure.cache.cached_repositories import CachedDepartmentRepository
+from ....infrastructure.cache.repository_cache import cache_enabled
 from ....infrastructure.repositories.department_repo_impl import DepartmentRepoImpl
+from ....infrastructure.repositories.publication_stats_repo_impl import PublicationStatsRepoImpl
+from ....infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
 
 router = APIRouter(prefix="/deps", tags=["Departamentos"])
 
 
-def get_service(session: Session = Depends(get_session)) -> DepartmentService:
+def build_department_service(session: Session) -> DepartmentService:
     """ Factory para crear el servicio de departamentos. """
     repo = DepartmentRepoImpl(session)
-    return DepartmentService(repo)
+    version_repo = TableVersionRepoImpl(session)
+    if cache_enabled():
+        repo = CachedDepartmentRepository(repo, version_repo)
+    return DepartmentService(repo, version_repo, PublicationStatsRepoImpl(session))
+
+
+department_service_runner = service_runner(build_department_service)
 
 
 @router.post("/", response_model=DepartmentResponseDTO)
-def create_department(dto: DepartmentCreateDTO, service: DepartmentService = Depends(get_service)):
+async def create_department(dto: DepartmentCreateDTO, run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
     """ Crea un nuevo departamento. """
     try:
-        return service.create_department(dto)
+        return await run(lambda service: service.create_department(dto))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
-@router.get("/", response_model=list[DepartmentResponseDTO])
-def get_departments(service: DepartmentService = Depends(get_service)):
-    """ Obtiene todos los departamentos. """
+@router.get("/", response_model=Union[list[DepartmentResponseDTO], PageDTO[DepartmentResponseDTO]])
+async def get_departments(
+        request: Request,
+        response: Response,
+        cursor: Optional[int] = Query(None, description="ID del último departamento de la página anterior"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamaño de página"),
+        stream: bool = Query(False, description="Transmitir todos los departamentos como NDJSON"),
+        run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
+    """ Obtiene los departamentos: lista completa, paginada por cursor o en streaming. """
     try:
-        return service.get_departments()
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        if stream:
+            return set_cache_headers(
+                ndjson_response(run.stream(lambda service: service.stream_departments(STREAM_BATCH_SIZE))), etag
+            )
+        if cursor is not None or limit is not None:
+            return await run(lambda service: service.get_departments_page(cursor, limit or DEFAULT_PAGE_SIZE))
+        return await run(lambda service: service.get_departments())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
 @router.get("/{dep_id}", response_model=DepartmentResponseDTO)
-def get_department_by_id(dep_id: int, service: DepartmentService = Depends(get_service)):
+async def get_department_by_id(dep_id: int, request: Request, response: Response,
+                               run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
     """ Obtiene un departamento por su ID. """
     try:
-        return service.get_department_by_id(dep_id)
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_department_by_id(dep_id))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/{dep_id}/stats", response_model=list[PublicationStatDTO])
+async def get_department_stats(
+        dep_id: int,
+        request: Request,
+        response: Response,
+        year_from: Optional[int] = Query(None, description="Primer año incluido"),
+        year_to: Optional[int] = Query(None, description="Último año incluido"),
+        run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
+    """ Obtiene el número de publicaciones del departamento por año, tipo de documento y tipo de fuente. """
+    try:
+        etag = entity_tag(request, await run(lambda service: service.get_stats_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_department_stats(dep_id, year_from, year_to))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/{dep_id}/stats/authors", response_model=list[AuthorPublicationStatDTO])
+async def get_department_author_stats(
+        dep_id: int,
+        request: Request,
+        response: Response,
+        year_from: Optional[int] = Query(None, description="Primer año incluido"),
+        year_to: Optional[int] = Query(None, description="Último año incluido"),
+        run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
+    """ Obtiene el número de publicaciones de cada autor del departamento por año, tipo de documento y tipo de fuente. """
+    try:
+        etag = entity_tag(request, await run(lambda service: service.get_stats_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_department_author_stats(dep_id, year_from, year_to))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -49,10 +130,12 @@ def get_department_by_id(dep_id: int, service: DepartmentService = Depends(get_s
 
 
 @router.put("/{dep_id}", response_model=DepartmentResponseDTO)
-def update_department(dep_id: int, dto: DepartmentUpdateDTO, service: DepartmentService = Depends(get_service)):
+async def update_department(dep_id: int, dto: DepartmentUpdateDTO, run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
     """ Actualiza un departamento existente. """
     try:
-        return service.update_department(dep_id, dto)
+        return await run(lambda service: service.update_department(dep_id, dto))
+    except DuplicateValueException as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -60,10 +143,10 @@ def update_department(dep_id: int, dto: DepartmentUpdateDTO, service: Department
 
 
 @router.delete("/{dep_id}")
-def delete_department(dep_id: int, service: DepartmentService = Depends(get_service)):
+async def delete_department(dep_id: int, run: ServiceRunner[DepartmentService] = Depends(department_service_runner)):
     """ Elimina un departamento. """
     try:
-        service.delete_department(dep_id)
+        await run(lambda service: service.delete_department(dep_id))
         return {"mensaje": "Departamento eliminado correctamente"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,22 @@
+""" Controlador REST para la sincronización de publicaciones desde Scopus. """
+from fastapi import APIRouter, HTTPException, Query
+
+from ....application.dto.sync_dto import SyncStatusDTO
+from ....infrastructure.db import get_session_factory
+from ....infrastructure.scopus.ingestion import sync_coordinator
+
+router = APIRouter(prefix="/publications", tags=["Publicaciones"])
+
+
+@router.post("/sync", status_code=202)
+async def start_sync(full: bool = Query(False, description="Ignorar las marcas y descargar todo")):
+    """ Inicia en segundo plano la descarga de publicaciones de todas las cuentas Scopus. """
+    if not sync_coordinator.start(get_session_factory(), full=full):
+        raise HTTPException(status_code=409, detail="Ya hay una sincronización en curso.")
+    return {"mensaje": "Sincronización iniciada"}
+
+
+@router.get("/sync", response_model=SyncStatusDTO)
+async def get_sync_status():
+    """ Estado de la sincronización y resultado de la última ejecución. """
+    return sync_coordinator.status()
@@ -0,0 +1,109 @@
+""" Controlador REST para la solicitud y descarga de reportes. """
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from ....application.dto.report_dto import ReportCreateDTO, ReportResponseDTO
+from ....application.services.report_service import DEFAULT_MAX_ACTIVE_PER_DEPARTMENT, ReportService
+from ....domain.exceptions.domain_exceptions import ReportLimitExceededException
+from ....infrastructure.api.service_runner import ServiceRunner, service_runner
+from ....infrastructure.reports.cache import report_file_cache
+from ....infrastructure.reports.generator import media_type
+from ....infrastructure.reports.worker import report_workers
+from ....infrastructure.repositories.department_repo_impl import DepartmentRepoImpl
+from ....infrastructure.repositories.report_repo_impl import ReportRepoImpl
+from ....infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
+
+router = APIRouter(prefix="/reports", tags=["Reportes"])
+
+# Máximo de reportes por consulta del listado
+MAX_REPORTS_LIMIT = 200
+
+
+def build_report_service(session: Session) -> ReportService:
+    """ Factory para crear el servicio de reportes. """
+    max_active = int(os.getenv("REPORT_MAX_ACTIVE_PER_DEPARTMENT", str(DEFAULT_MAX_ACTIVE_PER_DEPARTMENT)))
+    return ReportService(
+        ReportRepoImpl(session), DepartmentRepoImpl(session), max_active, TableVersionRepoImpl(session), report_file_cache
+    )
+
+
+report_service_runner = service_runner(build_report_service)
+
+
+@router.post("/", response_model=ReportResponseDTO, status_code=202)
+async def create_report(dto: ReportCreateDTO, response: Response,
+                        run: ServiceRunner[ReportService] = Depends(report_service_runner)):
+    """
+    Encola la generación de un reporte y responde de inmediato; el avance se consulta en GET /reports/{id}.
+    Si ya se generó un reporte idéntico sobre los mismos datos, se responde 200 con el reporte completado.
+    """
+    try:
+        report = await run(lambda service: service.create_report(dto))
+    except ReportLimitExceededException as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+    if report.status == "pending":
+        report_workers.notify()
+    else:
+        response.status_code = 200
+    return report
+
+
+@router.get("/", response_model=List[ReportResponseDTO])
+async def get_reports(
+        dep_id: Optional[int] = Query(None, description="ID del departamento"),
+        limit: int = Query(50, ge=1, le=MAX_REPORTS_LIMIT, description="Máximo de reportes"),
+        run: ServiceRunner[ReportService] = Depends(report_service_runner)):
+    """ Obtiene los últimos reportes solicitados. """
+    try:
+        return await run(lambda service: service.get_reports(dep_id, limit))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/{report_id}", response_model=ReportResponseDTO)
+async def get_report(report_id: int, run: ServiceRunner[ReportService] = Depends(report_service_runner)):
+    """ Obtiene el estado y el avance de un reporte. """
+    try:
+        return await run(lambda service: service.get_report(report_id))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.post("/{report_id}/cancel", response_model=ReportResponseDTO)
+async def cancel_report(report_id: int, run: ServiceRunner[ReportService] = Depends(report_service_runner)):
+    """ Cancela un reporte pendiente o detiene uno en generación. """
+    try:
+        return await run(lambda service: service.cancel_report(report_id))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.get("/{report_id}/file")
+async def download_report(report_id: int, run: ServiceRunner[ReportService] = Depends(report_service_runner)):
+    """ Descarga el archivo de un reporte completado; admite peticiones por rangos (Range). """
+    try:
+        report = await run(lambda service: service.get_report(report_id))
+        path = await run(lambda service: service.get_report_file(report_id))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except LookupError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+    if not os.path.exists(path):
+        raise HTTPException(status_code=410, detail="El archivo del reporte ya no está disponible.")
+    # FileResponse envía el archivo por bloques y responde 206 a las peticiones con Range
+    filename = f"reporte-{report.report_id}-{report.report_type}.{report.file_format}"
+    return FileResponse(path, media_type=media_type(report.file_format), filename=filename)
@@ -1,51 +1,99 @@
 """
 Controlador REST para la gestión de cuentas Scopus.
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Union
 
+from ....application.dto.bulk_dto import BulkResultDTO
+from ....application.dto.pagination_dto import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageDTO
 from ....application.dto.scopus_account_dto import ScopusAccountCreateDTO, ScopusAccountUpdateDTO, ScopusAccountResponseDTO
 from ....application.services.scopus_account_service import ScopusAccountService
-from ....infrastructure.db import get_session
+from ....infrastructure.api.conditional import entity_tag, etag_matches, not_modified, set_cache_headers
+from ....infrastructure.api.streaming import STREAM_BATCH_SIZE, ndjson_response
+from ....infrastructure.api.bulk_upload import parse_bulk_rows
+from ....infrastructure.api.service_runner import ServiceRunner, service_runner
+from ....infrastructure.cache.cached_repositories import CachedAuthorRepository, CachedScopusAccountRepository
+from ....infrastructure.cache.repository_cache import cache_enabled
 from ....infrastructure.repositories.author_repo_impl import AuthorRepoImpl
 from ....infrastructure.repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+from ....infrastructure.repositories.table_version_repo_impl import TableVersionRepoImpl
 
 router = APIRouter(prefix="/scopus-accounts", tags=["Cuentas Scopus"])
 
 
-def get_scopus_service(session: Session = Depends(get_session)) -> ScopusAccountService:
+def build_scopus_service(session: Session) -> ScopusAccountService:
     """Factory para crear el servicio de cuentas Scopus."""
     scopus_repo = ScopusAccountRepoImpl(session)
     author_repo = AuthorRepoImpl(session)
-    return ScopusAccountService(scopus_repo, author_repo)
+    version_repo = TableVersionRepoImpl(session)
+    if cache_enabled():
+        scopus_repo = CachedScopusAccountRepository(scopus_repo, version_repo)
+        author_repo = CachedAuthorRepository(author_repo, version_repo)
+    return ScopusAccountService(scopus_repo, author_repo, version_repo)
+
+
+scopus_service_runner = service_runner(build_scopus_service)
 
 
 @router.post("/", response_model=ScopusAccountResponseDTO)
-def create_scopus_account(dto: ScopusAccountCreateDTO, service: ScopusAccountService = Depends(get_scopus_service)):
+async def create_scopus_account(dto: ScopusAccountCreateDTO, run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
     """Crea una nueva cuenta Scopus."""
     try:
-        return service.create_scopus_account(dto)
+        return await run(lambda service: service.create_scopus_account(dto))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
+
+
+@router.post("/bulk", response_model=BulkResultDTO)
+async def bulk_create_scopus_accounts(request: Request, run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
+    """Vincula cuentas Scopus de forma masiva (application/json, application/x-ndjson o text/csv)."""
+    try:
+        rows = parse_bulk_rows(await request.body(), request.headers.get("content-type"))
+        return await run(lambda service: service.bulk_create_scopus_accounts(rows))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
-@router.get("/", response_model=List[ScopusAccountResponseDTO])
-def get_scopus_accounts(service: ScopusAccountService = Depends(get_scopus_service)):
-    """Obtiene todas las cuentas Scopus."""
+@router.get("/", response_model=Union[List[ScopusAccountResponseDTO], PageDTO[ScopusAccountResponseDTO]])
+async def get_scopus_accounts(
+        request: Request,
+        response: Response,
+        cursor: Optional[int] = Query(None, description="ID de la última cuenta de la página anterior"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Tamaño de página"),
+        stream: bool = Query(False, description="Transmitir todas las cuentas como NDJSON"),
+        run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
+    """Obtiene las cuentas Scopus: lista completa, paginada por cursor o en streaming."""
     try:
-        return service.get_scopus_accounts()
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        if stream:
+            return set_cache_headers(
+                ndjson_response(run.stream(lambda service: service.stream_scopus_accounts(STREAM_BATCH_SIZE))), etag
+            )
+        if cursor is not None or limit is not None:
+            return await run(lambda service: service.get_scopus_accounts_page(cursor, limit or DEFAULT_PAGE_SIZE))
+        return await run(lambda service: service.get_scopus_accounts())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error interno del servidor: {str(e)}")
 
 
 @router.get("/{scopus_id}", response_model=ScopusAccountResponseDTO)
-def get_scopus_account_by_id(scopus_id: int, service: ScopusAccountService = Depends(get_scopus_service)):
+async def get_scopus_account_by_id(scopus_id: int, request: Request, response: Response,
+                                   run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
     """Obtiene una cuenta Scopus por su ID."""
     try:
-        return service.get_scopus_account_by_id(scopus_id)
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_scopus_account_by_id(scopus_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -53,10 +101,15 @@ def get_scopus_account_by_id(scopus_id: int, service: ScopusAccountService = Dep
 
 
 @router.get("/author/{author_id}", response_model=List[ScopusAccountResponseDTO])
-def get_scopus_accounts_by_author(author_id: int, service: ScopusAccountService = Depends(get_scopus_service)):
+async def get_scopus_accounts_by_author(author_id: int, request: Request, response: Response,
+                                        run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
     """Obtiene cuentas Scopus por autor."""
     try:
-        return service.get_scopus_accounts_by_author(author_id)
+        etag = entity_tag(request, await run(lambda service: service.get_data_version()))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_cache_headers(response, etag)
+        return await run(lambda service: service.get_scopus_accounts_by_author(author_id))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -64,10 +117,10 @@ def get_scopus_accounts_by_author(author_id: int, service: ScopusAccountService
 
 
 @router.put("/{scopus_id}", response_model=ScopusAccountResponseDTO)
-def update_scopus_account(scopus_id: int, dto: ScopusAccountUpdateDTO, service: ScopusAccountService = Depends(get_scopus_service)):
+async def update_scopus_account(scopus_id: int, dto: ScopusAccountUpdateDTO, run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
     """Actualiza una cuenta Scopus existente."""
     try:
-        return service.update_scopus_account(scopus_id, dto)
+        return await run(lambda service: service.update_scopus_account(scopus_id, dto))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -75,10 +128,10 @@ def update_scopus_account(scopus_id: int, dto: ScopusAccountUpdateDTO, service:
 
 
 @router.delete("/{scopus_id}")
-def delete_scopus_account(scopus_id: int, service: ScopusAccountService = Depends(get_scopus_service)):
+async def delete_scopus_account(scopus_id: int, run: ServiceRunner[ScopusAccountService] = Depends(scopus_service_runner)):
     """Elimina una cuenta Scopus."""
     try:
-        service.delete_scopus_account(scopus_id)
+        await run(lambda service: service.delete_scopus_account(scopus_id))
         return {"mensaje": "Cuenta Scopus eliminada correctamente"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
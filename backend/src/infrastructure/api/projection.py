@@ -0,0 +1,18 @@
+"""
+Respuestas JSON pre-serializadas para los listados de solo lectura.
+
+Las filas de las proyecciones (diccionarios con fechas y enums) se serializan directamente con
+pydantic-core, sin construir ni volver a validar los DTOs de respuesta; el JSON resultante es idéntico
+al que produciría el ``response_model`` del endpoint, que se conserva para la documentación.
+"""
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(content: Any) -> Response:
+    """ Serializa el contenido (filas, listas o diccionarios) a JSON en una sola pasada. """
+    return Response(to_json(content), media_type=JSON_MEDIA_TYPE)
@@ -0,0 +1,84 @@
+"""
+Middleware de métricas por petición.
+
+Agrega a cada respuesta la cabecera ``Server-Timing`` con el tiempo total hasta la respuesta, el tiempo
+en la BD y el número de consultas, y registra como JSON (logger ``request_metrics``) las peticiones que
+superan SLOW_REQUEST_MS milisegundos (1000 por defecto; 0 registra todas). En las respuestas en
+streaming la cabecera refleja lo ejecutado antes de enviarla; el registro incluye el cuerpo completo.
+La medición termina con el último fragmento del cuerpo: las tareas en segundo plano (BackgroundTasks),
+que Starlette ejecuta después, no cuentan en el tiempo ni en las consultas de la petición.
+"""
+import json
+import logging
+import os
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..sql_metrics import start_request_metrics
+
+logger = logging.getLogger("request_metrics")
+
+
+def _slow_request_ms() -> float:
+    return float(os.getenv("SLOW_REQUEST_MS", "1000"))
+
+
+def _server_timing(total_ms: float, metrics: dict) -> str:
+    queries = metrics["queries"]
+    return (
+        f'total;dur={total_ms:.1f}, '
+        f'db;dur={metrics["db_ms"]:.1f};desc="{queries} consulta{"" if queries == 1 else "s"}", '
+        f'db-slowest;dur={metrics["slowest_ms"]:.1f}'
+    )
+
+
+class RequestMetricsMiddleware:
+    """ Mide cada petición HTTP y atribuye a ella las consultas SQL que ejecuta. """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        metrics = start_request_metrics()
+        status = None
+
+        def finish() -> None:
+            if metrics.closed:
+                return
+            metrics.close()
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= _slow_request_ms():
+                record = {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "status": status,
+                    "duration_ms": round(duration_ms, 3),
+                    **metrics.as_dict(),
+                }
+                logger.warning("Petición lenta: %s", json.dumps(record, ensure_ascii=False),
+                               extra={"request_metrics": record})
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", _server_timing((time.perf_counter() - started) * 1000,
+                                                               metrics.as_dict()))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            # Sin cuerpo final (error o desconexión) la medición termina aquí
+            finish()
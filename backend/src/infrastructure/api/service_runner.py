@@ -0,0 +1,90 @@
+"""
+Ejecución de los servicios de aplicación desde endpoints asíncronos.
+
+Los servicios y repositorios son síncronos. En modo ``sync`` (DB_MODE) se ejecutan en el threadpool de
+Starlette con una ``Session`` bloqueante; en modo ``async`` se ejecutan con ``AsyncSession.run_sync``
+sobre el ``AsyncEngine``, de modo que la espera de la BD no ocupa un hilo del threadpool.
+
+No hay variantes asíncronas de los repositorios: ``run_sync`` ejecuta el mismo código síncrono en un
+greenlet del hilo del event loop, que solo se libera mientras se espera al driver. La construcción de
+entidades y DTOs y el resto del trabajo del ORM se hacen en el event loop y se serializan entre todas
+las peticiones del proceso; con respuestas grandes o CPU como cuello de botella conviene el modo ``sync``.
+"""
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import AsyncIterator, Callable, Generic, Iterable, TypeVar
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from ..db import DB_MODE, get_async_session, get_session
+
+S = TypeVar("S")
+R = TypeVar("R")
+
+# Elementos que se extraen por cada salto al greenlet al transmitir en modo async
+_ASYNC_STREAM_CHUNK = 500
+
+
+class ServiceRunner(ABC, Generic[S]):
+    """ Ejecuta una llamada sobre un servicio construido con la sesión de la petición. """
+
+    @abstractmethod
+    async def __call__(self, call: Callable[[S], R]) -> R:
+        """ Ejecuta la llamada y devuelve su resultado. """
+        pass
+
+    @abstractmethod
+    def stream(self, call: Callable[[S], Iterable[R]]) -> AsyncIterator[R]:
+        """ Recorre un generador del servicio sin bloquear el event loop. """
+        pass
+
+
+class ThreadPoolServiceRunner(ServiceRunner[S]):
+    """ Ejecuta el servicio con una sesión síncrona en el threadpool. """
+
+    def __init__(self, session: Session, factory: Callable[[Session], S]):
+        self.session = session
+        self.factory = factory
+
+    async def __call__(self, call: Callable[[S], R]) -> R:
+        return await run_in_threadpool(call, self.factory(self.session))
+
+    def stream(self, call: Callable[[S], Iterable[R]]) -> AsyncIterator[R]:
+        return iterate_in_threadpool(iter(call(self.factory(self.session))))
+
+
+class AsyncSessionServiceRunner(ServiceRunner[S]):
+    """
+    Ejecuta el servicio sobre una AsyncSession mediante run_sync: la espera de la BD no bloquea, pero el
+    trabajo del ORM y de los servicios se hace en el hilo del event loop.
+    """
+
+    def __init__(self, session: AsyncSession, factory: Callable[[Session], S]):
+        self.session = session
+        self.factory = factory
+
+    async def __call__(self, call: Callable[[S], R]) -> R:
+        return await self.session.run_sync(lambda sync_session: call(self.factory(sync_session)))
+
+    async def stream(self, call: Callable[[S], Iterable[R]]) -> AsyncIterator[R]:
+        iterator = await self.session.run_sync(lambda sync_session: iter(call(self.factory(sync_session))))
+        while True:
+            chunk = await self.session.run_sync(lambda _: list(islice(iterator, _ASYNC_STREAM_CHUNK)))
+            if not chunk:
+                return
+            for item in chunk:
+                yield item
+
+
+def service_runner(factory: Callable[[Session], S]) -> Callable[..., ServiceRunner[S]]:
+    """ Crea la dependencia que entrega el runner del servicio según DB_MODE. """
+    if DB_MODE == "async":
+        def dependency(session: AsyncSession = Depends(get_async_session)) -> ServiceRunner[S]:
+            return AsyncSessionServiceRunner(session, factory)
+    else:
+        def dependency(session: Session = Depends(get_session)) -> ServiceRunner[S]:
+            return ThreadPoolServiceRunner(session, factory)
+    return dependency
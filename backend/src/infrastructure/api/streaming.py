@@ -0,0 +1,20 @@
+""" Utilidades para respuestas en streaming (NDJSON). """
+from typing import AsyncIterable, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Número de filas leídas por lote desde el cursor del servidor
+STREAM_BATCH_SIZE = 500
+
+
+async def _to_ndjson(items: AsyncIterable[BaseModel]) -> AsyncIterator[str]:
+    async for item in items:
+        yield item.model_dump_json() + "\n"
+
+
+def ndjson_response(items: AsyncIterable[BaseModel]) -> StreamingResponse:
+    """ Serializa los DTOs uno por línea a medida que se generan. """
+    return StreamingResponse(_to_ndjson(items), media_type=NDJSON_MEDIA_TYPE)
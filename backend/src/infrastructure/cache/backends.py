@@ -0,0 +1,127 @@
+"""
+Almacenes de caché para las lecturas de los repositorios.
+
+Los valores se guardan serializados (bytes), de modo que cada lectura entrega una copia independiente
+y ambos almacenes son intercambiables.
+"""
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """ Almacén clave-valor con expiración. """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """ Obtener el valor de una clave; None si no existe o expiró. """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """ Guardar un valor con su tiempo de vida. """
+        pass
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """ Eliminar las claves indicadas. """
+        pass
+
+
+class InMemoryCache(CacheBackend):
+    """ Caché del proceso con expiración por TTL y desalojo LRU al superar max_entries. """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """
+    Caché compartida entre procesos sobre el protocolo de Redis.
+
+    Recibe cualquier cliente con get/set/delete al estilo de redis-py (por ejemplo fakeredis). Si Redis
+    no responde se registra el error y la lectura se trata como un fallo de caché.
+    """
+
+    def __init__(self, client, key_prefix: str = "di_reports:"):
+        self._client = client
+        self._key_prefix = key_prefix
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str = "di_reports:") -> "RedisCache":
+        try:
+            import redis
+        except ImportError as e:
+            raise ValueError("CACHE_BACKEND=redis requiere instalar el paquete 'redis'.") from e
+        return cls(redis.Redis.from_url(url), key_prefix)
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._client.get(self._key_prefix + key)
+        except Exception as e:
+            self._record_error("get", e)
+            return None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            self._client.set(self._key_prefix + key, value, px=max(1, int(ttl_seconds * 1000)))
+        except Exception as e:
+            self._record_error("set", e)
+
+    def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            self._client.delete(*(self._key_prefix + key for key in keys))
+        except Exception as e:
+            # Una invalidación perdida deja datos obsoletos hasta que expire el TTL
+            self._record_error("delete", e)
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning("Error de Redis en %s: %s", operation, error)
+
+
+def backend_stats(backend: CacheBackend) -> Dict[str, object]:
+    """ Información del almacén para el endpoint de métricas. """
+    stats: Dict[str, object] = {"backend": type(backend).__name__}
+    if isinstance(backend, InMemoryCache):
+        stats["entries"] = len(backend)
+    if isinstance(backend, RedisCache):
+        stats["errors"] = backend.errors
+    return stats
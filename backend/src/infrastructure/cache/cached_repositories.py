@@ -0,0 +1,174 @@
+"""
+Repositorios con caché de lectura.
+
+Envuelven cualquier implementación de las interfaces de dominio y sirven desde la caché las lecturas
+puntuales; el resto de operaciones se delega sin cambios. Cada entrada se guarda con la versión de su
+tabla en ``table_versions``, la misma que usa el ETag de la petición: las escrituras de cualquier proceso
+incrementan esa versión, así que no hace falta invalidar entradas y una respuesta nunca lleva un cuerpo
+más antiguo que su ETag.
+"""
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ...domain.entities.author import Author
+from ...domain.entities.department import Department
+from ...domain.entities.scopus_account import ScopusAccount
+from ...domain.repositories.author_repository import IAuthorRepository
+from ...domain.repositories.department_repository import IDepartmentRepository
+from ...domain.repositories.scopus_account_repository import IScopusAccountRepository
+from ...domain.repositories.table_version_repository import ITableVersionRepository
+from .repository_cache import (
+    ALL_DEPARTMENTS_KEY, RepositoryCache, author_cache, department_cache, scopus_account_cache
+)
+
+
+class CachedDepartmentRepository(IDepartmentRepository):
+    """ Caché para la lista de departamentos y la consulta por ID. """
+
+    def __init__(self, repository: IDepartmentRepository, versions: ITableVersionRepository,
+                 cache: RepositoryCache = department_cache):
+        self.repository = repository
+        self.versions = versions
+        self.cache = cache
+
+    def _version(self) -> int:
+        return self.versions.get_versions([self.cache.namespace])[self.cache.namespace]
+
+    def create(self, department: Department) -> Department:
+        return self.repository.create(department)
+
+    def get_all(self) -> List[Department]:
+        return self.cache.get_or_load(ALL_DEPARTMENTS_KEY, self._version(), self.repository.get_all)
+
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Department]:
+        return self.repository.get_page(after_id, limit)
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Department]]:
+        return self.repository.iter_batches(batch_size)
+
+    def get_by_id(self, dep_id: int) -> Department:
+        return self.cache.get_or_load(dep_id, self._version(), lambda: self.repository.get_by_id(dep_id))
+
+    def get_existing_ids(self, dep_ids: List[int]) -> Set[int]:
+        return self.repository.get_existing_ids(dep_ids)
+
+    def update(self, department: Department) -> Department:
+        return self.repository.update(department)
+
+    def update_fields(self, dep_id: int, fields: Dict[str, Any]) -> Optional[Department]:
+        return self.repository.update_fields(dep_id, fields)
+
+    def delete(self, dep_id: int) -> None:
+        self.repository.delete(dep_id)
+
+
+class CachedAuthorRepository(IAuthorRepository):
+    """ Caché para la consulta de autores por ID. """
+
+    def __init__(self, repository: IAuthorRepository, versions: ITableVersionRepository,
+                 cache: RepositoryCache = author_cache):
+        self.repository = repository
+        self.versions = versions
+        self.cache = cache
+
+    def _version(self) -> int:
+        return self.versions.get_versions([self.cache.namespace])[self.cache.namespace]
+
+    def create(self, author: Author) -> Author:
+        return self.repository.create(author)
+
+    def bulk_create(self, authors: List[Author]) -> List[Author]:
+        return self.repository.bulk_create(authors)
+
+    def get_all(self) -> List[Author]:
+        return self.repository.get_all()
+
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Author]:
+        return self.repository.get_page(after_id, limit)
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Author]]:
+        return self.repository.iter_batches(batch_size)
+
+    def get_by_id(self, author_id: int) -> Optional[Author]:
+        return self.cache.get_or_load(author_id, self._version(), lambda: self.repository.get_by_id(author_id))
+
+    def get_by_ids(self, author_ids: List[int]) -> List[Author]:
+        return self.repository.get_by_ids(author_ids)
+
+    def get_name_entries(self) -> List[Tuple[int, str]]:
+        return self.repository.get_name_entries()
+
+    def get_by_dni(self, dni: str) -> Optional[Author]:
+        return self.repository.get_by_dni(dni)
+
+    def get_existing_ids(self, author_ids: List[int]) -> Set[int]:
+        return self.repository.get_existing_ids(author_ids)
+
+    def get_existing_dnis(self, dnis: List[str]) -> Set[str]:
+        return self.repository.get_existing_dnis(dnis)
+
+    def get_by_department_id(self, department_id: int) -> List[Author]:
+        return self.repository.get_by_department_id(department_id)
+
+    def update(self, author: Author) -> Author:
+        return self.repository.update(author)
+
+    def update_fields(self, author_id: int, fields: Dict[str, Any]) -> Optional[Author]:
+        return self.repository.update_fields(author_id, fields)
+
+    def delete(self, author_id: int) -> None:
+        self.repository.delete(author_id)
+
+    def search_by_name(self, search_term: str, limit: Optional[int] = None) -> List[Author]:
+        return self.repository.search_by_name(search_term, limit)
+
+
+class CachedScopusAccountRepository(IScopusAccountRepository):
+    """ Caché para las cuentas Scopus de un autor, usadas al responder cada autor por ID. """
+
+    def __init__(self, repository: IScopusAccountRepository, versions: ITableVersionRepository,
+                 cache: RepositoryCache = scopus_account_cache):
+        self.repository = repository
+        self.versions = versions
+        self.cache = cache
+
+    def _version(self) -> int:
+        return self.versions.get_versions([self.cache.namespace])[self.cache.namespace]
+
+    def create(self, scopus_account: ScopusAccount) -> ScopusAccount:
+        return self.repository.create(scopus_account)
+
+    def bulk_create(self, scopus_accounts: List[ScopusAccount]) -> List[ScopusAccount]:
+        return self.repository.bulk_create(scopus_accounts)
+
+    def get_all(self) -> List[ScopusAccount]:
+        return self.repository.get_all()
+
+    def get_page(self, after_id: Optional[int], limit: int) -> List[ScopusAccount]:
+        return self.repository.get_page(after_id, limit)
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[ScopusAccount]]:
+        return self.repository.iter_batches(batch_size)
+
+    def get_by_id(self, scopus_id: int) -> Optional[ScopusAccount]:
+        return self.repository.get_by_id(scopus_id)
+
+    def get_by_author_id(self, author_id: int) -> List[ScopusAccount]:
+        return self.cache.get_or_load(author_id, self._version(), lambda: self.repository.get_by_author_id(author_id))
+
+    def get_by_author_ids(self, author_ids: List[int]) -> List[ScopusAccount]:
+        return self.repository.get_by_author_ids(author_ids)
+
+    def get_by_username(self, username: str) -> Optional[ScopusAccount]:
+        return self.repository.get_by_username(username)
+
+    def get_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        return self.repository.get_existing_usernames(usernames)
+
+    def update(self, scopus_account: ScopusAccount) -> ScopusAccount:
+        return self.repository.update(scopus_account)
+
+    def update_fields(self, scopus_id: int, fields: Dict[str, Any]) -> Optional[ScopusAccount]:
+        return self.repository.update_fields(scopus_id, fields)
+
+    def delete(self, scopus_id: int) -> None:
+        self.repository.delete(scopus_id)
@@ -0,0 +1,63 @@
+"""
+Serialización JSON de las entidades guardadas en la caché de repositorios.
+
+Se usa JSON y no pickle porque el almacén puede ser un Redis compartido: un valor escrito por terceros
+solo puede producir entidades de los tipos esperados, nunca ejecutar código al leerse.
+"""
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Generic, TypeVar
+
+from ...domain.entities.author import Author, Gender
+from ...domain.entities.department import Department
+from ...domain.entities.scopus_account import ScopusAccount
+from ...domain.value_objects.author import DNI
+
+E = TypeVar("E")
+
+
+@dataclass(frozen=True)
+class EntityCodec(Generic[E]):
+    """ Conversión de una entidad (o de una lista de entidades) a bytes JSON y de vuelta. """
+    to_dict: Callable[[E], Dict[str, Any]]
+    from_dict: Callable[[Dict[str, Any]], E]
+
+    def dumps(self, value: Any) -> bytes:
+        data = [self.to_dict(item) for item in value] if isinstance(value, list) else self.to_dict(value)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        data = json.loads(payload)
+        return [self.from_dict(item) for item in data] if isinstance(data, list) else self.from_dict(data)
+
+
+def _department_to_dict(department: Department) -> Dict[str, Any]:
+    return {"dep_id": department.dep_id, "dep_code": department.dep_code, "dep_name": department.dep_name,
+            "fac_name": department.fac_name}
+
+
+def _author_to_dict(author: Author) -> Dict[str, Any]:
+    return {
+        "author_id": author.author_id, "dni": author.dni.value, "title": author.title, "name": author.name,
+        "surname": author.surname, "birth_date": author.birth_date.isoformat(), "gender": author.gender.value,
+        "position": author.position, "department_id": author.department_id,
+    }
+
+
+def _author_from_dict(data: Dict[str, Any]) -> Author:
+    return Author(
+        author_id=data["author_id"], dni=DNI.trusted(data["dni"]), title=data["title"], name=data["name"],
+        surname=data["surname"], birth_date=date.fromisoformat(data["birth_date"]), gender=Gender(data["gender"]),
+        position=data["position"], department_id=data["department_id"],
+    )
+
+
+def _scopus_account_to_dict(account: ScopusAccount) -> Dict[str, Any]:
+    return {"scopus_id": account.scopus_id, "username": account.username, "affiliation": account.affiliation,
+            "author_id": account.author_id}
+
+
+department_codec = EntityCodec(_department_to_dict, lambda data: Department(**data))
+author_codec = EntityCodec(_author_to_dict, _author_from_dict)
+scopus_account_codec = EntityCodec(_scopus_account_to_dict, lambda data: ScopusAccount(**data))
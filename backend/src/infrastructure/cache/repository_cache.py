@@ -0,0 +1,129 @@
+"""
+Caché de lectura para los repositorios.
+
+Se configura con CACHE_BACKEND ("memory", "redis" o "none"), CACHE_TTL (segundos), CACHE_MAX_ENTRIES
+(solo memoria) y REDIS_URL. Sin CACHE_BACKEND la caché queda desactivada salvo que REDIS_URL indique un
+almacén compartido. Las entradas se guardan con la versión de su tabla (``table_versions``), así que una
+escritura de cualquier proceso deja de servir las anteriores sin esperar al TTL. Los valores se guardan
+como JSON (ver ``codecs``).
+"""
+import os
+import threading
+from typing import Callable, Dict, Optional, TypeVar
+
+from .backends import CacheBackend, InMemoryCache, RedisCache, backend_stats
+from .codecs import EntityCodec, author_codec, department_codec, scopus_account_codec
+
+T = TypeVar("T")
+
+# Se incrementa al cambiar la forma de las entidades guardadas, para no leer valores de otra versión
+CACHE_FORMAT_VERSION = 3
+
+_backend: Optional[CacheBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _cache_backend_name() -> str:
+    default = "redis" if os.getenv("REDIS_URL") else "none"
+    return os.getenv("CACHE_BACKEND", default).lower()
+
+
+def cache_enabled() -> bool:
+    """ Indica si la caché de repositorios está habilitada en la configuración. """
+    return _cache_backend_name() != "none"
+
+
+def _cache_ttl() -> float:
+    return float(os.getenv("CACHE_TTL", "300"))
+
+
+def build_cache_backend() -> CacheBackend:
+    """ Crea el almacén configurado en el entorno. """
+    name = _cache_backend_name()
+    if name == "memory":
+        return InMemoryCache(int(os.getenv("CACHE_MAX_ENTRIES", "10000")))
+    if name == "redis":
+        return RedisCache.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    raise ValueError(f"CACHE_BACKEND inválido: {name}. Debe ser 'memory', 'redis' o 'none'.")
+
+
+def get_cache_backend() -> Optional[CacheBackend]:
+    """ Almacén compartido por todas las cachés del proceso; se crea en el primer uso. """
+    global _backend
+    if not cache_enabled():
+        return None
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_cache_backend()
+    return _backend
+
+
+def set_cache_backend(backend: Optional[CacheBackend]) -> None:
+    """ Reemplaza el almacén compartido (por ejemplo, por un Redis falso en pruebas). """
+    global _backend
+    _backend = backend
+
+
+class RepositoryCache:
+    """
+    Espacio de nombres dentro del almacén compartido, con contadores de aciertos y fallos. El nombre es el
+    de la tabla cuya versión identifica las entradas.
+    """
+
+    def __init__(self, namespace: str, codec: EntityCodec):
+        self.namespace = namespace
+        self.codec = codec
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: object, version: int) -> str:
+        return f"{self.namespace}:v{CACHE_FORMAT_VERSION}:{version}:{key}"
+
+    def get_or_load(self, key: object, version: int, loader: Callable[[], T]) -> T:
+        """
+        Devuelve el valor guardado para la versión de la tabla indicada o lo carga y lo guarda. Los
+        resultados None no se guardan.
+
+        La versión es el contador de ``table_versions`` leído antes de cargar: una escritura lo incrementa,
+        así que las entradas anteriores dejan de leerse en todos los procesos. Una carga que coincide con
+        una escritura guarda su resultado bajo la versión leída antes, no bajo la que busca el resto.
+        """
+        backend = get_cache_backend()
+        if backend is None:
+            return loader()
+        cached = backend.get(self._key(key, version))
+        if cached is not None:
+            self.hits += 1
+            return self.codec.loads(cached)
+        self.misses += 1
+        value = loader()
+        if value is not None:
+            backend.set(self._key(key, version), self.codec.dumps(value), _cache_ttl())
+        return value
+
+    def stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+# Clave de la lista completa de departamentos
+ALL_DEPARTMENTS_KEY = "all"
+
+department_cache = RepositoryCache("departments", department_codec)
+author_cache = RepositoryCache("authors", author_codec)
+scopus_account_cache = RepositoryCache("scopus_accounts", scopus_account_codec)
+
+
+def cache_metrics() -> Dict[str, object]:
+    """ Contadores de cada caché y datos del almacén. """
+    backend = get_cache_backend()
+    return {
+        "enabled": backend is not None,
+        "store": backend_stats(backend) if backend is not None else None,
+        "caches": {cache.namespace: cache.stats() for cache in (department_cache, author_cache, scopus_account_cache)},
+    }
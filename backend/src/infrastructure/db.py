@@ -1,21 +1,186 @@
 import os
+import threading
+from typing import Optional
+
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from .pool_metrics import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from .sql_metrics import instrument_engine
 
 load_dotenv()
 
-database_url = os.getenv('DATABASE_URL')
-if not database_url:
-    raise ValueError("La variable de entorno no está configurada.")
+ENVIRONMENT = os.getenv('ENVIRONMENT', 'development').lower()
+
+# Modo de acceso a la BD de los controladores: "sync" (threadpool) o "async" (AsyncEngine)
+DB_MODE = os.getenv('DB_MODE', 'sync').lower()
+if DB_MODE not in ('sync', 'async'):
+    raise ValueError(f"DB_MODE inválido: {DB_MODE}. Debe ser 'sync' o 'async'.")
+
+# Drivers asíncronos equivalentes a los síncronos de DATABASE_URL
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+
+def get_database_url() -> str:
+    """ URL de DATABASE_URL; se lee al crear el primer motor, no al importar el módulo. """
+    url = os.getenv('DATABASE_URL')
+    if not url:
+        raise ValueError("La variable de entorno DATABASE_URL no está configurada.")
+    return url
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return default if value is None else value.lower() in ('1', 'true', 'yes')
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return default if value is None or value == '' else int(value)
+
+
+def engine_options(url: str, is_async: bool = False) -> dict:
+    """
+    Opciones del motor según el entorno.
+
+    Variables: DB_ECHO (por defecto activo solo fuera de producción), DB_POOL_SIZE, DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT, DB_POOL_PRE_PING, DB_POOL_RECYCLE, DB_STATEMENT_TIMEOUT_MS y DB_NULLPOOL.
+    Con DB_NULLPOOL=true no se mantiene pool propio (para usar detrás de PgBouncer en modo transacción);
+    en ese caso el statement_timeout debe configurarse en el rol o la base de datos.
+    """
+    production = ENVIRONMENT == 'production'
+    backend = make_url(url).get_backend_name()
+    options = {'echo': _env_bool('DB_ECHO', not production)}
+    if backend != 'postgresql':
+        return options
+
+    if _env_bool('DB_NULLPOOL', False):
+        options['poolclass'] = NullPool
+        if is_async:
+            # PgBouncer en modo transacción no admite sentencias preparadas con nombre
+            options['connect_args'] = {'prepared_statement_cache_size': 0, 'statement_cache_size': 0}
+        return options
+
+    options.update({
+        'poolclass': InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool,
+        'pool_size': _env_int('DB_POOL_SIZE', 10 if production else 5),
+        'max_overflow': _env_int('DB_MAX_OVERFLOW', 20 if production else 10),
+        'pool_timeout': _env_int('DB_POOL_TIMEOUT', 30),
+        'pool_pre_ping': _env_bool('DB_POOL_PRE_PING', True),
+        'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+    })
+    statement_timeout = _env_int('DB_STATEMENT_TIMEOUT_MS', 30000 if production else 0)
+    if statement_timeout > 0:
+        if is_async:
+            options['connect_args'] = {'server_settings': {'statement_timeout': str(statement_timeout)}}
+        else:
+            options['connect_args'] = {'options': f'-c statement_timeout={statement_timeout}'}
+    return options
+
+
+def _enable_sqlite_foreign_keys(sync_engine) -> None:
+    """ SQLite no aplica las claves foráneas salvo que se active en cada conexión. """
+    if sync_engine.dialect.name != 'sqlite':
+        return
+
+    @event.listens_for(sync_engine, 'connect')
+    def _set_pragma(dbapi_connection, _):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
 
-engine = create_engine(database_url, echo=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def create_db_engine(url: str):
+    """ Crea el motor síncrono con el perfil del entorno. """
+    db_engine = create_engine(url, **engine_options(url))
+    _enable_sqlite_foreign_keys(db_engine)
+    instrument_engine(db_engine)
+    return db_engine
+
+
+def to_async_url(url: str) -> str:
+    """ Convierte una URL de conexión síncrona en su equivalente con driver asíncrono. """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No hay un driver asíncrono configurado para '{backend}'.")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str):
+    """ Crea el motor asíncrono con el perfil del entorno. """
+    db_engine = create_async_engine(to_async_url(url), **engine_options(url, is_async=True))
+    _enable_sqlite_foreign_keys(db_engine.sync_engine)
+    instrument_engine(db_engine.sync_engine)
+    return db_engine
+
+
+# Motores y fábricas de sesiones de la aplicación: se crean en el primer uso, así importar el módulo
+# (herramientas, migraciones, benchmarks) no exige DATABASE_URL ni abre conexiones
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """ Motor síncrono de la aplicación. """
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_db_engine(get_database_url())
+    return _engine
+
+
+def get_session_factory() -> sessionmaker:
+    """ Fábrica de sesiones síncronas ligada al motor de la aplicación. """
+    global _session_factory
+    if _session_factory is None:
+        bound_engine = get_engine()
+        with _lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=bound_engine)
+    return _session_factory
+
+
+def get_async_engine() -> Optional[AsyncEngine]:
+    """ Motor asíncrono; solo existe en modo async, para no exigir asyncpg en modo sync. """
+    global _async_engine
+    if DB_MODE != 'async':
+        return None
+    if _async_engine is None:
+        with _lock:
+            if _async_engine is None:
+                _async_engine = create_async_db_engine(get_database_url())
+    return _async_engine
+
+
+def get_async_session_factory() -> Optional[async_sessionmaker]:
+    """ Fábrica de sesiones asíncronas; None en modo sync. """
+    global _async_session_factory
+    if _async_session_factory is None:
+        bound_engine = get_async_engine()
+        if bound_engine is None:
+            return None
+        with _lock:
+            if _async_session_factory is None:
+                _async_session_factory = async_sessionmaker(bind=bound_engine, class_=AsyncSession, autoflush=False)
+    return _async_session_factory
 
 
 # Obtener una sesión de base de datos
 def get_session():
-    session = SessionLocal()
+    session_factory = get_session_factory()
+    session = session_factory()
     try:
         yield session
     except Exception:
@@ -23,3 +188,14 @@ def get_session():
         raise
     finally:
         session.close()
+
+
+# Obtener una sesión asíncrona de base de datos
+async def get_async_session():
+    session_factory = get_async_session_factory()
+    async with session_factory() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
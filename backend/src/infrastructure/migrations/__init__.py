@@ -0,0 +1,104 @@
+"""
+Migraciones del esquema con Alembic.
+
+Los scripts están en ``versions/`` (``alembic revision --autogenerate -m "..."`` desde ``backend/`` crea uno
+nuevo). ``upgrade_database`` aplica los pendientes y se ejecuta como un paso aparte del despliegue
+(``python -m src.infrastructure.migrations upgrade``). Al iniciar, la API y los workers solo llaman a
+``check_schema_revision``, que compara la revisión guardada en la BD con la última de los scripts en una
+consulta, sin reflejar tablas.
+"""
+import logging
+import os
+from functools import lru_cache
+from typing import Optional
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Revisión equivalente al esquema que creaba ``Base.metadata.create_all`` antes de las migraciones, y sus tablas
+BASELINE_REVISION = "0001"
+BASELINE_TABLES = ("departments", "authors", "scopus_accounts")
+VERSION_TABLE = "alembic_version"
+
+
+class SchemaRevisionError(Exception):
+    """ La BD no está en la revisión que esperan los scripts de migración. """
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """ Configuración de Alembic con los scripts de este paquete y, si se indica, la conexión a migrar. """
+    config = Config()
+    config.set_main_option("script_location", MIGRATIONS_DIR)
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache(maxsize=1)
+def head_revision() -> str:
+    """ Última revisión de los scripts; se lee de los archivos, sin consultar la BD. """
+    heads = ScriptDirectory.from_config(alembic_config()).get_heads()
+    if len(heads) != 1:
+        raise SchemaRevisionError(f"Se esperaba una sola revisión final de migraciones y hay {len(heads)}: {heads}")
+    return heads[0]
+
+
+def current_revision(engine: Engine) -> Optional[str]:
+    """ Revisión guardada en la BD (una consulta); None si la BD aún no tiene la tabla de Alembic. """
+    with engine.connect() as connection:
+        try:
+            return connection.execute(text(f"SELECT version_num FROM {VERSION_TABLE}")).scalar()
+        except (OperationalError, ProgrammingError):
+            return None
+
+
+def check_schema_revision(engine: Engine) -> None:
+    """ Falla si la BD no está en la última revisión; reemplaza a ``create_all`` al iniciar. """
+    current, head = current_revision(engine), head_revision()
+    if current != head:
+        raise SchemaRevisionError(
+            f"La base de datos está en la revisión {current or '(sin migraciones)'} y la aplicación espera "
+            f"{head}. Ejecute: python -m src.infrastructure.migrations upgrade"
+        )
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    """
+    Aplica las migraciones hasta ``revision``.
+
+    Una BD creada por ``create_all`` antes de las migraciones (con tablas pero sin revisión) se marca en
+    la revisión inicial si tiene todas sus tablas; las revisiones siguientes agregan la columna de búsqueda
+    y las tablas nuevas. Si solo tiene algunas, no se reconoce su esquema y se lanza SchemaRevisionError.
+    """
+    if current_revision(engine) is None:
+        _stamp_legacy_baseline(engine)
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), revision)
+
+
+def _stamp_legacy_baseline(engine: Engine) -> None:
+    existing = set(inspect(engine).get_table_names())
+    present = [table for table in BASELINE_TABLES if table in existing]
+    if not present:
+        return
+    if len(present) != len(BASELINE_TABLES):
+        missing = ", ".join(table for table in BASELINE_TABLES if table not in existing)
+        raise SchemaRevisionError(
+            f"La BD no tiene revisión de migraciones ni el esquema inicial completo (faltan: {missing})."
+        )
+    logger.info("BD creada sin migraciones: se marca en la revisión %s", BASELINE_REVISION)
+    with engine.begin() as connection:
+        command.stamp(alembic_config(connection), BASELINE_REVISION)
+
+
+def downgrade_database(engine: Engine, revision: str) -> None:
+    """ Revierte las migraciones hasta ``revision``. """
+    with engine.begin() as connection:
+        command.downgrade(alembic_config(connection), revision)
@@ -0,0 +1,46 @@
+"""
+Migraciones del esquema desde la línea de comandos, como paso del despliegue previo a iniciar la API.
+
+Uso: ``python -m src.infrastructure.migrations [upgrade [REVISIÓN] | downgrade REVISIÓN | current | check]``
+(la BD se toma de DATABASE_URL). ``check`` termina con código 1 si la BD no está en la última revisión.
+"""
+import argparse
+import logging
+import sys
+
+from ..db import get_engine
+from . import (
+    SchemaRevisionError, check_schema_revision, current_revision, downgrade_database, head_revision, upgrade_database
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command")
+    upgrade = subcommands.add_parser("upgrade", help="Aplicar las migraciones pendientes")
+    upgrade.add_argument("revision", nargs="?", default="head")
+    downgrade = subcommands.add_parser("downgrade", help="Revertir hasta la revisión indicada")
+    downgrade.add_argument("revision")
+    subcommands.add_parser("current", help="Mostrar la revisión de la BD y la última de los scripts")
+    subcommands.add_parser("check", help="Verificar que la BD está en la última revisión")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    engine = get_engine()
+
+    if args.command == "downgrade":
+        downgrade_database(engine, args.revision)
+    elif args.command == "current":
+        print(f"BD: {current_revision(engine) or '(sin migraciones)'}  última: {head_revision()}")
+    elif args.command == "check":
+        try:
+            check_schema_revision(engine)
+        except SchemaRevisionError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        print(f"La BD está en la última revisión ({head_revision()}).")
+    else:
+        upgrade_database(engine, getattr(args, "revision", "head"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Entorno de Alembic.
+
+Migra la conexión que entrega ``upgrade_database`` (en ``config.attributes["connection"]``) o, desde la
+línea de comandos de Alembic, la BD de ``sqlalchemy.url`` o DATABASE_URL. Los modelos se importan para
+que ``alembic revision --autogenerate`` compare contra el esquema completo.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from src.infrastructure.db import get_database_url
+from src.infrastructure.models.base import Base
+from src.infrastructure.models import (  # noqa: F401 (registro de modelos)
+    department, author, scopus_account, publication, publication_stats, report, sync_watermark, table_version
+)
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name)
+target_metadata = Base.metadata
+
+
+def _database_url() -> str:
+    return config.get_main_option("sqlalchemy.url") or get_database_url()
+
+
+def _configure(connection) -> None:
+    dialect = connection.dialect.name
+
+    def include_object(obj, name, type_, reflected, compare_to):
+        # Los objetos con ddl_if para otro motor (p. ej. el índice trigram de PostgreSQL) no existen aquí
+        ddl_if = getattr(obj, "_ddl_if", None)
+        return ddl_if is None or ddl_if.dialect is None or ddl_if.dialect == dialect
+
+    # SQLite no admite ALTER de columnas: Alembic recrea la tabla en modo batch
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object,
+                      render_as_batch=dialect == "sqlite")
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_offline() -> None:
+    """ Genera el SQL de las migraciones sin conectarse (``alembic upgrade head --sql``). """
+    context.configure(url=_database_url(), target_metadata=target_metadata, literal_binds=True,
+                      dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _configure(connection)
+        return
+    engine = create_engine(_database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        _configure(connection)
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,69 @@
+"""Esquema inicial: departamentos, autores y cuentas Scopus
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 23:41:37.164290
+
+Corresponde a lo que creaba ``Base.metadata.create_all`` al iniciar la API antes de las migraciones. Las
+bases creadas así se marcan en esta revisión sin modificarlas (``python -m src.infrastructure.migrations
+upgrade`` lo detecta) y las revisiones siguientes agregan lo demás.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GENDER_VALUES = ('MASCULINO', 'FEMENINO')
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        postgresql.ENUM(*GENDER_VALUES, name='gender').create(bind)
+
+    op.create_table('departments',
+    sa.Column('dep_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('dep_code', sa.String(length=10), nullable=False),
+    sa.Column('dep_name', sa.String(length=110), nullable=False),
+    sa.Column('fac_name', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('dep_id'),
+    sa.UniqueConstraint('dep_code')
+    )
+    op.create_table('authors',
+    sa.Column('author_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('dni', sa.String(length=10), nullable=False),
+    sa.Column('title', sa.String(length=50), nullable=True),
+    sa.Column('first_name', sa.String(length=100), nullable=False),
+    sa.Column('last_name', sa.String(length=100), nullable=False),
+    sa.Column('birth_date', sa.Date(), nullable=False),
+    sa.Column('gender', sa.Enum(*GENDER_VALUES, name='gender').with_variant(
+        postgresql.ENUM(*GENDER_VALUES, name='gender', create_type=False), 'postgresql'), nullable=False),
+    sa.Column('position', sa.String(length=100), nullable=False),
+    sa.Column('department_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.dep_id'], ),
+    sa.PrimaryKeyConstraint('author_id'),
+    sa.UniqueConstraint('dni')
+    )
+    op.create_table('scopus_accounts',
+    sa.Column('scopus_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=False),
+    sa.Column('affiliation', sa.String(length=200), nullable=False),
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['author_id'], ['authors.author_id'], ),
+    sa.PrimaryKeyConstraint('scopus_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scopus_accounts')
+    op.drop_table('authors')
+    op.drop_table('departments')
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        postgresql.ENUM(*GENDER_VALUES, name='gender').drop(bind)
@@ -0,0 +1,67 @@
+"""Columna de búsqueda normalizada de autores e índice trigram
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 23:42:18.730455
+
+Agrega ``authors.search_name`` (nombre completo en minúsculas y sin tildes) y la completa para los autores
+existentes; en PostgreSQL crea además el índice trigram de las búsquedas por subcadena. Las bases en las que
+versiones anteriores de la API ya habían agregado la columna al iniciar solo completan las filas
+pendientes. Con ``--sql`` no se conecta a la BD y no puede completar la columna: ese caso requiere ejecutar
+``python -m src.infrastructure.migrations upgrade``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.infrastructure.search.normalization import full_search_name
+
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+authors = sa.table(
+    'authors',
+    sa.column('author_id', sa.Integer()),
+    sa.column('first_name', sa.String()),
+    sa.column('last_name', sa.String()),
+    sa.column('search_name', sa.String()),
+)
+
+
+def _backfill_search_names() -> None:
+    bind = op.get_bind()
+    pending = sa.select(authors.c.author_id, authors.c.first_name, authors.c.last_name).where(
+        authors.c.search_name.is_(None)
+    ).limit(BACKFILL_BATCH_SIZE)
+    update = sa.update(authors).where(authors.c.author_id == sa.bindparam('pk')).values(
+        search_name=sa.bindparam('normalized')
+    )
+    while rows := bind.execute(pending).all():
+        bind.execute(update, [
+            {'pk': row.author_id, 'normalized': full_search_name(row.first_name, row.last_name)} for row in rows
+        ])
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    offline = op.get_context().as_sql
+    if offline or 'search_name' not in {column['name'] for column in sa.inspect(bind).get_columns('authors')}:
+        op.add_column('authors', sa.Column('search_name', sa.String(length=201), nullable=True))
+    if bind.dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index('ix_authors_search_name_trgm', 'authors', ['search_name'], unique=False,
+                        postgresql_using='gin', postgresql_ops={'search_name': 'gin_trgm_ops'}, if_not_exists=True)
+    if not offline:
+        _backfill_search_names()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_authors_search_name_trgm', table_name='authors')
+    with op.batch_alter_table('authors') as batch_op:
+        batch_op.drop_column('search_name')
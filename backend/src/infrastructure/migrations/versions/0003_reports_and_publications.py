@@ -0,0 +1,159 @@
+"""Publicaciones, autorías, marcas de sincronización, estadísticas, reportes y versiones de tablas
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 23:43:02.518114
+
+Tablas de la ingesta de Scopus, las estadísticas materializadas, la cola de reportes y los contadores de
+versión. Se crean solo si no existen, para adoptar las bases de desarrollo que ya las tenían por
+``create_all``.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tipos ENUM de PostgreSQL (en otros motores, VARCHAR). Se guardan los nombres de los miembros
+ENUM_VALUES = {
+    'documenttypeenum': ('ARTICLE', 'CONFERENCE_PAPER', 'REVIEW', 'BOOK_CHAPTER', 'BOOK', 'EDITORIAL', 'LETTER',
+                         'NOTE', 'SHORT_SURVEY', 'ERRATUM', 'OTHER'),
+    'sourcetypeenum': ('SCOPUS', 'WOS', 'REGIONAL', 'MEMORY', 'BOOK', 'OTHER'),
+    'reporttypeenum': ('DRAFT', 'FINAL'),
+    'reportformatenum': ('XLSX', 'PDF', 'CSV'),
+    'reportstatusenum': ('PENDING', 'GENERATING', 'COMPLETED', 'FAILED', 'CANCELLED'),
+}
+
+
+def _enum(name: str) -> sa.Enum:
+    # Varias tablas comparten tipo: en PostgreSQL se crea una sola vez en upgrade(), no con cada tabla
+    values = ENUM_VALUES[name]
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), 'postgresql'
+    )
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        for name, values in ENUM_VALUES.items():
+            postgresql.ENUM(*values, name=name).create(bind, checkfirst=not op.get_context().as_sql)
+
+    op.create_table('publications',
+    sa.Column('pub_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('eid', sa.String(length=40), nullable=False),
+    sa.Column('doi', sa.String(length=255), nullable=True),
+    sa.Column('title', sa.String(length=1000), nullable=False),
+    sa.Column('publication_date', sa.Date(), nullable=True),
+    sa.Column('year', sa.Integer(), nullable=True),
+    sa.Column('source_title', sa.String(length=500), nullable=True),
+    sa.Column('document_type', _enum('documenttypeenum'), nullable=False),
+    sa.Column('source_type', _enum('sourcetypeenum'), nullable=False),
+    sa.Column('cited_by', sa.Integer(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.PrimaryKeyConstraint('pub_id'),
+    sa.UniqueConstraint('eid'),
+    if_not_exists=True
+    )
+    op.create_index('ix_publications_year', 'publications', ['year'], unique=False, if_not_exists=True)
+
+    op.create_table('authorships',
+    sa.Column('pub_id', sa.Integer(), nullable=False),
+    sa.Column('scopus_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['pub_id'], ['publications.pub_id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['scopus_id'], ['scopus_accounts.scopus_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('pub_id', 'scopus_id'),
+    if_not_exists=True
+    )
+    op.create_index('ix_authorships_scopus_id', 'authorships', ['scopus_id'], unique=False, if_not_exists=True)
+
+    op.create_table('sync_watermarks',
+    sa.Column('scopus_id', sa.Integer(), nullable=False),
+    sa.Column('username', sa.String(length=100), nullable=False),
+    sa.Column('loaded_after', sa.Date(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('document_count', sa.Integer(), nullable=False),
+    sa.Column('full_synced_on', sa.Date(), nullable=False),
+    sa.ForeignKeyConstraint(['scopus_id'], ['scopus_accounts.scopus_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('scopus_id'),
+    if_not_exists=True
+    )
+    op.create_table('department_publication_stats',
+    sa.Column('dep_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('document_type', _enum('documenttypeenum'), nullable=False),
+    sa.Column('source_type', _enum('sourcetypeenum'), nullable=False),
+    sa.Column('publications', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dep_id', 'year', 'document_type', 'source_type'),
+    if_not_exists=True
+    )
+    op.create_table('author_publication_stats',
+    sa.Column('author_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('document_type', _enum('documenttypeenum'), nullable=False),
+    sa.Column('source_type', _enum('sourcetypeenum'), nullable=False),
+    sa.Column('dep_id', sa.Integer(), nullable=False),
+    sa.Column('publications', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('author_id', 'year', 'document_type', 'source_type'),
+    if_not_exists=True
+    )
+    op.create_index('ix_author_publication_stats_dep_year', 'author_publication_stats', ['dep_id', 'year'],
+                    unique=False, if_not_exists=True)
+
+    op.create_table('reports',
+    sa.Column('report_id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('dep_id', sa.Integer(), nullable=False),
+    sa.Column('report_type', _enum('reporttypeenum'), nullable=False),
+    sa.Column('file_format', _enum('reportformatenum'), nullable=False),
+    sa.Column('status', _enum('reportstatusenum'), nullable=False),
+    sa.Column('year_from', sa.Integer(), nullable=True),
+    sa.Column('year_to', sa.Integer(), nullable=True),
+    sa.Column('data_version', sa.String(length=200), nullable=True),
+    sa.Column('processed', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=False),
+    sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+    sa.Column('file_path', sa.String(length=500), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('worker_id', sa.String(length=100), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['dep_id'], ['departments.dep_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('report_id'),
+    if_not_exists=True
+    )
+    op.create_index('ix_reports_dep_id', 'reports', ['dep_id'], unique=False, if_not_exists=True)
+    op.create_index('ix_reports_status_created_at', 'reports', ['status', 'created_at'], unique=False,
+                    if_not_exists=True)
+
+    op.create_table('table_versions',
+    sa.Column('table_name', sa.String(length=63), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('table_name'),
+    if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('table_versions')
+    op.drop_index('ix_reports_status_created_at', table_name='reports')
+    op.drop_index('ix_reports_dep_id', table_name='reports')
+    op.drop_table('reports')
+    op.drop_index('ix_author_publication_stats_dep_year', table_name='author_publication_stats')
+    op.drop_table('author_publication_stats')
+    op.drop_table('department_publication_stats')
+    op.drop_table('sync_watermarks')
+    op.drop_index('ix_authorships_scopus_id', table_name='authorships')
+    op.drop_table('authorships')
+    op.drop_index('ix_publications_year', table_name='publications')
+    op.drop_table('publications')
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        for name, values in ENUM_VALUES.items():
+            postgresql.ENUM(*values, name=name).drop(bind)
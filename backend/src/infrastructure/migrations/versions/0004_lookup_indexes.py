@@ -0,0 +1,46 @@
+"""Índices de búsqueda por departamento, autor y username de Scopus
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 23:45:09.689697
+
+``authors.department_id`` y ``scopus_accounts.author_id`` (claves foráneas) y ``scopus_accounts.username``
+se filtraban recorriendo la tabla completa. El índice de username es único, como la verificación que
+hace el servicio al crear y actualizar cuentas.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Usernames repetidos que se muestran si no se puede crear el índice único
+MAX_REPORTED_DUPLICATES = 20
+
+
+def _check_duplicate_usernames() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT username, COUNT(*) AS accounts FROM scopus_accounts GROUP BY username HAVING COUNT(*) > 1 "
+        f"ORDER BY username LIMIT {MAX_REPORTED_DUPLICATES}"
+    )).all()
+    if duplicates:
+        listed = ", ".join(f"{row.username} ({row.accounts})" for row in duplicates)
+        raise ValueError(f"Hay cuentas Scopus con el mismo username; elimine o corrija las repetidas: {listed}")
+
+
+def upgrade() -> None:
+    if not op.get_context().as_sql:
+        _check_duplicate_usernames()
+    op.create_index('ix_authors_department_id', 'authors', ['department_id'], unique=False)
+    op.create_index('ix_scopus_accounts_author_id', 'scopus_accounts', ['author_id'], unique=False)
+    op.create_index('ix_scopus_accounts_username', 'scopus_accounts', ['username'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scopus_accounts_username', table_name='scopus_accounts')
+    op.drop_index('ix_scopus_accounts_author_id', table_name='scopus_accounts')
+    op.drop_index('ix_authors_department_id', table_name='authors')
@@ -1,7 +1,7 @@
 """
 Modelo SQLAlchemy para la entidad Author.
 """
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index, DDL, event, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from .base import Base
 from ...domain.entities.author import Gender
@@ -19,8 +19,24 @@ class AuthorModel(Base):
     birth_date = Column(Date, nullable=False)
     gender = Column(SQLEnum(Gender), nullable=False)
     position = Column(String(100), nullable=False)
-    department_id = Column(Integer, ForeignKey('departments.dep_id'), nullable=False)
+    department_id = Column(Integer, ForeignKey('departments.dep_id'), nullable=False, index=True)
+    # Nombre completo normalizado (minúsculas, sin tildes) para búsquedas indexadas
+    search_name = Column(String(201), nullable=True)
 
     # Relaciones
     department = relationship("DepartmentModel", back_populates="authors")
-    scopus_accounts = relationship("ScopusAccountModel", back_populates="author", cascade="all, delete-orphan")
\ No newline at end of file
+    scopus_accounts = relationship("ScopusAccountModel", back_populates="author", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Índice trigram para búsquedas por subcadena; en otros motores se recurre a LIKE
+        Index(
+            "ix_authors_search_name_trgm", "search_name",
+            postgresql_using="gin", postgresql_ops={"search_name": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+event.listen(
+    AuthorModel.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -56,6 +56,15 @@ class ReportTypeEnum(enum.Enum):
 
 class ReportStatusEnum(enum.Enum):
     """Enumeración para estados de reportes."""
+    PENDING = "pending"
     GENERATING = "generating"
     COMPLETED = "completed"
-    FAILED = "failed"
\ No newline at end of file
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ReportFormatEnum(enum.Enum):
+    """Enumeración para formatos de archivo de reportes."""
+    XLSX = "xlsx"
+    PDF = "pdf"
+    CSV = "csv"
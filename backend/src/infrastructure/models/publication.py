@@ -0,0 +1,33 @@
+"""
+Modelos SQLAlchemy para las publicaciones y su autoría.
+"""
+from sqlalchemy import Column, Date, ForeignKey, Integer, String, Enum as SQLEnum
+from .base import Base, DocumentTypeEnum, SourceTypeEnum
+
+
+class PublicationModel(Base):
+    """Modelo para la tabla de publicaciones."""
+    __tablename__ = "publications"
+
+    pub_id = Column(Integer, primary_key=True, autoincrement=True)
+    eid = Column(String(40), unique=True, nullable=False)
+    doi = Column(String(255), nullable=True)
+    title = Column(String(1000), nullable=False)
+    publication_date = Column(Date, nullable=True)
+    year = Column(Integer, nullable=True, index=True)
+    source_title = Column(String(500), nullable=True)
+    document_type = Column(SQLEnum(DocumentTypeEnum), nullable=False)
+    source_type = Column(SQLEnum(SourceTypeEnum), nullable=False)
+    cited_by = Column(Integer, nullable=False, default=0)
+    # Huella de los campos anteriores; permite omitir la escritura si la publicación no cambió
+    content_hash = Column(String(64), nullable=False)
+
+
+class AuthorshipModel(Base):
+    """Modelo para la tabla de autoría: qué cuentas Scopus figuran en cada publicación."""
+    __tablename__ = "authorships"
+
+    pub_id = Column(Integer, ForeignKey('publications.pub_id', ondelete="CASCADE"), primary_key=True)
+    scopus_id = Column(
+        Integer, ForeignKey('scopus_accounts.scopus_id', ondelete="CASCADE"), primary_key=True, index=True
+    )
@@ -0,0 +1,38 @@
+"""
+Modelos SQLAlchemy para los conteos precalculados de publicaciones.
+
+Se mantienen en la misma transacción que las escrituras de publicaciones, autores y cuentas Scopus
+(ver repositories/publication_stats_repo_impl.py), de modo que las consultas de estadísticas leen
+solo las filas del resultado sin unir departamentos, autores, cuentas y publicaciones.
+"""
+from sqlalchemy import Column, Index, Integer, Enum as SQLEnum
+from .base import Base, DocumentTypeEnum, SourceTypeEnum
+
+
+class DepartmentPublicationStatsModel(Base):
+    """Publicaciones distintas de cada departamento por año, tipo de documento y tipo de fuente."""
+    __tablename__ = "department_publication_stats"
+
+    dep_id = Column(Integer, primary_key=True)
+    # 0 cuando la publicación no tiene fecha
+    year = Column(Integer, primary_key=True)
+    document_type = Column(SQLEnum(DocumentTypeEnum), primary_key=True)
+    source_type = Column(SQLEnum(SourceTypeEnum), primary_key=True)
+    publications = Column(Integer, nullable=False)
+
+
+class AuthorPublicationStatsModel(Base):
+    """Publicaciones de cada autor por año, tipo de documento y tipo de fuente."""
+    __tablename__ = "author_publication_stats"
+
+    author_id = Column(Integer, primary_key=True)
+    year = Column(Integer, primary_key=True)
+    document_type = Column(SQLEnum(DocumentTypeEnum), primary_key=True)
+    source_type = Column(SQLEnum(SourceTypeEnum), primary_key=True)
+    # Departamento del autor al calcular el conteo; se recalcula si el autor cambia de departamento
+    dep_id = Column(Integer, nullable=False)
+    publications = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_author_publication_stats_dep_year", "dep_id", "year"),
+    )
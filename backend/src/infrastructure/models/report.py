@@ -0,0 +1,38 @@
+"""
+Modelo SQLAlchemy para los reportes.
+
+La tabla es también la cola de trabajos: los workers toman las filas pendientes con
+SELECT ... FOR UPDATE SKIP LOCKED (ver repositories/report_repo_impl.py).
+"""
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text, Enum as SQLEnum
+from .base import Base, ReportFormatEnum, ReportStatusEnum, ReportTypeEnum
+
+
+class ReportModel(Base):
+    """Modelo para la tabla de reportes."""
+    __tablename__ = "reports"
+
+    report_id = Column(Integer, primary_key=True, autoincrement=True)
+    dep_id = Column(Integer, ForeignKey('departments.dep_id', ondelete="CASCADE"), nullable=False, index=True)
+    report_type = Column(SQLEnum(ReportTypeEnum), nullable=False)
+    file_format = Column(SQLEnum(ReportFormatEnum), nullable=False, default=ReportFormatEnum.XLSX)
+    status = Column(SQLEnum(ReportStatusEnum), nullable=False, default=ReportStatusEnum.PENDING)
+    year_from = Column(Integer, nullable=True)
+    year_to = Column(Integer, nullable=True)
+    data_version = Column(String(200), nullable=True)
+    processed = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=False, default=0)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    file_path = Column(String(500), nullable=True)
+    error = Column(Text, nullable=True)
+    # Worker que genera el reporte y su última señal; si deja de darla otro worker lo retoma
+    worker_id = Column(String(100), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Búsqueda del siguiente trabajo de la cola
+        Index("ix_reports_status_created_at", "status", "created_at"),
+    )
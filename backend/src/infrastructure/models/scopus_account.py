@@ -11,9 +11,9 @@ class ScopusAccountModel(Base):
     __tablename__ = "scopus_accounts"
 
     scopus_id = Column(Integer, primary_key=True, autoincrement=True)
-    username = Column(String(100), nullable=False)
+    username = Column(String(100), nullable=False, unique=True, index=True)
     affiliation = Column(String(200), nullable=False)
-    author_id = Column(Integer, ForeignKey('authors.author_id'), nullable=False)
+    author_id = Column(Integer, ForeignKey('authors.author_id'), nullable=False, index=True)
 
     # Relaciones
     author = relationship("AuthorModel", back_populates="scopus_accounts")
\ No newline at end of file
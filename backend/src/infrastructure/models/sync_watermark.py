@@ -0,0 +1,17 @@
+"""
+Modelo SQLAlchemy para las marcas de sincronización de cuentas Scopus.
+"""
+from sqlalchemy import Column, Date, ForeignKey, Integer, String
+from .base import Base
+
+
+class SyncWatermarkModel(Base):
+    """Modelo para la tabla de marcas de sincronización (una fila por cuenta Scopus)."""
+    __tablename__ = "sync_watermarks"
+
+    scopus_id = Column(Integer, ForeignKey('scopus_accounts.scopus_id', ondelete="CASCADE"), primary_key=True)
+    username = Column(String(100), nullable=False)
+    loaded_after = Column(Date, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    document_count = Column(Integer, nullable=False, default=0)
+    full_synced_on = Column(Date, nullable=False)
@@ -0,0 +1,10 @@
+from .base import Base
+from sqlalchemy import BigInteger, Column, String
+
+
+class TableVersionModel(Base):
+    """Modelo para la tabla de versiones: un contador por tabla que se incrementa en cada escritura."""
+    __tablename__ = "table_versions"
+
+    table_name = Column(String(63), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
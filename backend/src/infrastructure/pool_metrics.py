@@ -0,0 +1,73 @@
+""" Pools de conexiones instrumentados para dimensionar el pool a partir de datos. """
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class _PoolMetricsMixin:
+    """ Cuenta checkouts/checkins, errores de checkout (timeout o conexión) y mide la espera. """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.checkout_errors = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except Exception:
+            with self._metrics_lock:
+                self.checkout_errors += 1
+            raise
+        waited = time.perf_counter() - start
+        with self._metrics_lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        return record
+
+    def _do_return_conn(self, record):
+        with self._metrics_lock:
+            self.checkins += 1
+        super()._do_return_conn(record)
+
+
+class InstrumentedQueuePool(_PoolMetricsMixin, QueuePool):
+    """ QueuePool con métricas de uso. """
+
+
+class InstrumentedAsyncAdaptedQueuePool(_PoolMetricsMixin, AsyncAdaptedQueuePool):
+    """ AsyncAdaptedQueuePool con métricas de uso. """
+
+
+def pool_metrics(engine: Optional[Engine]) -> Optional[dict]:
+    """ Estado y métricas del pool de un motor; None si el motor no existe. """
+    if engine is None:
+        return None
+    pool = engine.pool
+    metrics = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        metrics.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checked_in": pool.checkedin(),
+        })
+    if isinstance(pool, _PoolMetricsMixin):
+        checkouts = pool.checkouts
+        metrics.update({
+            "checkouts": checkouts,
+            "checkins": pool.checkins,
+            "checkout_errors": pool.checkout_errors,
+            "wait_ms_avg": round(pool.wait_seconds_total / checkouts * 1000, 3) if checkouts else 0.0,
+            "wait_ms_max": round(pool.wait_seconds_max * 1000, 3),
+        })
+    return metrics
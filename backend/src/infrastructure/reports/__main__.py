@@ -0,0 +1,35 @@
+"""
+Workers de reportes como proceso independiente de la API.
+
+Uso: ``python -m src.infrastructure.reports [--workers N]`` (la API debe iniciarse con REPORT_WORKERS=0).
+"""
+import argparse
+import logging
+import signal
+import threading
+
+from ..db import get_engine, get_session_factory
+from ..migrations import check_schema_revision
+from ..models import (  # noqa: F401
+    department, author, scopus_account, publication, publication_stats, report, sync_watermark, table_version
+)
+from .worker import report_workers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=None, help="Reportes generados en paralelo")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    check_schema_revision(get_engine())
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    report_workers.start(get_session_factory(), args.workers)
+    stop.wait()
+    report_workers.stop()
+
+
+if __name__ == "__main__":
+    main()
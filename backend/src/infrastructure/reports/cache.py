@@ -0,0 +1,176 @@
+"""
+Caché en disco de los reportes generados.
+
+El nombre de cada archivo se deriva de los parámetros del reporte y de la versión de los datos de su
+departamento (ver ``department_data_key``), que se incrementa en la misma transacción que cualquier
+escritura de sus autores, cuentas o publicaciones. Así un reporte idéntico sobre datos sin cambios se
+sirve sin generarlo, y tras un cambio las entradas anteriores dejan de encontrarse; sus archivos se
+borran al guardar un reporte del departamento con una versión posterior. Los de versiones más nuevas que
+la del reporte guardado (generados por otro worker mientras este terminaba) se conservan.
+
+Cada reporte recibe su propio archivo en REPORTS_DIR, un enlace duro a la entrada de la caché (o una copia
+si el sistema de archivos no los admite): borrar o expulsar una entrada no afecta a los reportes
+completados que la usaron, y el espacio solo se libera cuando ya nadie la referencia.
+
+Se configura con REPORT_CACHE_DIR (por defecto ``<REPORTS_DIR>/cache``) y REPORT_CACHE_MAX_BYTES
+(1 GiB por defecto): al superarlo se eliminan los archivos usados hace más tiempo (la fecha de
+modificación se actualiza en cada acierto).
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from typing import Dict, Optional
+
+from ...domain.entities.report import Report
+from ...domain.repositories.report_file_cache import IReportFileCache
+from .generator import reports_dir
+
+# Se incrementa al cambiar el formato de los archivos generados, para no servir versiones anteriores
+RENDER_VERSION = 1
+
+
+def _digest(value: str, length: int) -> str:
+    return hashlib.sha256(value.encode()).hexdigest()[:length]
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    """Crea ``target`` como enlace duro de ``source``; lo copia si el sistema de archivos no lo permite."""
+    try:
+        os.link(source, target)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+class ReportFileCache(IReportFileCache):
+    """ Caché de archivos de reportes con expulsión LRU por tamaño total. """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def directory(self) -> str:
+        directory = self._directory or os.getenv("REPORT_CACHE_DIR") or os.path.join(reports_dir(), "cache")
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+    @property
+    def max_bytes(self) -> int:
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return int(os.getenv("REPORT_CACHE_MAX_BYTES", str(1024 ** 3)))
+
+    @staticmethod
+    def _data_version(report: Report) -> Optional[int]:
+        """Versión de los datos del reporte; None si no tiene (o es de antes de que fuera un contador)."""
+        if report.data_version is None or not report.data_version.isdigit():
+            return None
+        return int(report.data_version)
+
+    def _file_name(self, report: Report) -> Optional[str]:
+        """Nombre del archivo en caché (``<dep_id>-<versión>-<parámetros>``); None si no tiene versión."""
+        version = self._data_version(report)
+        if version is None:
+            return None
+        parameters = json.dumps(
+            [RENDER_VERSION, report.report_type, report.file_format, report.year_from, report.year_to]
+        )
+        return f"{report.dep_id}-{version}-{_digest(parameters, 24)}.{report.file_format}"
+
+    def get(self, report: Report) -> Optional[str]:
+        name = self._file_name(report)
+        if name is None:
+            return None
+        cached = os.path.join(self.directory, name)
+        own_path = os.path.join(
+            reports_dir(), f"reporte-{uuid.uuid4().hex[:16]}-{report.report_type}.{report.file_format}"
+        )
+        try:
+            # Otro proceso puede expulsar la entrada en cualquier momento: se enlaza antes de usarla
+            _link_or_copy(cached, own_path)
+            os.utime(cached)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return own_path
+
+    def put(self, report: Report, path: str) -> str:
+        name = self._file_name(report)
+        if name is None:
+            return path
+        target = os.path.join(self.directory, name)
+        staging = f"{target}.{uuid.uuid4().hex[:8]}.part"
+        _link_or_copy(path, staging)
+        os.replace(staging, target)
+        with self._lock:
+            self._drop_stale(report)
+            self._evict(keep=target)
+        return path
+
+    def _drop_stale(self, report: Report) -> None:
+        """Elimina los archivos del departamento generados con versiones anteriores de sus datos."""
+        department_prefix = f"{report.dep_id}-"
+        current_version = self._data_version(report)
+        for entry in os.scandir(self.directory):
+            if not entry.name.startswith(department_prefix) or entry.name.endswith(".part"):
+                continue
+            version = entry.name[len(department_prefix):].split("-", 1)[0]
+            # Los nombres sin versión numérica son del formato anterior de la caché
+            if not version.isdigit() or int(version) < current_version:
+                self._remove(entry.path)
+                self.invalidations += 1
+
+    def _evict(self, keep: str) -> None:
+        """Elimina los archivos menos usados hasta que el total quepa en el límite."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".part"):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                return
+            if path != keep:
+                self._remove(path)
+                self.evictions += 1
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, object]:
+        sizes = [entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file()]
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(sizes),
+            "bytes": sum(sizes),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+report_file_cache = ReportFileCache()
@@ -0,0 +1,89 @@
+"""
+Generación del archivo de un reporte de publicaciones de un departamento.
+
+Las filas se leen con un cursor del lado del servidor y se escriben en cuanto llegan, de modo que la
+memoria del worker no crece con el tamaño del reporte. El archivo se escribe con extensión ``.part`` y
+se renombra al terminar; cada AUTHORS_PER_STEP autores se informa el avance, y si este devuelve False
+(cancelación) se detiene la generación. Los archivos se guardan en REPORTS_DIR (por defecto un
+directorio en la carpeta temporal del sistema).
+"""
+import os
+import tempfile
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...domain.entities.report import Report
+from ..models.department import DepartmentModel
+from .source import count_authors, iter_report_rows
+from .writers import WRITERS
+
+# Autores entre dos registros de avance
+AUTHORS_PER_STEP = 50
+
+# Recibe (autores procesados, total) y devuelve False si hay que detener la generación
+ProgressCallback = Callable[[int, int], bool]
+
+
+class ReportCancelled(Exception):
+    """ La generación se detuvo porque se canceló el reporte. """
+    pass
+
+
+def reports_dir() -> str:
+    """ Directorio de los archivos generados; se crea si no existe. """
+    path = os.getenv("REPORTS_DIR", os.path.join(tempfile.gettempdir(), "di_reports"))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def media_type(file_format: str) -> str:
+    """ Tipo MIME del formato de reporte indicado. """
+    return WRITERS[file_format].media_type
+
+
+def _report_title(session: Session, report: Report) -> str:
+    departments = DepartmentModel.__table__
+    department = session.execute(
+        select(departments.c.dep_code, departments.c.dep_name).where(departments.c.dep_id == report.dep_id)
+    ).first()
+    title = f"Publicaciones - {department.dep_name} ({department.dep_code})" if department else "Publicaciones"
+    if report.year_from is not None or report.year_to is not None:
+        title += f" {report.year_from or ''}-{report.year_to or ''}"
+    return title
+
+
+def generate_report(session: Session, report: Report, progress: ProgressCallback) -> str:
+    """
+    Escribe el reporte en el formato solicitado y devuelve su ruta; lanza ReportCancelled si se cancela.
+
+    ``session`` solo se usa para leer y no se confirma durante el recorrido (el cursor del servidor se
+    cerraría); el avance debe registrarse con otra sesión.
+    """
+    total = count_authors(session, report.dep_id)
+    if not progress(0, total):
+        raise ReportCancelled()
+
+    writer_class = WRITERS[report.file_format]
+    path = os.path.join(reports_dir(), f"reporte-{report.report_id}-{report.report_type}.{writer_class.extension}")
+    partial_path = f"{path}.part"
+    try:
+        with writer_class(partial_path, _report_title(session, report), report.report_type == "draft") as writer:
+            processed = 0
+            current_author = None
+            for row in iter_report_rows(session, report):
+                if row.author_id != current_author:
+                    if current_author is not None:
+                        processed += 1
+                        if processed % AUTHORS_PER_STEP == 0 and not progress(processed, total):
+                            raise ReportCancelled()
+                    current_author = row.author_id
+                writer.write_row(row)
+        if not progress(total, total):
+            raise ReportCancelled()
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+    return path
@@ -0,0 +1,120 @@
+"""
+Escritor PDF mínimo que escribe cada página en el archivo en cuanto se completa.
+
+Solo usa las fuentes estándar Helvetica y Helvetica-Bold (sin incrustar) con WinAnsiEncoding, lo que
+basta para texto en español. En memoria quedan la página en curso y la posición de cada objeto
+escrito (para la tabla xref), no el contenido del documento.
+"""
+from typing import BinaryIO, List, Tuple
+
+# Tamaño A4 en puntos
+PAGE_WIDTH = 595.28
+PAGE_HEIGHT = 841.89
+
+REGULAR = "F1"
+BOLD = "F2"
+
+# Ancho medio aproximado de un carácter de Helvetica, en fracción del tamaño de la fuente
+_AVERAGE_CHAR_WIDTH = 0.52
+
+# Objetos reservados: catálogo, árbol de páginas y fuentes
+_CATALOG_ID = 1
+_PAGES_ID = 2
+_FONT_IDS = {REGULAR: 3, BOLD: 4}
+
+
+def _pdf_string(text: str) -> bytes:
+    """Cadena PDF literal en WinAnsiEncoding, con los delimitadores escapados."""
+    encoded = text.encode("cp1252", errors="replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def fit_text(text: str, width: float, size: float) -> str:
+    """Recorta el texto para que quepa aproximadamente en el ancho indicado."""
+    max_chars = int(width / (size * _AVERAGE_CHAR_WIDTH))
+    if len(text) <= max_chars:
+        return text
+    return text[:max(max_chars - 3, 0)].rstrip() + "..."
+
+
+class PdfPage:
+    """ Contenido de una página: líneas de texto en posiciones absolutas. """
+
+    def __init__(self):
+        self._operations: List[bytes] = []
+
+    def text(self, x: float, y: float, text: str, size: float = 9, font: str = REGULAR) -> None:
+        self._operations.append(
+            b"BT /%s %.1f Tf %.2f %.2f Td %s Tj ET" % (font.encode(), size, x, y, _pdf_string(text))
+        )
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, width: float = 0.5) -> None:
+        self._operations.append(b"%.2f w %.2f %.2f m %.2f %.2f l S" % (width, x1, y1, x2, y2))
+
+    def content(self) -> bytes:
+        return b"\n".join(self._operations)
+
+
+class PdfDocument:
+    """ Documento PDF escrito de forma incremental sobre un archivo binario. """
+
+    def __init__(self, output: BinaryIO, title: str = ""):
+        self.output = output
+        self.title = title
+        # Posición de cada objeto; los reservados se escriben al final
+        self._offsets: List[Tuple[int, int]] = []
+        self._page_ids: List[int] = []
+        self._next_id = max(_FONT_IDS.values()) + 1
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for name, object_id in _FONT_IDS.items():
+            base_font = b"Helvetica-Bold" if name == BOLD else b"Helvetica"
+            self._write_object(
+                object_id, b"<< /Type /Font /Subtype /Type1 /BaseFont /" + base_font + b" /Encoding /WinAnsiEncoding >>"
+            )
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_ids)
+
+    def _write(self, data: bytes) -> None:
+        self.output.write(data)
+
+    def _allocate(self) -> int:
+        object_id = self._next_id
+        self._next_id += 1
+        return object_id
+
+    def _write_object(self, object_id: int, body: bytes) -> None:
+        self._offsets.append((object_id, self.output.tell()))
+        self._write(b"%d 0 obj\n" % object_id + body + b"\nendobj\n")
+
+    def add_page(self, page: PdfPage) -> None:
+        """ Escribe la página y su contenido; después la página ya no se necesita. """
+        content = page.content()
+        content_id = self._allocate()
+        self._write_object(content_id, b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        page_id = self._allocate()
+        fonts = b" ".join(b"/%s %d 0 R" % (name.encode(), object_id) for name, object_id in _FONT_IDS.items())
+        self._write_object(page_id, (
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %.2f %.2f] /Resources << /Font << %s >> >> "
+            b"/Contents %d 0 R >>" % (_PAGES_ID, PAGE_WIDTH, PAGE_HEIGHT, fonts, content_id)
+        ))
+        self._page_ids.append(page_id)
+
+    def close(self) -> None:
+        """ Escribe el árbol de páginas, el catálogo y la tabla xref. """
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self._page_ids)
+        self._write_object(_PAGES_ID, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._page_ids)))
+        self._write_object(_CATALOG_ID, b"<< /Type /Catalog /Pages %d 0 R >>" % _PAGES_ID)
+        info_id = self._allocate()
+        self._write_object(info_id, b"<< /Title %s /Producer (DI Reports) >>" % _pdf_string(self.title))
+
+        xref_offset = self.output.tell()
+        offsets = dict(self._offsets)
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % self._next_id)
+        for object_id in range(1, self._next_id):
+            self._write(b"%010d 00000 n \n" % offsets[object_id])
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (self._next_id, _CATALOG_ID, info_id, xref_offset)
+        )
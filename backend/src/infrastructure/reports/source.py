@@ -0,0 +1,80 @@
+"""
+Filas de un reporte: cada autor del departamento con sus publicaciones.
+
+Se leen con un cursor del lado del servidor (``yield_per``), de modo que la memoria del worker no
+depende del tamaño del departamento. La sesión no debe confirmarse mientras se recorre el cursor.
+"""
+from typing import Iterator
+
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
+
+from ...domain.entities.report import Report
+from ..models.author import AuthorModel
+from ..models.publication import AuthorshipModel, PublicationModel
+from ..models.scopus_account import ScopusAccountModel
+
+# Filas por lote leído del cursor
+ROW_BATCH_SIZE = 1000
+
+
+def begin_snapshot(session: Session) -> None:
+    """
+    Hace que las lecturas siguientes de la sesión vean los mismos datos hasta que se cierre: en PostgreSQL
+    la transacción pasa a REPEATABLE READ. Debe llamarse antes de la primera consulta de la sesión.
+    En SQLite (motor de desarrollo) no se fija: cada consulta ve lo confirmado hasta ese momento.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+
+def count_authors(session: Session, dep_id: int) -> int:
+    """ Número de autores del departamento, para el avance del reporte. """
+    authors = AuthorModel.__table__
+    return session.execute(
+        select(func.count()).select_from(authors).where(authors.c.department_id == dep_id)
+    ).scalar_one()
+
+
+def iter_report_rows(session: Session, report: Report, batch_size: int = ROW_BATCH_SIZE) -> Iterator[Row]:
+    """
+    Recorre las filas del reporte ordenadas por autor.
+
+    Cada fila tiene los datos del autor (author_id, dni, last_name, first_name) y de una publicación
+    (year, title, source_title, document_type, source_type, doi, eid); los autores sin publicaciones
+    en el periodo aparecen una vez con los campos de publicación en None.
+    """
+    authors = AuthorModel.__table__
+    accounts = ScopusAccountModel.__table__
+    authorships = AuthorshipModel.__table__
+    publications = PublicationModel.__table__
+
+    # Una fila por autor y publicación aunque figuren varias cuentas del autor
+    author_publications = (
+        select(accounts.c.author_id, publications.c.pub_id).distinct()
+        .select_from(
+            accounts.join(authorships, authorships.c.scopus_id == accounts.c.scopus_id)
+            .join(publications, publications.c.pub_id == authorships.c.pub_id)
+        )
+        .where(accounts.c.author_id.in_(select(authors.c.author_id).where(authors.c.department_id == report.dep_id)))
+    )
+    if report.year_from is not None:
+        author_publications = author_publications.where(publications.c.year >= report.year_from)
+    if report.year_to is not None:
+        author_publications = author_publications.where(publications.c.year <= report.year_to)
+    author_publications = author_publications.subquery("author_publications")
+
+    query = (
+        select(authors.c.author_id, authors.c.dni, authors.c.last_name, authors.c.first_name,
+               publications.c.year, publications.c.title, publications.c.source_title, publications.c.document_type,
+               publications.c.source_type, publications.c.doi, publications.c.eid)
+        .select_from(
+            authors.outerjoin(author_publications, author_publications.c.author_id == authors.c.author_id)
+            .outerjoin(publications, publications.c.pub_id == author_publications.c.pub_id)
+        )
+        .where(authors.c.department_id == report.dep_id)
+        .order_by(authors.c.last_name, authors.c.first_name, authors.c.author_id,
+                  publications.c.year.desc(), publications.c.title, publications.c.eid)
+        .execution_options(yield_per=batch_size)
+    )
+    yield from session.execute(query)
@@ -0,0 +1,128 @@
+"""
+Workers que generan los reportes encolados en la tabla ``reports``.
+
+Cada worker es un hilo que toma un trabajo a la vez, de modo que REPORT_WORKERS limita cuántos
+reportes se generan en paralelo por proceso (y cuántas conexiones del pool ocupan).
+Con REPORT_WORKERS=0 la API solo encola y los reportes los genera otro proceso
+(``python -m src.infrastructure.reports``), sin competir con el tráfico interactivo.
+
+Sin trabajos, cada worker revisa la cola cada REPORT_POLL_SECONDS o en cuanto la API avisa de uno
+nuevo. Un reporte en generación cuyo worker no registra avance en REPORT_STALE_SECONDS vuelve a la cola.
+"""
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..repositories.report_repo_impl import ReportRepoImpl
+from ..repositories.table_version_repo_impl import TableVersionRepoImpl
+from .cache import report_file_cache
+from .generator import ReportCancelled, generate_report
+from .source import begin_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+def _poll_seconds() -> float:
+    return float(os.getenv("REPORT_POLL_SECONDS", "2"))
+
+
+def _stale_seconds() -> float:
+    return float(os.getenv("REPORT_STALE_SECONDS", "300"))
+
+
+class ReportWorkerPool:
+    """ Hilos que toman reportes pendientes de la cola y los generan. """
+
+    def __init__(self):
+        self.session_factory: Optional[Callable[[], Session]] = None
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._wake = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self, session_factory: Callable[[], Session], workers: Optional[int] = None) -> None:
+        """ Inicia los workers; REPORT_WORKERS (2 por defecto) fija cuántos si no se indica. """
+        if self.running:
+            return
+        workers = int(os.getenv("REPORT_WORKERS", "2")) if workers is None else workers
+        self.session_factory = session_factory
+        self._stopping.clear()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads = [
+            threading.Thread(target=self._loop, args=(f"{prefix}:{number}",), name=f"report-worker-{number}",
+                             daemon=True)
+            for number in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        if workers:
+            logger.info("%s workers de reportes iniciados", workers)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """ Detiene los workers; un reporte a medio generar vuelve a la cola al vencer su señal. """
+        self._stopping.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self) -> None:
+        """ Avisa a los workers de este proceso que hay un trabajo nuevo. """
+        self._wake.set()
+
+    def _loop(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = self.run_once(worker_id)
+            except Exception:
+                logger.exception("Error al tomar un reporte de la cola")
+                processed = False
+            if not processed:
+                self._wake.wait(_poll_seconds())
+                self._wake.clear()
+
+    def run_once(self, worker_id: str) -> bool:
+        """ Genera el siguiente reporte de la cola; devuelve False si no había ninguno. """
+        # El reporte se lee con su propia sesión: los commits del avance cerrarían el cursor del servidor
+        with self.session_factory() as session, self.session_factory() as data_session:
+            repository = ReportRepoImpl(session)
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=_stale_seconds())
+            report = repository.claim_next(worker_id, stale_before)
+            if report is None:
+                return False
+            # El archivo refleja los datos al generarlo, no al encolarlo: su clave en la caché es la versión
+            # leída en la misma instantánea que las filas del reporte
+            begin_snapshot(data_session)
+            report.data_version = TableVersionRepoImpl(data_session).department_data_version(report.dep_id)
+            # Otro worker pudo generar el mismo reporte mientras este esperaba en la cola
+            cached_path = report_file_cache.get(report)
+            if cached_path:
+                repository.finish(report.report_id, worker_id, "completed", file_path=cached_path)
+                return True
+            logger.info("Generando el reporte %s (departamento %s)", report.report_id, report.dep_id)
+            try:
+                path = generate_report(
+                    data_session, report,
+                    lambda processed, total: repository.update_progress(report.report_id, worker_id, processed, total)
+                )
+            except ReportCancelled:
+                repository.finish(report.report_id, worker_id, "cancelled")
+                logger.info("Reporte %s cancelado", report.report_id)
+            except Exception as e:
+                logger.exception("Error al generar el reporte %s", report.report_id)
+                repository.finish(report.report_id, worker_id, "failed", error=str(e))
+            else:
+                path = report_file_cache.put(report, path)
+                repository.finish(report.report_id, worker_id, "completed", file_path=path)
+            return True
+
+
+report_workers = ReportWorkerPool()
@@ -0,0 +1,182 @@
+"""
+Escritores de reportes por formato.
+
+Todos reciben las filas de ``source.iter_report_rows`` una a una y las escriben al archivo sin
+acumularlas: XLSX con el modo ``constant_memory`` de xlsxwriter (cada fila se vuelca al pasar a la
+siguiente) y PDF página a página con ``pdf.PdfDocument``.
+"""
+import csv
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import xlsxwriter
+from sqlalchemy import Row
+
+from .pdf import BOLD, PAGE_HEIGHT, PAGE_WIDTH, PdfDocument, PdfPage, fit_text
+
+HEADER = (
+    "DNI", "Apellidos", "Nombres", "Año", "Título", "Fuente", "Tipo de documento", "Tipo de fuente", "DOI", "EID",
+)
+
+DRAFT_LABEL = "BORRADOR"
+
+
+def _publication_values(row: Row) -> tuple:
+    """Valores de la publicación de la fila; vacío si el autor no tiene publicaciones."""
+    if row.eid is None:
+        return ()
+    return (
+        row.year, row.title, row.source_title, row.document_type.value, row.source_type.value, row.doi, row.eid,
+    )
+
+
+class ReportWriter(ABC):
+    """ Escritor incremental de un reporte. """
+
+    extension: str
+    media_type: str
+
+    def __init__(self, path: str, title: str, draft: bool):
+        self.path = path
+        self.title = title
+        self.draft = draft
+
+    @abstractmethod
+    def write_row(self, row: Row) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvReportWriter(ReportWriter):
+    """ Reporte en CSV (UTF-8). """
+
+    extension = "csv"
+    media_type = "text/csv"
+
+    def __init__(self, path: str, title: str, draft: bool):
+        super().__init__(path, title, draft)
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(HEADER)
+
+    def write_row(self, row: Row) -> None:
+        self._writer.writerow((row.dni, row.last_name, row.first_name) + _publication_values(row))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class XlsxReportWriter(ReportWriter):
+    """ Reporte en XLSX; en modo constant_memory las filas deben escribirse en orden. """
+
+    extension = "xlsx"
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    _COLUMN_WIDTHS = (12, 24, 24, 6, 60, 40, 18, 14, 28, 22)
+
+    def __init__(self, path: str, title: str, draft: bool):
+        super().__init__(path, title, draft)
+        self._workbook = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+        self._sheet = self._workbook.add_worksheet(DRAFT_LABEL.capitalize() if draft else "Reporte")
+        for column, width in enumerate(self._COLUMN_WIDTHS):
+            self._sheet.set_column(column, column, width)
+        bold = self._workbook.add_format({"bold": True})
+        self._sheet.write_string(0, 0, f"{title} ({DRAFT_LABEL})" if draft else title, bold)
+        self._sheet.write_row(1, 0, HEADER, bold)
+        self._sheet.freeze_panes(2, 0)
+        self._row = 2
+
+    def write_row(self, row: Row) -> None:
+        self._sheet.write_row(self._row, 0, (row.dni, row.last_name, row.first_name) + _publication_values(row))
+        self._row += 1
+
+    def close(self) -> None:
+        self._workbook.close()
+
+
+class PdfReportWriter(ReportWriter):
+    """ Reporte en PDF, agrupado por autor; cada página se escribe al llenarse. """
+
+    extension = "pdf"
+    media_type = "application/pdf"
+
+    MARGIN = 40
+    LINE_HEIGHT = 11
+    FONT_SIZE = 8
+    # Columnas de las publicaciones: año, tipo de documento y título
+    _YEAR_X = MARGIN + 8
+    _TYPE_X = MARGIN + 38
+    _TITLE_X = MARGIN + 130
+
+    def __init__(self, path: str, title: str, draft: bool):
+        super().__init__(path, title, draft)
+        self._file = open(path, "wb")
+        self._document = PdfDocument(self._file, title)
+        self._page: Optional[PdfPage] = None
+        self._y = 0.0
+        self._author_id = None
+
+    def _new_page(self) -> None:
+        self._flush_page()
+        self._page = PdfPage()
+        top = PAGE_HEIGHT - self.MARGIN
+        self._page.text(self.MARGIN, top, fit_text(self.title, PAGE_WIDTH - 2 * self.MARGIN - 80, 11), 11, BOLD)
+        if self.draft:
+            self._page.text(PAGE_WIDTH - self.MARGIN - 60, top, DRAFT_LABEL, 11, BOLD)
+        self._page.line(self.MARGIN, top - 6, PAGE_WIDTH - self.MARGIN, top - 6)
+        self._page.text(PAGE_WIDTH / 2 - 15, self.MARGIN / 2, f"Página {self._document.page_count + 1}", 7)
+        self._y = top - 22
+
+    def _flush_page(self) -> None:
+        if self._page is not None:
+            self._document.add_page(self._page)
+            self._page = None
+
+    def _reserve(self, lines: int) -> None:
+        """Abre una página nueva si no caben las líneas indicadas."""
+        if self._page is None or self._y - (lines - 1) * self.LINE_HEIGHT < self.MARGIN:
+            self._new_page()
+
+    def _next_line(self) -> float:
+        self._reserve(1)
+        y = self._y
+        self._y -= self.LINE_HEIGHT
+        return y
+
+    def write_row(self, row: Row) -> None:
+        if row.author_id != self._author_id:
+            self._author_id = row.author_id
+            if self._page is not None:
+                self._y -= 4
+            # El nombre del autor no queda solo al pie de una página
+            self._reserve(2)
+            self._page.text(self.MARGIN, self._next_line(), f"{row.last_name}, {row.first_name} - {row.dni}", 9, BOLD)
+        y = self._next_line()
+        if row.eid is None:
+            self._page.text(self._YEAR_X, y, "Sin publicaciones en el periodo.", self.FONT_SIZE)
+            return
+        self._page.text(self._YEAR_X, y, str(row.year or "s/f"), self.FONT_SIZE)
+        self._page.text(self._TYPE_X, y, fit_text(row.document_type.value, self._TITLE_X - self._TYPE_X - 6,
+                                                  self.FONT_SIZE), self.FONT_SIZE)
+        title = f"{row.title}. {row.source_title}" if row.source_title else row.title
+        self._page.text(self._TITLE_X, y, fit_text(title, PAGE_WIDTH - self.MARGIN - self._TITLE_X, self.FONT_SIZE),
+                        self.FONT_SIZE)
+
+    def close(self) -> None:
+        if self._page is None and self._document.page_count == 0:
+            self._new_page()
+        self._flush_page()
+        self._document.close()
+        self._file.close()
+
+
+WRITERS = {writer.extension: writer for writer in (XlsxReportWriter, PdfReportWriter, CsvReportWriter)}
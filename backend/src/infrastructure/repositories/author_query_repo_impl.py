@@ -0,0 +1,70 @@
+"""
+Implementación de las consultas de solo lectura de autores.
+
+Selecciona solo las columnas de la respuesta con Core, sin pasar por el mapa de identidad del ORM ni por
+las entidades de dominio: los datos leídos ya se validaron al escribirse.
+"""
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from ...domain.repositories.author_query_repository import IAuthorQueryRepository
+from .batching import chunked
+from ..models.author import AuthorModel
+from ..models.scopus_account import ScopusAccountModel
+
+
+class AuthorQueryRepoImpl(IAuthorQueryRepository):
+    """Consultas de listados de autores como filas planas."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_rows(self, department_id: Optional[int] = None, after_id: Optional[int] = None,
+                 limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Obtiene las filas de los autores y, con una consulta por bloque de IDs, sus cuentas Scopus."""
+        authors = AuthorModel.__table__
+        query = select(
+            authors.c.author_id, authors.c.dni, authors.c.title, authors.c.first_name, authors.c.last_name,
+            authors.c.birth_date, authors.c.gender, authors.c.position, authors.c.department_id
+        ).order_by(authors.c.author_id)
+        if department_id is not None:
+            query = query.where(authors.c.department_id == department_id)
+        if after_id is not None:
+            query = query.where(authors.c.author_id > after_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = [
+            {
+                "author_id": row.author_id,
+                "dni": row.dni,
+                "title": row.title,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "birth_date": row.birth_date,
+                "gender": row.gender,
+                "position": row.position,
+                "department_id": row.department_id,
+                "scopus_accounts": [],
+            }
+            for row in self.session.execute(query)
+        ]
+        self._attach_scopus_accounts(rows)
+        return rows
+
+    def _attach_scopus_accounts(self, rows: List[Dict[str, Any]]) -> None:
+        """Agrega a cada fila sus cuentas Scopus, ordenadas por ID."""
+        accounts = ScopusAccountModel.__table__
+        by_author = {row["author_id"]: row["scopus_accounts"] for row in rows}
+        for chunk in chunked(by_author):
+            result = self.session.execute(
+                select(accounts.c.author_id, accounts.c.scopus_id, accounts.c.username, accounts.c.affiliation)
+                .where(accounts.c.author_id.in_(chunk))
+                .order_by(accounts.c.scopus_id)
+            )
+            for account in result:
+                by_author[account.author_id].append({
+                    "scopus_id": account.scopus_id,
+                    "username": account.username,
+                    "affiliation": account.affiliation,
+                })
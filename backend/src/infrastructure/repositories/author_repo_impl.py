@@ -1,17 +1,58 @@
 """ Implementación del repositorio para la entidad Autor. """
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from ...domain.entities.author import Author
+from ...domain.entities.author_columns import AuthorColumns
+from ...domain.exceptions.domain_exceptions import DomainException
 from ...domain.repositories.author_repository import IAuthorRepository
 from ...domain.value_objects.author import DNI
+from .batching import chunked
+from .dialect import returning_previous
+from .publication_stats_repo_impl import refresh_publication_stats
+from .table_version_repo_impl import bump_table_versions
 from ..models.author import AuthorModel
+from ..models.scopus_account import ScopusAccountModel
+from ..search.normalization import full_search_name, name_tokens
+
+
+def _escape_like(token: str) -> str:
+    """Escapa los comodines de LIKE en un término de búsqueda."""
+    return token.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Filas leídas por lote al cargar el padrón por columnas
+ROSTER_BATCH_SIZE = 5000
+
+# Campos de la entidad y la columna que les corresponde
+_COLUMN_BY_FIELD = {
+    "dni": "dni",
+    "title": "title",
+    "name": "first_name",
+    "surname": "last_name",
+    "birth_date": "birth_date",
+    "gender": "gender",
+    "position": "position",
+    "department_id": "department_id",
+}
+
+
+def _to_column_values(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Convierte campos de la entidad Author en valores de columna."""
+    values = {_COLUMN_BY_FIELD[field]: value for field, value in fields.items()}
+    if isinstance(values.get("dni"), DNI):
+        values["dni"] = values["dni"].value
+    if "first_name" in values and "last_name" in values:
+        values["search_name"] = full_search_name(values["first_name"], values["last_name"])
+    return values
 
 
 def _to_domain_entity(author_db: AuthorModel) -> Author:
-    """Convierte un modelo de base de datos a entidad de dominio."""
+    """Convierte un modelo de base de datos a entidad de dominio (el DNI ya se validó al guardarlo)."""
     return Author(
         author_id=author_db.author_id,
-        dni=DNI(author_db.dni),
+        dni=DNI.trusted(author_db.dni),
         title=author_db.title,
         name=author_db.first_name,
         surname=author_db.last_name,
@@ -38,9 +79,11 @@ class AuthorRepoImpl(IAuthorRepository):
             birth_date=author.birth_date,
             gender=author.gender,
             position=author.position,
-            department_id=author.department_id
+            department_id=author.department_id,
+            search_name=full_search_name(author.name, author.surname)
         )
         self.session.add(author_db)
+        bump_table_versions(self.session, "authors", dep_ids=[author.department_id])
         self.session.commit()
         self.session.refresh(author_db)
 
@@ -48,11 +91,80 @@ class AuthorRepoImpl(IAuthorRepository):
         author.author_id = author_db.author_id
         return author
 
+    def bulk_create(self, authors: List[Author]) -> List[Author]:
+        """Crea varios autores con un INSERT multi-fila (executemany) y un solo commit."""
+        if not authors:
+            return []
+        rows = [
+            {
+                "dni": author.dni.value,
+                "title": author.title,
+                "first_name": author.name,
+                "last_name": author.surname,
+                "birth_date": author.birth_date,
+                "gender": author.gender,
+                "position": author.position,
+                "department_id": author.department_id,
+                "search_name": full_search_name(author.name, author.surname),
+            }
+            for author in authors
+        ]
+        try:
+            authors_table = AuthorModel.__table__
+            result = self.session.execute(
+                insert(authors_table).returning(authors_table.c.author_id, authors_table.c.dni), rows
+            )
+            ids_by_dni = {row.dni: row.author_id for row in result}
+            bump_table_versions(self.session, "authors", dep_ids=[row["department_id"] for row in rows])
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ValueError(f"No se pudo completar la carga masiva: {e.orig}")
+
+        for author in authors:
+            author.author_id = ids_by_dni[author.dni.value]
+        return authors
+
     def get_all(self) -> List[Author]:
         """Obtiene todos los autores."""
         authors = self.session.query(AuthorModel).all()
         return [_to_domain_entity(author_db) for author_db in authors]
 
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Author]:
+        """Obtiene una página de autores ordenada por ID (paginación keyset)."""
+        query = self.session.query(AuthorModel)
+        if after_id is not None:
+            query = query.filter(AuthorModel.author_id > after_id)
+        authors = query.order_by(AuthorModel.author_id).limit(limit).all()
+        return [_to_domain_entity(author_db) for author_db in authors]
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Author]]:
+        """Recorre todos los autores por lotes sin cargar la tabla completa en memoria."""
+        result = self.session.execute(
+            select(AuthorModel).order_by(AuthorModel.author_id).execution_options(yield_per=batch_size)
+        )
+        for partition in result.scalars().partitions():
+            yield [_to_domain_entity(author_db) for author_db in partition]
+
+    def get_columns(self, department_id: Optional[int] = None) -> AuthorColumns:
+        """
+        Carga los autores por columnas directamente desde las filas, sin el mapa de identidad del ORM.
+
+        Es un auxiliar de esta implementación para procesos masivos y herramientas de medición; no forma
+        parte de ``IAuthorRepository``.
+        """
+        authors = AuthorModel.__table__
+        query = select(
+            authors.c.author_id, authors.c.dni, authors.c.title, authors.c.first_name, authors.c.last_name,
+            authors.c.birth_date, authors.c.gender, authors.c.position, authors.c.department_id
+        ).order_by(authors.c.author_id)
+        if department_id is not None:
+            query = query.where(authors.c.department_id == department_id)
+        columns = AuthorColumns()
+        for row in self.session.execute(query.execution_options(yield_per=ROSTER_BATCH_SIZE)):
+            columns.append_values(*row)
+        return columns
+
     def get_by_id(self, author_id: int) -> Optional[Author]:
         """Obtiene un autor por su ID."""
         author_db = self.session.query(AuthorModel).filter(AuthorModel.author_id == author_id).first()
@@ -60,6 +172,19 @@ class AuthorRepoImpl(IAuthorRepository):
             return None
         return _to_domain_entity(author_db)
 
+    def get_by_ids(self, author_ids: List[int]) -> List[Author]:
+        """Obtiene varios autores por sus IDs en una sola consulta, respetando el orden recibido."""
+        if not author_ids:
+            return []
+        authors = self.session.query(AuthorModel).filter(AuthorModel.author_id.in_(set(author_ids))).all()
+        by_id = {author_db.author_id: author_db for author_db in authors}
+        return [_to_domain_entity(by_id[author_id]) for author_id in author_ids if author_id in by_id]
+
+    def get_name_entries(self) -> List[Tuple[int, str]]:
+        """Obtiene los pares (ID, nombre completo) de todos los autores."""
+        rows = self.session.query(AuthorModel.author_id, AuthorModel.first_name, AuthorModel.last_name).all()
+        return [(row.author_id, f"{row.first_name} {row.last_name}") for row in rows]
+
     def get_by_dni(self, dni: str) -> Optional[Author]:
         """Obtiene un autor por su DNI."""
         author_db = self.session.query(AuthorModel).filter(AuthorModel.dni == dni).first()
@@ -67,48 +192,115 @@ class AuthorRepoImpl(IAuthorRepository):
             return None
         return _to_domain_entity(author_db)
 
+    def get_existing_ids(self, author_ids: List[int]) -> Set[int]:
+        """Obtiene cuáles de los IDs indicados existen, con una consulta por bloque de valores."""
+        existing = set()
+        for chunk in chunked(author_ids):
+            rows = self.session.query(AuthorModel.author_id).filter(AuthorModel.author_id.in_(chunk)).all()
+            existing.update(row.author_id for row in rows)
+        return existing
+
+    def get_existing_dnis(self, dnis: List[str]) -> Set[str]:
+        """Obtiene cuáles de los DNIs indicados ya existen, con una consulta por bloque de valores."""
+        existing = set()
+        for chunk in chunked(dnis):
+            rows = self.session.query(AuthorModel.dni).filter(AuthorModel.dni.in_(chunk)).all()
+            existing.update(row.dni for row in rows)
+        return existing
+
     def get_by_department_id(self, department_id: int) -> List[Author]:
         """Obtiene autores por ID de departamento."""
         authors = self.session.query(AuthorModel).filter(AuthorModel.department_id == department_id).all()
         return [_to_domain_entity(author_db) for author_db in authors]
 
     def update(self, author: Author) -> Author:
-        """Actualiza un autor existente."""
-        author_db = self.session.query(AuthorModel).filter(AuthorModel.author_id == author.author_id).first()
-        if not author_db:
+        """Actualiza todos los campos de un autor existente."""
+        updated = self.update_fields(author.author_id, {field: getattr(author, field) for field in _COLUMN_BY_FIELD})
+        if not updated:
             raise ValueError("El autor no fue encontrado.")
+        return updated
 
-        author_db.dni = author.dni.value
-        author_db.title = author.title
-        author_db.first_name = author.name
-        author_db.last_name = author.surname
-        author_db.birth_date = author.birth_date
-        author_db.gender = author.gender
-        author_db.position = author.position
-        author_db.department_id = author.department_id
+    def update_fields(self, author_id: int, fields: Dict[str, Any]) -> Optional[Author]:
+        """
+        Actualiza los campos indicados con un único UPDATE ... RETURNING; None si el autor no existe.
 
-        self.session.commit()
-        self.session.refresh(author_db)
+        En PostgreSQL el departamento anterior sale del mismo UPDATE (ver ``returning_previous``).
+        """
+        values = _to_column_values(fields)
+        if not values:
+            return self.get_by_id(author_id)
+
+        authors_table = AuthorModel.__table__
+        statement = (
+            update(authors_table).where(authors_table.c.author_id == author_id).values(**values)
+            .returning(*authors_table.c)
+        )
+        if "department_id" in values:
+            # Si el autor cambia de departamento, el anterior también cambia de datos
+            statement = returning_previous(
+                self.session, statement, authors_table, "author_id", author_id, "department_id"
+            )
+        try:
+            row = self.session.execute(statement).first()
+            if row is None:
+                self.session.rollback()
+                return None
+            # La fila resultante se valida con las reglas de dominio antes de confirmar
+            author = _to_domain_entity(row)
+            if ("first_name" in values) != ("last_name" in values):
+                self.session.execute(
+                    update(authors_table).where(authors_table.c.author_id == author_id)
+                    .values(search_name=full_search_name(author.name, author.surname))
+                )
+            if "department_id" in values:
+                refresh_publication_stats(self.session, [author_id])
+            bump_table_versions(self.session, "authors",
+                                dep_ids=[author.department_id, getattr(row, "previous_department_id", None)])
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            if "dni" in values and "dni" in str(e.orig).lower():
+                raise ValueError(f"Ya existe un autor con DNI {values['dni']}")
+            raise ValueError(f"No se pudo actualizar el autor: {e.orig}")
+        except (ValueError, DomainException):
+            self.session.rollback()
+            raise
 
         return author
 
     def delete(self, author_id: int) -> None:
-        """Elimina un autor."""
-        author_db = self.session.query(AuthorModel).filter(AuthorModel.author_id == author_id).first()
-        if not author_db:
+        """Elimina un autor y sus cuentas Scopus con sentencias DELETE directas."""
+        authors_table = AuthorModel.__table__
+        accounts_table = ScopusAccountModel.__table__
+        self.session.execute(delete(accounts_table).where(accounts_table.c.author_id == author_id))
+        deleted = self.session.execute(
+            delete(authors_table).where(authors_table.c.author_id == author_id)
+            .returning(authors_table.c.department_id)
+        ).first()
+        if deleted is None:
+            self.session.rollback()
             raise ValueError("El autor no fue encontrado.")
-
-        self.session.delete(author_db)
+        # Las autorías de sus cuentas se eliminan en cascada
+        refresh_publication_stats(self.session, [author_id])
+        bump_table_versions(self.session, "authors", "scopus_accounts", "authorships", dep_ids=[deleted.department_id])
         self.session.commit()
 
-    def search_by_name(self, search_term: str) -> List[Author]:
-        """Busca autores por nombre completo (nombres y apellidos)."""
-        # Buscar por nombres, apellidos o nombre completo
-        search_pattern = f"%{search_term.strip()}%"
-        authors = self.session.query(AuthorModel).filter(
-            (AuthorModel.first_name.ilike(search_pattern)) |
-            (AuthorModel.last_name.ilike(search_pattern)) |
-            ((AuthorModel.first_name + ' ' + AuthorModel.last_name).ilike(search_pattern)) |
-            ((AuthorModel.last_name + ' ' + AuthorModel.first_name).ilike(search_pattern))
-        ).all()
-        return [_to_domain_entity(author_db) for author_db in authors]
+    def search_by_name(self, search_term: str, limit: Optional[int] = None) -> List[Author]:
+        """Busca autores por nombre completo (nombres y apellidos, en cualquier orden y sin tildes)."""
+        tokens = name_tokens(search_term)
+        if not tokens:
+            return []
+
+        # Cada palabra debe aparecer en el nombre normalizado; en PostgreSQL lo resuelve el índice trigram
+        query = self.session.query(AuthorModel)
+        for token in tokens:
+            query = query.filter(AuthorModel.search_name.like(f"%{_escape_like(token)}%", escape="\\"))
+
+        # Mismo orden que el índice de nombres en memoria (``name_rank``), en cualquier motor
+        phrase = " ".join(tokens)
+        starts_with = case((AuthorModel.search_name.like(f"{_escape_like(phrase)}%", escape="\\"), 0), else_=1)
+        query = query.order_by(starts_with, func.length(AuthorModel.search_name), AuthorModel.author_id)
+
+        if limit is not None:
+            query = query.limit(limit)
+        return [_to_domain_entity(author_db) for author_db in query.all()]
@@ -0,0 +1,14 @@
+""" Utilidades para consultas sobre conjuntos grandes de valores. """
+from typing import Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+# Máximo de valores por cláusula IN (asyncpg y SQLite limitan los parámetros por sentencia)
+IN_CLAUSE_CHUNK_SIZE = 10_000
+
+
+def chunked(values: Iterable[T], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[List[T]]:
+    """ Divide los valores (sin duplicados) en bloques de tamaño máximo ``size``. """
+    unique = list(dict.fromkeys(values))
+    for start in range(0, len(unique), size):
+        yield unique[start:start + size]
@@ -1,11 +1,26 @@
 """ Implementación del repositorio para la entidad Departamento. """
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Set
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from ...domain.entities.department import Department
+from ...domain.exceptions.domain_exceptions import DuplicateValueException
 from ...domain.repositories.department_repository import IDepartmentRepository
+from .batching import chunked
+from .table_version_repo_impl import bump_table_versions
 from ..models.department import DepartmentModel
 
 
+def _to_domain_entity(department_db: DepartmentModel) -> Department:
+    """Convierte un modelo de base de datos a entidad de dominio."""
+    return Department(
+        dep_id=department_db.dep_id,
+        dep_code=department_db.dep_code,
+        dep_name=department_db.dep_name,
+        fac_name=department_db.fac_name
+    )
+
+
 class DepartmentRepoImpl(IDepartmentRepository):
     """Implementación del repositorio de departamentos."""
 
@@ -20,6 +35,7 @@ class DepartmentRepoImpl(IDepartmentRepository):
             fac_name=department.fac_name
         )
         self.session.add(department_db)
+        bump_table_versions(self.session, "departments")
         self.session.commit()
         self.session.refresh(department_db)
 
@@ -29,44 +45,81 @@ class DepartmentRepoImpl(IDepartmentRepository):
 
     def get_all(self) -> List[Department]:
         departments = self.session.query(DepartmentModel).all()
-        return [
-            Department(
-                dep_id=dep.dep_id,
-                dep_code=dep.dep_code,
-                dep_name=dep.dep_name,
-                fac_name=dep.fac_name
-            ) for dep in departments
-        ]
+        return [_to_domain_entity(dep) for dep in departments]
+
+    def get_page(self, after_id: Optional[int], limit: int) -> List[Department]:
+        query = self.session.query(DepartmentModel)
+        if after_id is not None:
+            query = query.filter(DepartmentModel.dep_id > after_id)
+        departments = query.order_by(DepartmentModel.dep_id).limit(limit).all()
+        return [_to_domain_entity(dep) for dep in departments]
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[Department]]:
+        result = self.session.execute(
+            select(DepartmentModel).order_by(DepartmentModel.dep_id).execution_options(yield_per=batch_size)
+        )
+        for partition in result.scalars().partitions():
+            yield [_to_domain_entity(dep) for dep in partition]
 
     def get_by_id(self, dep_id: int) -> Department | None:
         department_db = self.session.query(DepartmentModel).filter(DepartmentModel.dep_id == dep_id).first()
         if not department_db:
             raise ValueError("El departamento no fue encontrado.")
-        return Department(
-            dep_id=department_db.dep_id,
-            dep_code=department_db.dep_code,
-            dep_name=department_db.dep_name,
-            fac_name=department_db.fac_name
-        )
+        return _to_domain_entity(department_db)
+
+    def get_existing_ids(self, dep_ids: List[int]) -> Set[int]:
+        existing = set()
+        for chunk in chunked(dep_ids):
+            rows = self.session.query(DepartmentModel.dep_id).filter(DepartmentModel.dep_id.in_(chunk)).all()
+            existing.update(row.dep_id for row in rows)
+        return existing
 
     def update(self, department: Department) -> Department:
-        department_db = self.session.query(DepartmentModel).filter(DepartmentModel.dep_id == department.dep_id).first()
-        if not department_db:
+        updated = self.update_fields(department.dep_id, {
+            "dep_code": department.dep_code,
+            "dep_name": department.dep_name,
+            "fac_name": department.fac_name,
+        })
+        if updated is None:
             raise ValueError("El departamento no fue encontrado.")
+        return updated
 
-        department_db.dep_code = department.dep_code
-        department_db.dep_name = department.dep_name
-        department_db.fac_name = department.fac_name
+    def update_fields(self, dep_id: int, fields: Dict[str, Any]) -> Optional[Department]:
+        """Actualiza los campos indicados con un único UPDATE ... RETURNING; None si no existe."""
+        if not fields:
+            department_db = self.session.get(DepartmentModel, dep_id)
+            return _to_domain_entity(department_db) if department_db else None
 
-        self.session.commit()
-        self.session.refresh(department_db)
-
-        return department
+        departments_table = DepartmentModel.__table__
+        try:
+            row = self.session.execute(
+                update(departments_table).where(departments_table.c.dep_id == dep_id).values(**fields)
+                .returning(*departments_table.c)
+            ).first()
+            if row is None:
+                self.session.rollback()
+                return None
+            bump_table_versions(self.session, "departments", dep_ids=[dep_id])
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            if "dep_code" in fields and "dep_code" in str(e.orig).lower():
+                raise DuplicateValueException(f"Ya existe un departamento con la sigla {fields['dep_code']}")
+            raise ValueError(f"No se pudo actualizar el departamento: {e.orig}")
+        return _to_domain_entity(row)
 
     def delete(self, dep_id: int) -> None:
-        department_db = self.session.query(DepartmentModel).filter(DepartmentModel.dep_id == dep_id).first()
-        if not department_db:
+        departments_table = DepartmentModel.__table__
+        try:
+            deleted = self.session.execute(
+                delete(departments_table).where(departments_table.c.dep_id == dep_id)
+                .returning(departments_table.c.dep_id)
+            ).first()
+        except IntegrityError:
+            self.session.rollback()
+            raise ValueError("No se puede eliminar el departamento porque tiene autores asociados.")
+        if deleted is None:
+            self.session.rollback()
             raise ValueError("El departamento no fue encontrado.")
-        else:
-            self.session.delete(department_db)
-            self.session.commit()
+        bump_table_versions(self.session, "departments")
+        self.session.commit()
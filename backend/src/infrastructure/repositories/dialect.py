@@ -0,0 +1,35 @@
+""" Sentencias que dependen del motor de base de datos. """
+from typing import Any
+from sqlalchemy import Table, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Update
+
+
+def upsert_insert(session: Session, table: Table):
+    """ INSERT con soporte de ON CONFLICT para el motor de la sesión (PostgreSQL o SQLite). """
+    if session.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
+
+
+def returning_previous(session: Session, statement: Update, table: Table, key_column: str, key: Any,
+                       column: str) -> Update:
+    """
+    Agrega al RETURNING de un UPDATE de la fila ``key`` el valor que tenía ``column`` antes de la
+    actualización, con la etiqueta ``previous_<column>``.
+
+    En PostgreSQL el UPDATE une en su FROM la fila anterior (leída con FOR UPDATE), así que el valor sale
+    de la misma sentencia. SQLite no admite en RETURNING columnas de las tablas del FROM y sus subconsultas
+    ya ven la fila actualizada: ahí se lee con un SELECT previo, dentro de la misma transacción.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        previous = (
+            select(table.c[key_column], table.c[column]).where(table.c[key_column] == key)
+            .with_for_update().subquery("previous")
+        )
+        return statement.where(table.c[key_column] == previous.c[key_column]).returning(
+            previous.c[column].label(f"previous_{column}")
+        )
+    value = session.execute(select(table.c[column]).where(table.c[key_column] == key)).scalar()
+    return statement.returning(literal(value, table.c[column].type).label(f"previous_{column}"))
@@ -0,0 +1,28 @@
+""" Clasificación de las violaciones de integridad que informa la base de datos. """
+from sqlalchemy.exc import IntegrityError
+
+# Códigos SQLSTATE de PostgreSQL (psycopg2 los expone como ``pgcode`` y el adaptador de asyncpg también)
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+def _sqlstate(error: IntegrityError):
+    return getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+
+
+def is_unique_violation(error: IntegrityError, column: str) -> bool:
+    """
+    Indica si el error es una clave única repetida en la columna indicada. El mensaje nombra la columna
+    en ambos motores: ``Key (<columna>)=...`` en PostgreSQL y ``UNIQUE constraint failed: <tabla>.<columna>``
+    en SQLite.
+    """
+    message = str(error.orig).lower()
+    state = _sqlstate(error)
+    is_unique = state == UNIQUE_VIOLATION if state else "unique constraint" in message
+    return is_unique and column.lower() in message
+
+
+def is_foreign_key_violation(error: IntegrityError) -> bool:
+    """ Indica si el error es una referencia a una fila que no existe (o que otra petición eliminó). """
+    state = _sqlstate(error)
+    return state == FOREIGN_KEY_VIOLATION if state else "foreign key constraint" in str(error.orig).lower()
@@ -0,0 +1,139 @@
+""" Implementación del repositorio para la entidad Publicación. """
+import hashlib
+from typing import Dict, List
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from ...domain.entities.publication import Publication
+from ...domain.repositories.publication_repository import AccountPublications, IPublicationRepository, SaveResult
+from .batching import chunked
+from .dialect import upsert_insert
+from .publication_stats_repo_impl import authors_of_accounts, authors_of_publications, refresh_publication_stats
+from .table_version_repo_impl import bump_table_versions
+from ..models.base import DocumentTypeEnum, SourceTypeEnum
+from ..models.publication import AuthorshipModel, PublicationModel
+
+# Filas por sentencia de escritura
+WRITE_CHUNK_SIZE = 1000
+
+# Columnas que se actualizan cuando la publicación ya existe
+_UPDATABLE_COLUMNS = (
+    "doi", "title", "publication_date", "year", "source_title", "document_type", "source_type", "cited_by",
+    "content_hash",
+)
+
+
+def content_hash(publication: Publication) -> str:
+    """Huella de los datos de una publicación."""
+    fields = (
+        publication.eid, publication.doi, publication.title, publication.publication_date,
+        publication.source_title, publication.document_type, publication.source_type, publication.cited_by,
+    )
+    return hashlib.sha256("\x1f".join("" if value is None else str(value) for value in fields).encode()).hexdigest()
+
+
+def _to_row(publication: Publication) -> dict:
+    """Convierte una entidad de dominio en los valores de la fila."""
+    return {
+        "eid": publication.eid,
+        "doi": publication.doi,
+        "title": publication.title,
+        "publication_date": publication.publication_date,
+        "year": publication.year,
+        "source_title": publication.source_title,
+        "document_type": DocumentTypeEnum(publication.document_type),
+        "source_type": SourceTypeEnum(publication.source_type),
+        "cited_by": publication.cited_by,
+        "content_hash": content_hash(publication),
+    }
+
+
+class PublicationRepoImpl(IPublicationRepository):
+    """Implementación del repositorio de publicaciones."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def save_account_publications(self, batch: List[AccountPublications]) -> SaveResult:
+        """Escribe solo las publicaciones nuevas o modificadas y actualiza la autoría de las cuentas del lote."""
+        if not batch:
+            return SaveResult()
+        rows_by_eid: Dict[str, dict] = {}
+        for account in batch:
+            for publication in account.publications:
+                rows_by_eid[publication.eid] = _to_row(publication)
+
+        try:
+            existing = self._get_hashes(list(rows_by_eid))
+            changed = [
+                row for eid, row in rows_by_eid.items() if existing.get(eid, (None, None))[1] != row["content_hash"]
+            ]
+            ids_by_eid = {eid: pub_id for eid, (pub_id, _) in existing.items()}
+            written_ids = self._upsert_publications(changed)
+            ids_by_eid.update(written_ids)
+
+            authorships_table = AuthorshipModel.__table__
+            replaced = [account.scopus_id for account in batch if account.replace]
+            for chunk in chunked(replaced):
+                self.session.execute(delete(authorships_table).where(authorships_table.c.scopus_id.in_(chunk)))
+            authorship_rows = [
+                {"pub_id": ids_by_eid[publication.eid], "scopus_id": account.scopus_id}
+                for account in batch for publication in account.publications
+            ]
+            for start in range(0, len(authorship_rows), WRITE_CHUNK_SIZE):
+                statement = upsert_insert(self.session, authorships_table).on_conflict_do_nothing()
+                self.session.execute(statement, authorship_rows[start:start + WRITE_CHUNK_SIZE])
+            # Cambian los conteos de los autores del lote y de los coautores de las publicaciones modificadas
+            refresh_publication_stats(self.session, list(
+                authors_of_accounts(self.session, [account.scopus_id for account in batch])
+                | authors_of_publications(self.session, list(written_ids.values()))
+            ))
+            document_counts = self._count_by_account([account.scopus_id for account in batch])
+            bump_table_versions(self.session, *(("publications", "authorships") if changed else ("authorships",)))
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return SaveResult(written=len(changed), unchanged=len(rows_by_eid) - len(changed),
+                          document_counts=document_counts)
+
+    def _count_by_account(self, scopus_ids: List[int]) -> Dict[int, int]:
+        """Publicaciones distintas de cada cuenta según su autoría (0 si no tiene ninguna)."""
+        authorships_table = AuthorshipModel.__table__
+        counts = {scopus_id: 0 for scopus_id in scopus_ids}
+        for chunk in chunked(scopus_ids):
+            rows = self.session.execute(
+                select(authorships_table.c.scopus_id, func.count().label("documents"))
+                .where(authorships_table.c.scopus_id.in_(chunk)).group_by(authorships_table.c.scopus_id)
+            ).all()
+            counts.update({row.scopus_id: row.documents for row in rows})
+        return counts
+
+    def _get_hashes(self, eids: List[str]) -> Dict[str, tuple]:
+        """ID y huella de las publicaciones ya registradas, por EID."""
+        publications_table = PublicationModel.__table__
+        existing = {}
+        for chunk in chunked(eids):
+            rows = self.session.execute(
+                select(publications_table.c.eid, publications_table.c.pub_id, publications_table.c.content_hash)
+                .where(publications_table.c.eid.in_(chunk))
+            ).all()
+            existing.update({row.eid: (row.pub_id, row.content_hash) for row in rows})
+        return existing
+
+    def _upsert_publications(self, rows: List[dict]) -> Dict[str, int]:
+        """INSERT ... ON CONFLICT (eid) DO UPDATE por bloques; devuelve el ID de cada EID."""
+        publications_table = PublicationModel.__table__
+        ids_by_eid: Dict[str, int] = {}
+        for start in range(0, len(rows), WRITE_CHUNK_SIZE):
+            chunk = rows[start:start + WRITE_CHUNK_SIZE]
+            statement = upsert_insert(self.session, publications_table)
+            statement = statement.on_conflict_do_update(
+                index_elements=[publications_table.c.eid],
+                set_={column: statement.excluded[column] for column in _UPDATABLE_COLUMNS}
+            ).returning(publications_table.c.pub_id, publications_table.c.eid)
+            result = self.session.execute(statement, chunk)
+            ids_by_eid.update({row.eid: row.pub_id for row in result})
+        return ids_by_eid
+
+    def count(self) -> int:
+        return self.session.execute(select(func.count()).select_from(PublicationModel.__table__)).scalar_one()
@@ -0,0 +1,176 @@
+""" Implementación del repositorio de estadísticas de publicaciones. """
+from typing import Iterable, List, Optional, Set
+from sqlalchemy import delete, distinct, func, insert, select
+from sqlalchemy.orm import Session
+from ...domain.entities.publication_stat import PublicationStat
+from ...domain.repositories.publication_stats_repository import IPublicationStatsRepository
+from .batching import chunked
+from .table_version_repo_impl import bump_table_versions
+from ..models.author import AuthorModel
+from ..models.publication import AuthorshipModel, PublicationModel
+from ..models.publication_stats import AuthorPublicationStatsModel, DepartmentPublicationStatsModel
+from ..models.scopus_account import ScopusAccountModel
+
+_STATS_COLUMNS = ("year", "document_type", "source_type", "publications")
+
+
+def _aggregate(*group_columns):
+    """SELECT que cuenta publicaciones distintas agrupadas por las columnas indicadas, año y tipos."""
+    authorships = AuthorshipModel.__table__
+    accounts = ScopusAccountModel.__table__
+    authors = AuthorModel.__table__
+    publications = PublicationModel.__table__
+    year = func.coalesce(publications.c.year, 0)
+    return (
+        select(*group_columns, year, publications.c.document_type, publications.c.source_type,
+               func.count(distinct(publications.c.pub_id)))
+        .select_from(
+            authorships.join(accounts, accounts.c.scopus_id == authorships.c.scopus_id)
+            .join(authors, authors.c.author_id == accounts.c.author_id)
+            .join(publications, publications.c.pub_id == authorships.c.pub_id)
+        )
+        .group_by(*group_columns, year, publications.c.document_type, publications.c.source_type)
+    )
+
+
+def _refresh_authors(session: Session, author_ids: Optional[List[int]]) -> None:
+    """Recalcula los conteos de los autores indicados (todos si es None)."""
+    stats_table = AuthorPublicationStatsModel.__table__
+    authors = AuthorModel.__table__
+    aggregate = _aggregate(authors.c.department_id, authors.c.author_id)
+    columns = ["dep_id", "author_id", *_STATS_COLUMNS]
+    if author_ids is None:
+        session.execute(delete(stats_table))
+        session.execute(insert(stats_table).from_select(columns, aggregate))
+        return
+    for chunk in chunked(author_ids):
+        session.execute(delete(stats_table).where(stats_table.c.author_id.in_(chunk)))
+        session.execute(insert(stats_table).from_select(columns, aggregate.where(authors.c.author_id.in_(chunk))))
+
+
+def _refresh_departments(session: Session, dep_ids: Optional[Iterable[int]]) -> None:
+    """Recalcula los conteos de los departamentos indicados (todos si es None)."""
+    stats_table = DepartmentPublicationStatsModel.__table__
+    authors = AuthorModel.__table__
+    aggregate = _aggregate(authors.c.department_id)
+    columns = ["dep_id", *_STATS_COLUMNS]
+    if dep_ids is None:
+        session.execute(delete(stats_table))
+        session.execute(insert(stats_table).from_select(columns, aggregate))
+        return
+    for chunk in chunked(dep_ids):
+        session.execute(delete(stats_table).where(stats_table.c.dep_id.in_(chunk)))
+        session.execute(insert(stats_table).from_select(columns, aggregate.where(authors.c.department_id.in_(chunk))))
+
+
+def _departments_of(session: Session, author_ids: List[int]) -> Set[int]:
+    """Departamentos actuales de los autores y aquellos en los que figuraban en los conteos."""
+    authors = AuthorModel.__table__
+    stats_table = AuthorPublicationStatsModel.__table__
+    dep_ids = set()
+    for chunk in chunked(author_ids):
+        dep_ids.update(session.execute(
+            select(authors.c.department_id).where(authors.c.author_id.in_(chunk))
+            .union(select(stats_table.c.dep_id).where(stats_table.c.author_id.in_(chunk)))
+        ).scalars())
+    return dep_ids
+
+
+def refresh_publication_stats(session: Session, author_ids: List[int]) -> None:
+    """
+    Recalcula los conteos de los autores indicados y de sus departamentos dentro de la transacción en curso.
+
+    Los RepoImpl la llaman antes de confirmar las escrituras que cambian publicaciones, autoría, cuentas
+    Scopus o el departamento de un autor; el costo es proporcional a las publicaciones de los
+    departamentos afectados y no al total de la base.
+    """
+    if not author_ids:
+        return
+    # Los departamentos se leen antes de recalcular, para incluir el anterior si el autor cambió de departamento
+    dep_ids = _departments_of(session, author_ids)
+    _refresh_authors(session, author_ids)
+    _refresh_departments(session, dep_ids)
+    bump_table_versions(session, "publication_stats", dep_ids=dep_ids)
+
+
+def authors_of_publications(session: Session, pub_ids: List[int]) -> Set[int]:
+    """Autores con alguna cuenta Scopus en las publicaciones indicadas."""
+    authorships = AuthorshipModel.__table__
+    accounts = ScopusAccountModel.__table__
+    author_ids = set()
+    for chunk in chunked(pub_ids):
+        author_ids.update(session.execute(
+            select(accounts.c.author_id).distinct()
+            .join(authorships, authorships.c.scopus_id == accounts.c.scopus_id)
+            .where(authorships.c.pub_id.in_(chunk))
+        ).scalars())
+    return author_ids
+
+
+def authors_of_accounts(session: Session, scopus_ids: List[int]) -> Set[int]:
+    """Autores de las cuentas Scopus indicadas."""
+    accounts = ScopusAccountModel.__table__
+    author_ids = set()
+    for chunk in chunked(scopus_ids):
+        author_ids.update(session.execute(
+            select(accounts.c.author_id).distinct().where(accounts.c.scopus_id.in_(chunk))
+        ).scalars())
+    return author_ids
+
+
+def _filter_years(query, stats_table, year_from: Optional[int], year_to: Optional[int]):
+    """Agrega el rango de años a la consulta."""
+    if year_from is not None:
+        query = query.where(stats_table.c.year >= year_from)
+    if year_to is not None:
+        query = query.where(stats_table.c.year <= year_to)
+    return query
+
+
+def _to_domain_entity(row, author_id: Optional[int] = None) -> PublicationStat:
+    """Convierte una fila en entidad de dominio."""
+    return PublicationStat(
+        dep_id=row.dep_id,
+        author_id=author_id,
+        year=row.year,
+        document_type=row.document_type.value,
+        source_type=row.source_type.value,
+        publications=row.publications
+    )
+
+
+class PublicationStatsRepoImpl(IPublicationStatsRepository):
+    """Implementación del repositorio de estadísticas de publicaciones."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_department_stats(self, dep_id: int, year_from: Optional[int] = None,
+                             year_to: Optional[int] = None) -> List[PublicationStat]:
+        stats_table = DepartmentPublicationStatsModel.__table__
+        query = _filter_years(select(stats_table).where(stats_table.c.dep_id == dep_id), stats_table, year_from, year_to)
+        rows = self.session.execute(
+            query.order_by(stats_table.c.year, stats_table.c.document_type, stats_table.c.source_type)
+        ).all()
+        return [_to_domain_entity(row) for row in rows]
+
+    def get_author_stats(self, dep_id: int, year_from: Optional[int] = None,
+                         year_to: Optional[int] = None) -> List[PublicationStat]:
+        stats_table = AuthorPublicationStatsModel.__table__
+        query = _filter_years(select(stats_table).where(stats_table.c.dep_id == dep_id), stats_table, year_from, year_to)
+        rows = self.session.execute(
+            query.order_by(stats_table.c.author_id, stats_table.c.year, stats_table.c.document_type,
+                           stats_table.c.source_type)
+        ).all()
+        return [_to_domain_entity(row, row.author_id) for row in rows]
+
+    def rebuild(self) -> None:
+        try:
+            _refresh_authors(self.session, None)
+            _refresh_departments(self.session, None)
+            bump_table_versions(self.session, "publication_stats")
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
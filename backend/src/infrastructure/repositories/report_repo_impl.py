@@ -0,0 +1,163 @@
+""" Implementación del repositorio para la entidad Reporte. """
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import and_, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+from ...domain.entities.report import Report
+from ...domain.repositories.report_repository import IReportRepository
+from ..models.base import ReportFormatEnum, ReportStatusEnum, ReportTypeEnum
+from ..models.report import ReportModel
+
+_ACTIVE_STATUSES = (ReportStatusEnum.PENDING, ReportStatusEnum.GENERATING)
+
+
+def _to_domain_entity(row) -> Report:
+    """Convierte una fila en entidad de dominio."""
+    return Report(
+        report_id=row.report_id,
+        dep_id=row.dep_id,
+        report_type=row.report_type.value,
+        file_format=row.file_format.value,
+        status=row.status.value,
+        year_from=row.year_from,
+        year_to=row.year_to,
+        data_version=row.data_version,
+        processed=row.processed,
+        total=row.total,
+        cancel_requested=row.cancel_requested,
+        file_path=row.file_path,
+        error=row.error,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at
+    )
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ReportRepoImpl(IReportRepository):
+    """Implementación del repositorio de reportes."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def create(self, report: Report) -> Report:
+        """Registra el reporte; si ya viene completado (servido desde la caché) no pasa por la cola."""
+        reports_table = ReportModel.__table__
+        now = _now()
+        completed = report.status == ReportStatusEnum.COMPLETED.value
+        row = self.session.execute(
+            insert(reports_table).values(
+                dep_id=report.dep_id,
+                report_type=ReportTypeEnum(report.report_type),
+                file_format=ReportFormatEnum(report.file_format),
+                status=ReportStatusEnum(report.status),
+                year_from=report.year_from,
+                year_to=report.year_to,
+                data_version=report.data_version,
+                processed=report.processed,
+                total=report.total,
+                cancel_requested=False,
+                file_path=report.file_path,
+                created_at=now,
+                started_at=now if completed else None,
+                finished_at=now if completed else None
+            ).returning(*reports_table.c)
+        ).first()
+        self.session.commit()
+        return _to_domain_entity(row)
+
+    def get_by_id(self, report_id: int) -> Optional[Report]:
+        reports_table = ReportModel.__table__
+        row = self.session.execute(select(reports_table).where(reports_table.c.report_id == report_id)).first()
+        return _to_domain_entity(row) if row else None
+
+    def get_recent(self, dep_id: Optional[int], limit: int) -> List[Report]:
+        reports_table = ReportModel.__table__
+        query = select(reports_table)
+        if dep_id is not None:
+            query = query.where(reports_table.c.dep_id == dep_id)
+        rows = self.session.execute(query.order_by(reports_table.c.report_id.desc()).limit(limit)).all()
+        return [_to_domain_entity(row) for row in rows]
+
+    def count_active(self, dep_id: int) -> int:
+        reports_table = ReportModel.__table__
+        return self.session.execute(
+            select(func.count()).select_from(reports_table)
+            .where(reports_table.c.dep_id == dep_id, reports_table.c.status.in_(_ACTIVE_STATUSES))
+        ).scalar_one()
+
+    def request_cancel(self, report_id: int) -> Optional[Report]:
+        reports_table = ReportModel.__table__
+        by_id = reports_table.c.report_id == report_id
+        row = self.session.execute(
+            update(reports_table).where(by_id, reports_table.c.status == ReportStatusEnum.PENDING)
+            .values(status=ReportStatusEnum.CANCELLED, finished_at=_now())
+            .returning(*reports_table.c)
+        ).first()
+        if row is None:
+            # En generación: el worker lo detiene en su siguiente registro de avance
+            row = self.session.execute(
+                update(reports_table).where(by_id, reports_table.c.status == ReportStatusEnum.GENERATING)
+                .values(cancel_requested=True)
+                .returning(*reports_table.c)
+            ).first()
+        self.session.commit()
+        return _to_domain_entity(row) if row else self.get_by_id(report_id)
+
+    def claim_next(self, worker_id: str, stale_before: datetime) -> Optional[Report]:
+        """
+        SELECT ... FOR UPDATE SKIP LOCKED elige el trabajo sin esperar a otros workers; el UPDATE
+        condicionado al mismo estado lo asegura también en motores sin SKIP LOCKED (SQLite).
+        """
+        reports_table = ReportModel.__table__
+        claimable = or_(
+            reports_table.c.status == ReportStatusEnum.PENDING,
+            and_(reports_table.c.status == ReportStatusEnum.GENERATING, reports_table.c.heartbeat_at < stale_before),
+        )
+        try:
+            report_id = self.session.execute(
+                select(reports_table.c.report_id).where(claimable)
+                .order_by(reports_table.c.created_at, reports_table.c.report_id)
+                .limit(1).with_for_update(skip_locked=True)
+            ).scalar()
+            if report_id is None:
+                self.session.rollback()
+                return None
+            now = _now()
+            row = self.session.execute(
+                update(reports_table).where(reports_table.c.report_id == report_id, claimable)
+                .values(status=ReportStatusEnum.GENERATING, worker_id=worker_id, heartbeat_at=now, started_at=now,
+                        processed=0, total=0)
+                .returning(*reports_table.c)
+            ).first()
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return _to_domain_entity(row) if row else None
+
+    def update_progress(self, report_id: int, worker_id: str, processed: int, total: int) -> bool:
+        reports_table = ReportModel.__table__
+        row = self.session.execute(
+            update(reports_table)
+            .where(reports_table.c.report_id == report_id, reports_table.c.worker_id == worker_id,
+                   reports_table.c.status == ReportStatusEnum.GENERATING)
+            .values(processed=processed, total=total, heartbeat_at=_now())
+            .returning(reports_table.c.cancel_requested)
+        ).first()
+        self.session.commit()
+        return row is not None and not row.cancel_requested
+
+    def finish(self, report_id: int, worker_id: str, status: str,
+               file_path: Optional[str] = None, error: Optional[str] = None) -> None:
+        reports_table = ReportModel.__table__
+        self.session.execute(
+            update(reports_table)
+            .where(reports_table.c.report_id == report_id, reports_table.c.worker_id == worker_id,
+                   reports_table.c.status == ReportStatusEnum.GENERATING)
+            .values(status=ReportStatusEnum(status), file_path=file_path, error=error, finished_at=_now())
+        )
+        self.session.commit()
@@ -1,8 +1,17 @@
 """ Implementación del repositorio para la entidad ScopusAccount. """
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from ...domain.entities.scopus_account import ScopusAccount
 from ...domain.repositories.scopus_account_repository import IScopusAccountRepository
+from .batching import chunked
+from .dialect import returning_previous
+from .integrity import is_foreign_key_violation, is_unique_violation
+from .publication_stats_repo_impl import refresh_publication_stats
+from .sync_watermark_repo_impl import drop_watermarks
+from .table_version_repo_impl import bump_table_versions
+from ..models.author import AuthorModel
 from ..models.scopus_account import ScopusAccountModel
 
 
@@ -16,6 +25,15 @@ def _to_domain_entity(account_db: ScopusAccountModel) -> ScopusAccount:
     )
 
 
+def _integrity_error(error: IntegrityError, username: Optional[str]) -> ValueError:
+    """Error a informar según la restricción que violó la escritura."""
+    if is_foreign_key_violation(error):
+        return ValueError("El autor especificado no existe")
+    if username is not None and is_unique_violation(error, "username"):
+        return ValueError(f"Ya existe una cuenta Scopus con el username {username}")
+    return ValueError(f"No se pudo guardar la cuenta Scopus: {error.orig}")
+
+
 class ScopusAccountRepoImpl(IScopusAccountRepository):
     """Implementación del repositorio de cuentas Scopus."""
 
@@ -30,18 +48,64 @@ class ScopusAccountRepoImpl(IScopusAccountRepository):
             author_id=scopus_account.author_id
         )
         self.session.add(scopus_db)
-        self.session.commit()
+        bump_table_versions(self.session, "scopus_accounts")
+        try:
+            self.session.commit()
+        except IntegrityError as e:
+            # Otra petición creó el mismo username o borró el autor después de la verificación del servicio
+            self.session.rollback()
+            raise _integrity_error(e, scopus_account.username)
         self.session.refresh(scopus_db)
 
         # Actualizar el objeto de dominio con el ID generado
         scopus_account.scopus_id = scopus_db.scopus_id
         return scopus_account
 
+    def bulk_create(self, scopus_accounts: List[ScopusAccount]) -> List[ScopusAccount]:
+        """Crea varias cuentas Scopus con un INSERT multi-fila y un solo commit."""
+        if not scopus_accounts:
+            return []
+        accounts_table = ScopusAccountModel.__table__
+        rows = [
+            {"username": account.username, "affiliation": account.affiliation, "author_id": account.author_id}
+            for account in scopus_accounts
+        ]
+        try:
+            result = self.session.execute(
+                insert(accounts_table).returning(accounts_table.c.scopus_id, accounts_table.c.username), rows
+            )
+            ids_by_username = {row.username: row.scopus_id for row in result}
+            bump_table_versions(self.session, "scopus_accounts")
+            self.session.commit()
+        except IntegrityError as e:
+            self.session.rollback()
+            raise ValueError(f"No se pudo completar la carga masiva: {e.orig}")
+
+        for account in scopus_accounts:
+            account.scopus_id = ids_by_username[account.username]
+        return scopus_accounts
+
     def get_all(self) -> List[ScopusAccount]:
         """Obtiene todas las cuentas Scopus."""
         accounts = self.session.query(ScopusAccountModel).all()
         return [_to_domain_entity(account_db) for account_db in accounts]
 
+    def get_page(self, after_id: Optional[int], limit: int) -> List[ScopusAccount]:
+        """Obtiene una página de cuentas Scopus ordenada por ID (paginación keyset)."""
+        query = self.session.query(ScopusAccountModel)
+        if after_id is not None:
+            query = query.filter(ScopusAccountModel.scopus_id > after_id)
+        accounts = query.order_by(ScopusAccountModel.scopus_id).limit(limit).all()
+        return [_to_domain_entity(account_db) for account_db in accounts]
+
+    def iter_batches(self, batch_size: int) -> Iterator[List[ScopusAccount]]:
+        """Recorre todas las cuentas Scopus por lotes sin cargar la tabla completa en memoria."""
+        result = self.session.execute(
+            select(ScopusAccountModel).order_by(ScopusAccountModel.scopus_id).execution_options(yield_per=batch_size)
+        )
+        for partition in result.scalars().partitions():
+            yield [_to_domain_entity(account_db) for account_db in partition]
+
     def get_by_id(self, scopus_id: int) -> Optional[ScopusAccount]:
         """Obtiene una cuenta Scopus por su ID."""
         account_db = self.session.query(ScopusAccountModel).filter(ScopusAccountModel.scopus_id == scopus_id).first()
@@ -54,6 +118,15 @@ class ScopusAccountRepoImpl(IScopusAccountRepository):
         accounts = self.session.query(ScopusAccountModel).filter(ScopusAccountModel.author_id == author_id).all()
         return [_to_domain_entity(account_db) for account_db in accounts]
 
+    def get_by_author_ids(self, author_ids: List[int]) -> List[ScopusAccount]:
+        """Obtiene en una sola consulta las cuentas Scopus de un conjunto de autores."""
+        if not author_ids:
+            return []
+        accounts = self.session.query(ScopusAccountModel).filter(
+            ScopusAccountModel.author_id.in_(set(author_ids))
+        ).all()
+        return [_to_domain_entity(account_db) for account_db in accounts]
+
     def get_by_username(self, username: str) -> Optional[ScopusAccount]:
         """Obtiene una cuenta Scopus por nombre de usuario."""
         account_db = self.session.query(ScopusAccountModel).filter(ScopusAccountModel.username == username).first()
@@ -61,27 +134,87 @@ class ScopusAccountRepoImpl(IScopusAccountRepository):
             return None
         return _to_domain_entity(account_db)
 
+    def get_existing_usernames(self, usernames: List[str]) -> Set[str]:
+        """Obtiene cuáles de los nombres de usuario indicados existen, con una consulta por bloque de valores."""
+        existing = set()
+        for chunk in chunked(usernames):
+            rows = self.session.query(ScopusAccountModel.username).filter(ScopusAccountModel.username.in_(chunk)).all()
+            existing.update(row.username for row in rows)
+        return existing
+
     def update(self, scopus_account: ScopusAccount) -> ScopusAccount:
         """Actualiza una cuenta Scopus existente."""
-        account_db = self.session.query(ScopusAccountModel).filter(
-            ScopusAccountModel.scopus_id == scopus_account.scopus_id).first()
-        if not account_db:
+        updated = self.update_fields(scopus_account.scopus_id, {
+            "username": scopus_account.username,
+            "affiliation": scopus_account.affiliation,
+            "author_id": scopus_account.author_id,
+        })
+        if updated is None:
             raise ValueError("La cuenta Scopus no fue encontrada.")
-
-        account_db.username = scopus_account.username
-        account_db.affiliation = scopus_account.affiliation
-        account_db.author_id = scopus_account.author_id
-
+        return updated
+
+    def update_fields(self, scopus_id: int, fields: Dict[str, Any]) -> Optional[ScopusAccount]:
+        """
+        Actualiza los campos indicados con un único UPDATE ... RETURNING; None si la cuenta no existe.
+
+        La unicidad del username y la existencia del autor se comprueban en el propio WHERE; solo si
+        no se actualiza ninguna fila se consulta el motivo para informar el error. En PostgreSQL el autor
+        anterior sale del mismo UPDATE (ver ``returning_previous``).
+        """
+        if not fields:
+            return self.get_by_id(scopus_id)
+
+        accounts_table = ScopusAccountModel.__table__
+        statement = update(accounts_table).where(accounts_table.c.scopus_id == scopus_id)
+        if "username" in fields:
+            other = accounts_table.alias("other")
+            statement = statement.where(~exists().where(
+                other.c.username == fields["username"], other.c.scopus_id != scopus_id
+            ))
+        if "author_id" in fields:
+            authors_table = AuthorModel.__table__
+            statement = statement.where(exists().where(authors_table.c.author_id == fields["author_id"]))
+
+        statement = statement.values(**fields).returning(*accounts_table.c)
+        if "author_id" in fields:
+            # Autor anterior, para recalcular sus estadísticas si la cuenta cambia de autor
+            statement = returning_previous(
+                self.session, statement, accounts_table, "scopus_id", scopus_id, "author_id"
+            )
+
+        try:
+            row = self.session.execute(statement).first()
+        except IntegrityError as e:
+            # Otra petición tomó el username o borró el autor entre la verificación y el UPDATE
+            self.session.rollback()
+            raise _integrity_error(e, fields.get("username"))
+        if row is None:
+            self.session.rollback()
+            if self.get_by_id(scopus_id) is None:
+                return None
+            if "username" in fields and self.get_by_username(fields["username"]) is not None:
+                raise ValueError(f"Ya existe una cuenta Scopus con el username {fields['username']}")
+            raise ValueError("El autor especificado no existe")
+        if "username" in fields:
+            # Otro username es otro perfil de Scopus: la próxima sincronización debe ser completa
+            drop_watermarks(self.session, [scopus_id])
+        if "author_id" in fields and row.previous_author_id != row.author_id:
+            # Las publicaciones de la cuenta pasan a contar para el nuevo autor
+            refresh_publication_stats(self.session, [row.previous_author_id, row.author_id])
+        bump_table_versions(self.session, "scopus_accounts")
         self.session.commit()
-        self.session.refresh(account_db)
-
-        return scopus_account
+        return _to_domain_entity(row)
 
     def delete(self, scopus_id: int) -> None:
-        """Elimina una cuenta Scopus."""
-        account_db = self.session.query(ScopusAccountModel).filter(ScopusAccountModel.scopus_id == scopus_id).first()
-        if not account_db:
+        """Elimina una cuenta Scopus con un único DELETE ... RETURNING."""
+        accounts_table = ScopusAccountModel.__table__
+        drop_watermarks(self.session, [scopus_id])
+        deleted = self.session.execute(
+            delete(accounts_table).where(accounts_table.c.scopus_id == scopus_id).returning(accounts_table.c.author_id)
+        ).first()
+        if deleted is None:
+            self.session.rollback()
             raise ValueError("La cuenta Scopus no fue encontrada.")
-
-        self.session.delete(account_db)
+        refresh_publication_stats(self.session, [deleted.author_id])
+        bump_table_versions(self.session, "scopus_accounts", "authorships")
         self.session.commit()
@@ -0,0 +1,70 @@
+""" Implementación del repositorio de marcas de sincronización. """
+from typing import Dict, List
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+from ...domain.entities.sync_watermark import SyncWatermark
+from ...domain.repositories.sync_watermark_repository import ISyncWatermarkRepository
+from .batching import chunked
+from .dialect import upsert_insert
+from ..models.sync_watermark import SyncWatermarkModel
+
+_COLUMNS = ("username", "loaded_after", "content_hash", "document_count", "full_synced_on")
+
+
+def _to_domain_entity(row) -> SyncWatermark:
+    """Convierte una fila en entidad de dominio."""
+    return SyncWatermark(
+        scopus_id=row.scopus_id,
+        username=row.username,
+        loaded_after=row.loaded_after,
+        content_hash=row.content_hash,
+        document_count=row.document_count,
+        full_synced_on=row.full_synced_on
+    )
+
+
+def drop_watermarks(session: Session, scopus_ids: List[int]) -> None:
+    """
+    Elimina las marcas dentro de la transacción en curso.
+
+    ScopusAccountRepoImpl la llama al borrar una cuenta o cambiar su username, para que la siguiente
+    sincronización de esa cuenta sea completa.
+    """
+    watermarks_table = SyncWatermarkModel.__table__
+    for chunk in chunked(scopus_ids):
+        session.execute(delete(watermarks_table).where(watermarks_table.c.scopus_id.in_(chunk)))
+
+
+class SyncWatermarkRepoImpl(ISyncWatermarkRepository):
+    """Implementación del repositorio de marcas de sincronización."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_by_scopus_ids(self, scopus_ids: List[int]) -> Dict[int, SyncWatermark]:
+        watermarks_table = SyncWatermarkModel.__table__
+        watermarks = {}
+        for chunk in chunked(scopus_ids):
+            rows = self.session.execute(
+                select(watermarks_table).where(watermarks_table.c.scopus_id.in_(chunk))
+            ).all()
+            watermarks.update({row.scopus_id: _to_domain_entity(row) for row in rows})
+        return watermarks
+
+    def save_many(self, watermarks: List[SyncWatermark]) -> None:
+        if not watermarks:
+            return
+        watermarks_table = SyncWatermarkModel.__table__
+        statement = upsert_insert(self.session, watermarks_table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[watermarks_table.c.scopus_id],
+            set_={column: statement.excluded[column] for column in _COLUMNS}
+        )
+        rows = [{"scopus_id": watermark.scopus_id, **{column: getattr(watermark, column) for column in _COLUMNS}}
+                for watermark in watermarks]
+        self.session.execute(statement, rows)
+        self.session.commit()
+
+    def delete_by_scopus_ids(self, scopus_ids: List[int]) -> None:
+        drop_watermarks(self.session, scopus_ids)
+        self.session.commit()
@@ -0,0 +1,60 @@
+""" Implementación del repositorio de versiones de tablas. """
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, SessionTransaction
+from ...domain.repositories.table_version_repository import ITableVersionRepository, department_data_key
+from ..models.table_version import TableVersionModel
+from .dialect import upsert_insert
+
+# Clave en ``Session.info`` de las versiones ya leídas en la transacción en curso
+READ_VERSIONS_KEY = "table_versions"
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_read_versions(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(READ_VERSIONS_KEY, None)
+
+
+def bump_table_versions(session: Session, *table_names: str, dep_ids: Iterable[Optional[int]] = ()) -> None:
+    """
+    Incrementa la versión de las tablas y el contador de datos de los departamentos ``dep_ids`` dentro de la
+    transacción en curso, en una sola sentencia.
+
+    Los RepoImpl la llaman antes de confirmar cada escritura, de modo que la versión cambia en el mismo
+    commit que los datos. Los contadores se crean con la primera escritura (INSERT ... ON CONFLICT DO
+    UPDATE), así que dos primeras escrituras concurrentes no chocan en la clave. La caché de reportes usa el
+    contador del departamento como parte de la clave, así que sus entradas anteriores dejan de usarse.
+    """
+    names = set(table_names) | {department_data_key(dep_id) for dep_id in dep_ids if dep_id is not None}
+    if not names:
+        return
+    session.info.pop(READ_VERSIONS_KEY, None)
+    versions_table = TableVersionModel.__table__
+    statement = upsert_insert(session, versions_table).values(
+        [{"table_name": table_name, "version": 1} for table_name in sorted(names)]
+    )
+    session.execute(statement.on_conflict_do_update(
+        index_elements=[versions_table.c.table_name], set_={"version": versions_table.c.version + 1}
+    ))
+
+
+class TableVersionRepoImpl(ITableVersionRepository):
+    """Implementación del repositorio de versiones de tablas."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get_versions(self, table_names: List[str]) -> Dict[str, int]:
+        """Lee solo las tablas aún no leídas en la transacción; las demás salen de ``Session.info``."""
+        known = self.session.info.setdefault(READ_VERSIONS_KEY, {})
+        missing = [table_name for table_name in table_names if table_name not in known]
+        if missing:
+            versions_table = TableVersionModel.__table__
+            rows = self.session.execute(
+                select(versions_table.c.table_name, versions_table.c.version)
+                .where(versions_table.c.table_name.in_(missing))
+            ).all()
+            known.update({table_name: 0 for table_name in missing})
+            known.update({row.table_name: row.version for row in rows})
+        return {table_name: known[table_name] for table_name in table_names}
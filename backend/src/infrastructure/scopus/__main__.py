@@ -0,0 +1,38 @@
+"""
+Sincronización completa desde la línea de comandos.
+
+Uso: ``python -m src.infrastructure.scopus [--full] [--rebuild-stats]`` (configuración en SCOPUS_API_URL,
+SCOPUS_API_KEY, etc.).
+"""
+import argparse
+import asyncio
+import logging
+
+from ..db import get_engine, get_session_factory
+from ..migrations import check_schema_revision
+from ..models import (  # noqa: F401
+    department, author, scopus_account, publication, publication_stats, sync_watermark, table_version
+)
+from ..repositories.publication_stats_repo_impl import PublicationStatsRepoImpl
+from .ingestion import sync_coordinator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true", help="Ignorar las marcas y descargar todo")
+    parser.add_argument("--rebuild-stats", action="store_true",
+                        help="Recalcular todas las estadísticas de publicaciones sin sincronizar")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    check_schema_revision(get_engine())
+    session_factory = get_session_factory()
+    if args.rebuild_stats:
+        with session_factory() as session:
+            PublicationStatsRepoImpl(session).rebuild()
+        return
+    result = asyncio.run(sync_coordinator.run(session_factory, full=args.full))
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Cliente de la API de búsqueda de Scopus.
+
+La URL base es configurable (SCOPUS_API_URL) para apuntar a un servidor local de pruebas, y el
+transporte de httpx puede reemplazarse (por ejemplo, por httpx.MockTransport).
+"""
+import asyncio
+import os
+import random
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+import httpx
+
+from .rate_limit import TokenBucket
+
+SEARCH_PATH = "/content/search/scopus"
+SEARCH_FIELDS = ",".join([
+    "eid", "dc:title", "prism:publicationName", "prism:coverDate", "prism:doi", "subtypeDescription",
+    "citedby-count",
+])
+# Códigos para los que se reintenta la petición
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class ScopusApiError(Exception):
+    """ Error no recuperable (o agotados los reintentos) al consultar la API de Scopus. """
+    pass
+
+
+class ScopusClient(ABC):
+    """ Fuente de documentos de Scopus por identificador de autor. """
+
+    page_size = 25
+
+    @abstractmethod
+    async def fetch_author_documents(self, scopus_author_id: str, loaded_after: Optional[date] = None) -> List[dict]:
+        """ Obtener las entradas de búsqueda de un autor; con ``loaded_after``, solo las cargadas después. """
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+class HttpScopusClient(ScopusClient):
+    """ Cliente httpx con pool de conexiones, limitador de tasa compartido y reintentos con backoff. """
+
+    def __init__(self, base_url: str, api_key: str, rate_limiter: TokenBucket, max_retries: int = 5,
+                 page_size: int = 25, max_connections: int = 20, timeout: float = 30.0,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.page_size = page_size
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.api_calls = 0
+        self.retries = 0
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers={"X-ELS-APIKey": api_key, "Accept": "application/json"},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_env(cls, transport: Optional[httpx.AsyncBaseTransport] = None) -> "HttpScopusClient":
+        """
+        Crea el cliente con SCOPUS_API_URL, SCOPUS_API_KEY, SCOPUS_RATE_LIMIT (peticiones por segundo),
+        SCOPUS_MAX_RETRIES y SCOPUS_MAX_CONNECTIONS.
+        """
+        return cls(
+            base_url=os.getenv("SCOPUS_API_URL", "https://api.elsevier.com"),
+            api_key=os.getenv("SCOPUS_API_KEY", ""),
+            rate_limiter=TokenBucket(float(os.getenv("SCOPUS_RATE_LIMIT", "9"))),
+            max_retries=int(os.getenv("SCOPUS_MAX_RETRIES", "5")),
+            max_connections=int(os.getenv("SCOPUS_MAX_CONNECTIONS", "20")),
+            transport=transport,
+        )
+
+    async def fetch_author_documents(self, scopus_author_id: str, loaded_after: Optional[date] = None) -> List[dict]:
+        """ Descarga la primera página y, conocido el total, el resto de páginas en paralelo. """
+        query = f"AU-ID({scopus_author_id})"
+        if loaded_after is not None:
+            query += f" AND LOAD-DATE AFT {loaded_after:%Y%m%d}"
+        first = await self._search_page(query, 0)
+        entries, total = _page_entries(first)
+        starts = range(self.page_size, total, self.page_size)
+        pages = await asyncio.gather(*(self._search_page(query, start) for start in starts))
+        for page in pages:
+            entries.extend(_page_entries(page)[0])
+        return entries
+
+    async def _search_page(self, query: str, start: int) -> dict:
+        params = {
+            "query": query,
+            "start": start,
+            "count": self.page_size,
+            "field": SEARCH_FIELDS,
+        }
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            self.api_calls += 1
+            retry_after = None
+            try:
+                response = await self._client.get(SEARCH_PATH, params=params)
+            except httpx.TransportError as e:
+                error: Exception = e
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                error = ScopusApiError(f"Scopus respondió {response.status_code} para la consulta {query}")
+                if response.status_code not in RETRYABLE_STATUS:
+                    raise error
+                retry_after = _retry_after_seconds(response)
+
+            if attempt == self.max_retries:
+                raise ScopusApiError(f"Reintentos agotados para la consulta {query}: {error}") from error
+            self.retries += 1
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            if retry_after is not None:
+                self.rate_limiter.pause(retry_after)
+            await asyncio.sleep(delay)
+        raise AssertionError("inalcanzable")
+
+    def _backoff(self, attempt: int) -> float:
+        """ Backoff exponencial con jitter completo. """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _page_entries(payload: dict):
+    """ Entradas válidas y total de resultados de una página de búsqueda. """
+    results = payload.get("search-results", {})
+    total = int(results.get("opensearch:totalResults") or 0)
+    # Una búsqueda vacía devuelve una sola entrada con la clave "error"
+    entries = [entry for entry in results.get("entry", []) if "error" not in entry]
+    return entries, total
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,283 @@
+"""
+Sincronización de publicaciones desde Scopus.
+
+Varias tareas asyncio descargan los documentos de las cuentas en paralelo (limitadas por el token
+bucket del cliente) y un único escritor agrupa los resultados y los guarda en un hilo aparte, de modo
+que la base de datos recibe pocas transacciones grandes en lugar de una por cuenta.
+
+Cada cuenta guarda una marca de sincronización: mientras exista (y el username no haya cambiado) solo
+se piden los documentos cargados después de ella, y cada SCOPUS_FULL_SYNC_DAYS días se hace una
+descarga completa para recoger bajas y atribuciones corregidas.
+"""
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy.orm import Session
+
+from ...application.dto.sync_dto import SyncAccountErrorDTO, SyncResultDTO, SyncStatusDTO
+from ...domain.entities.publication import Publication
+from ...domain.entities.scopus_account import ScopusAccount
+from ...domain.entities.sync_watermark import SyncWatermark
+from ...domain.repositories.publication_repository import AccountPublications
+from ..repositories.publication_repo_impl import PublicationRepoImpl, content_hash
+from ..repositories.scopus_account_repo_impl import ScopusAccountRepoImpl
+from ..repositories.sync_watermark_repo_impl import SyncWatermarkRepoImpl
+from .client import HttpScopusClient, ScopusApiError, ScopusClient
+from .mapping import to_publications
+
+logger = logging.getLogger(__name__)
+
+# Días que se solapan con la marca anterior, para no perder documentos cargados durante la sincronización
+WATERMARK_OVERLAP_DAYS = 1
+
+
+def _full_sync_days() -> int:
+    return int(os.getenv("SCOPUS_FULL_SYNC_DAYS", "30"))
+
+
+def result_hash(publications: List[Publication]) -> str:
+    """ Huella del conjunto de publicaciones descargadas para una cuenta. """
+    digest = hashlib.sha256()
+    for record_hash in sorted(content_hash(publication) for publication in publications):
+        digest.update(record_hash.encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class _Downloaded:
+    """ Resultado de la descarga de una cuenta, pendiente de escribir. """
+    account: ScopusAccount
+    publications: List[Publication]
+    watermark: SyncWatermark
+    delta: bool
+    unchanged: bool
+    # Documentos recibidos de la API, incluidos los repetidos por el solapamiento de la marca
+    fetched: int
+
+
+class ScopusIngestionPipeline:
+    """ Descarga concurrente por cuenta y escritura por lotes con un solo escritor. """
+
+    def __init__(self, client: ScopusClient, session_factory: Callable[[], Session],
+                 concurrency: int = 8, write_batch_accounts: int = 50, full: bool = False):
+        self.client = client
+        self.session_factory = session_factory
+        self.concurrency = concurrency
+        self.write_batch_accounts = write_batch_accounts
+        self.full = full
+
+    async def run(self, accounts: Optional[List[ScopusAccount]] = None) -> SyncResultDTO:
+        """ Sincroniza las cuentas indicadas (todas las registradas si no se indican). """
+        started = time.monotonic()
+        result = SyncResultDTO(started_at=datetime.now(timezone.utc))
+        if accounts is None:
+            accounts = await asyncio.to_thread(self._load_accounts)
+        watermarks = {} if self.full else await asyncio.to_thread(self._load_watermarks, accounts)
+        result.accounts_total = len(accounts)
+
+        pending: asyncio.Queue = asyncio.Queue()
+        for account in accounts:
+            pending.put_nowait(account)
+        # Cola acotada: si el escritor se retrasa, las descargas esperan en lugar de acumular memoria
+        downloaded: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+
+        today = result.started_at.date()
+        writer = asyncio.create_task(self._write(downloaded, result))
+        await asyncio.gather(*(
+            self._fetch(pending, downloaded, watermarks, today, result) for _ in range(self.concurrency)
+        ))
+        await downloaded.put(None)
+        await writer
+
+        elapsed = time.monotonic() - started
+        result.api_calls = getattr(self.client, "api_calls", 0)
+        result.retries = getattr(self.client, "retries", 0)
+        result.accounts_failed = len(result.errors)
+        # Tiempo ahorrado estimado con el ritmo de llamadas observado en esta ejecución
+        if result.api_calls:
+            result.estimated_seconds_saved = round(result.api_calls_saved * elapsed / result.api_calls, 3)
+        result.elapsed_seconds = round(elapsed, 3)
+        result.finished_at = datetime.now(timezone.utc)
+        logger.info(
+            "Sincronización: %s cuentas (%s incrementales), %s llamadas, %s ahorradas (~%.1f s)",
+            result.accounts_synced, result.accounts_delta, result.api_calls, result.api_calls_saved,
+            result.estimated_seconds_saved,
+        )
+        return result
+
+    def _load_accounts(self) -> List[ScopusAccount]:
+        with self.session_factory() as session:
+            return ScopusAccountRepoImpl(session).get_all()
+
+    def _load_watermarks(self, accounts: List[ScopusAccount]) -> Dict[int, SyncWatermark]:
+        with self.session_factory() as session:
+            return SyncWatermarkRepoImpl(session).get_by_scopus_ids([account.scopus_id for account in accounts])
+
+    def _usable_watermark(self, account: ScopusAccount, watermark: Optional[SyncWatermark],
+                          today: date) -> Optional[SyncWatermark]:
+        """ La marca sirve si es del mismo username y la última descarga completa es reciente. """
+        if watermark is None or watermark.username != account.username:
+            return None
+        if (today - watermark.full_synced_on).days >= _full_sync_days():
+            return None
+        return watermark
+
+    async def _fetch(self, pending: asyncio.Queue, downloaded: asyncio.Queue,
+                     watermarks: Dict[int, SyncWatermark], today: date, result: SyncResultDTO) -> None:
+        while True:
+            try:
+                account: ScopusAccount = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            previous = self._usable_watermark(account, watermarks.get(account.scopus_id), today)
+            loaded_after = previous.loaded_after if previous else None
+            try:
+                entries = await self.client.fetch_author_documents(account.username, loaded_after)
+            except (ScopusApiError, httpx.HTTPError, ValueError) as e:
+                logger.warning("No se pudo sincronizar la cuenta %s: %s", account.username, e)
+                result.errors.append(SyncAccountErrorDTO(
+                    scopus_id=account.scopus_id, username=account.username, error=str(e)
+                ))
+                continue
+
+            publications = to_publications(entries)
+            fingerprint = result_hash(publications)
+            unchanged = bool(previous) and (not publications or fingerprint == previous.content_hash)
+            if previous:
+                result.accounts_delta += 1
+                # Los documentos de la ventana solapada ya estaban contados: el total (EIDs distintos de la
+                # cuenta) lo calcula el escritor después de guardar
+                document_count = previous.document_count
+            else:
+                result.accounts_full += 1
+                document_count = len({publication.eid for publication in publications})
+
+            watermark = SyncWatermark(
+                scopus_id=account.scopus_id,
+                username=account.username,
+                loaded_after=today - timedelta(days=WATERMARK_OVERLAP_DAYS),
+                content_hash=fingerprint,
+                document_count=document_count,
+                full_synced_on=previous.full_synced_on if previous else today,
+            )
+            await downloaded.put(_Downloaded(account, publications, watermark, bool(previous), unchanged, len(entries)))
+
+    async def _write(self, downloaded: asyncio.Queue, result: SyncResultDTO) -> None:
+        finished = False
+        while not finished:
+            batch: List[_Downloaded] = []
+            item = await downloaded.get()
+            # Se toma lo que ya esté descargado, sin esperar a completar el lote
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.write_batch_accounts or downloaded.empty():
+                    break
+                item = downloaded.get_nowait()
+            finished = item is None
+            if not batch:
+                continue
+            try:
+                saved = await asyncio.to_thread(self._save, batch)
+            except Exception as e:
+                logger.exception("Error al guardar un lote de publicaciones")
+                for entry in batch:
+                    result.errors.append(SyncAccountErrorDTO(
+                        scopus_id=entry.account.scopus_id, username=entry.account.username,
+                        error=f"Error al guardar: {e}"
+                    ))
+                continue
+            result.publications_written += saved.written
+            result.publications_unchanged += saved.unchanged
+            result.accounts_unchanged += sum(1 for entry in batch if entry.unchanged)
+            result.accounts_synced += len(batch)
+            # Llamadas que habría hecho una descarga completa frente a las hechas
+            page_size = self.client.page_size
+            result.api_calls_saved += sum(
+                max(0, math.ceil(max(entry.watermark.document_count, 1) / page_size)
+                    - math.ceil(max(entry.fetched, 1) / page_size))
+                for entry in batch if entry.delta
+            )
+
+    def _save(self, batch: List[_Downloaded]):
+        with self.session_factory() as session:
+            saved = PublicationRepoImpl(session).save_account_publications([
+                AccountPublications(entry.account.scopus_id, entry.publications, replace=not entry.delta)
+                for entry in batch if not entry.unchanged
+            ])
+            for entry in batch:
+                entry.watermark.document_count = saved.document_counts.get(
+                    entry.account.scopus_id, entry.watermark.document_count
+                )
+            # La marca avanza solo después de guardar las publicaciones
+            SyncWatermarkRepoImpl(session).save_many([entry.watermark for entry in batch])
+            return saved
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("La sincronización de publicaciones falló", exc_info=task.exception())
+
+
+class SyncCoordinator:
+    """
+    Evita sincronizaciones simultáneas en el proceso y conserva el resultado de la última.
+
+    ``claim`` comprueba y reserva la sincronización en un solo paso; ``start`` la reserva y la lanza antes
+    de que la petición responda, así que de dos peticiones simultáneas solo una la inicia.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.last_result: Optional[SyncResultDTO] = None
+
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+
+    def status(self) -> SyncStatusDTO:
+        return SyncStatusDTO(running=self.running, last_result=self.last_result)
+
+    def claim(self) -> bool:
+        """ Reserva la sincronización; False si ya hay una en curso. """
+        return self._lock.acquire(blocking=False)
+
+    def start(self, session_factory: Callable[[], Session], full: bool = False) -> bool:
+        """ Reserva la sincronización y la ejecuta en segundo plano en el event loop; False si ya hay una. """
+        if not self.claim():
+            return False
+        self._task = asyncio.get_running_loop().create_task(self.run(session_factory, full=full, claimed=True))
+        self._task.add_done_callback(_log_failure)
+        return True
+
+    async def run(self, session_factory: Callable[[], Session],
+                  client_factory: Callable[[], ScopusClient] = HttpScopusClient.from_env,
+                  full: bool = False, claimed: bool = False) -> SyncResultDTO:
+        """
+        Sincroniza todas las cuentas; SCOPUS_CONCURRENCY fija las descargas simultáneas. Con ``claimed``
+        la reserva ya la hizo quien llama con ``claim``; se libera al terminar.
+        """
+        if not claimed and not self.claim():
+            raise ValueError("Ya hay una sincronización en curso.")
+        try:
+            client = client_factory()
+            concurrency = int(os.getenv("SCOPUS_CONCURRENCY", "8"))
+            try:
+                self.last_result = await ScopusIngestionPipeline(client, session_factory, concurrency, full=full).run()
+            finally:
+                await client.aclose()
+            return self.last_result
+        finally:
+            self._lock.release()
+
+
+sync_coordinator = SyncCoordinator()
@@ -0,0 +1,45 @@
+""" Conversión de las entradas de la API de búsqueda de Scopus a entidades de dominio. """
+from datetime import date
+from typing import List, Optional
+
+from ...domain.entities.publication import Publication
+from ...domain.exceptions.domain_exceptions import DomainException
+from ..models.base import DocumentTypeEnum, SourceTypeEnum
+
+_DOCUMENT_TYPES = {document_type.value: document_type for document_type in DocumentTypeEnum}
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def to_publication(entry: dict) -> Optional[Publication]:
+    """ Convierte una entrada de búsqueda; None si le faltan datos obligatorios. """
+    document_type = _DOCUMENT_TYPES.get(entry.get("subtypeDescription"), DocumentTypeEnum.OTHER)
+    try:
+        return Publication(
+            pub_id=None,
+            eid=entry.get("eid") or "",
+            title=entry.get("dc:title") or "",
+            publication_date=_parse_date(entry.get("prism:coverDate")),
+            source_title=entry.get("prism:publicationName"),
+            document_type=document_type.value,
+            source_type=SourceTypeEnum.SCOPUS.value,
+            doi=entry.get("prism:doi"),
+            cited_by=int(entry.get("citedby-count") or 0),
+        )
+    except (DomainException, ValueError):
+        return None
+
+
+def to_publications(entries: List[dict]) -> List[Publication]:
+    """ Convierte las entradas de un autor descartando las incompletas y los EIDs repetidos. """
+    publications = {}
+    for entry in entries:
+        publication = to_publication(entry)
+        if publication is not None:
+            publications[publication.eid] = publication
+    return list(publications.values())
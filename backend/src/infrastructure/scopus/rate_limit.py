@@ -0,0 +1,41 @@
+""" Limitador de tasa (token bucket) compartido por todas las peticiones a la API de Scopus. """
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Permite ``rate`` peticiones por segundo con ráfagas de hasta ``capacity``.
+
+    Los que esperan se atienden en orden de llegada: el candado se mantiene mientras se espera el
+    siguiente token.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("La tasa del limitador debe ser mayor que cero.")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """ Espera hasta disponer de un token y lo consume. """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """ Vacía el bucket para que nadie consulte durante ``seconds`` (p. ej. tras un 429 con Retry-After). """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate + 1)
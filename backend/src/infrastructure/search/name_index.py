@@ -0,0 +1,155 @@
+"""
+Índice en memoria de nombres de autores.
+
+Se habilita con AUTHOR_NAME_INDEX_ENABLED=true. Cada proceso mantiene su propia copia, que un hilo en
+segundo plano (``AuthorNameIndexRefresher``) reconstruye cuando cambia la versión de la tabla de autores;
+la revisa cada AUTHOR_NAME_INDEX_REFRESH_SECONDS. Las búsquedas solo usan el índice si su versión es la
+actual de la BD, así que nunca responden con datos de otro proceso que aún no recogió: mientras tanto se
+resuelven en la base de datos.
+
+Las búsquedas tienen la misma semántica que ``AuthorRepoImpl.search_by_name``: cada palabra del término
+debe aparecer como subcadena en alguna palabra del nombre normalizado. Para resolverlo con búsqueda
+binaria se indexan todos los sufijos de cada palabra (una subcadena es el prefijo de algún sufijo).
+"""
+import heapq
+import logging
+import os
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from .normalization import name_tokens, normalize_name
+from ..repositories.author_repo_impl import AuthorRepoImpl
+from ..repositories.table_version_repo_impl import TableVersionRepoImpl
+from ...domain.repositories.author_name_index import IAuthorNameIndex
+
+logger = logging.getLogger(__name__)
+
+
+def name_index_enabled() -> bool:
+    """ Indica si el índice de nombres está habilitado en la configuración. """
+    return os.getenv("AUTHOR_NAME_INDEX_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+def _refresh_seconds() -> float:
+    return float(os.getenv("AUTHOR_NAME_INDEX_REFRESH_SECONDS", "2"))
+
+
+def name_rank(name: str, phrase: str, author_id: int) -> Tuple[bool, int, int]:
+    """ Orden de los resultados: primero los nombres que empiezan por la frase, luego los más cortos. """
+    return not name.startswith(phrase), len(name), author_id
+
+
+class AuthorNameIndex(IAuthorNameIndex):
+    """ Arreglo ordenado de pares (sufijo de palabra normalizada, ID de autor) consultado con búsqueda binaria. """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._entries: List[Tuple[str, int]] = []
+        self._names: Dict[int, str] = {}
+        self._version: Optional[int] = None
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._version
+
+    def rebuild(self, entries: Iterable[Tuple[int, str]], version: int) -> None:
+        names = {author_id: normalize_name(full_name) for author_id, full_name in entries}
+        index = sorted(
+            (word[start:], author_id)
+            for author_id, name in names.items()
+            for word in set(name.split(" "))
+            for start in range(len(word))
+        )
+        with self._lock:
+            self._names = names
+            self._entries = index
+            self._version = version
+
+    def search(self, search_term: str, limit: Optional[int] = None) -> List[int]:
+        tokens = name_tokens(search_term)
+        if not tokens:
+            return []
+        with self._lock:
+            matches: Optional[Set[int]] = None
+            for token in sorted(set(tokens), key=len, reverse=True):
+                ids = self._ids_containing(token)
+                matches = ids if matches is None else matches & ids
+                if not matches:
+                    return []
+            phrase = " ".join(tokens)
+            names = self._names
+
+            def rank(author_id: int) -> Tuple[bool, int, int]:
+                return name_rank(names[author_id], phrase, author_id)
+
+            if limit is not None:
+                return heapq.nsmallest(limit, matches, key=rank)
+            return sorted(matches, key=rank)
+
+    def is_consistent_with(self, entries: Iterable[Tuple[int, str]]) -> bool:
+        expected = {author_id: normalize_name(full_name) for author_id, full_name in entries}
+        with self._lock:
+            return self._version is not None and expected == self._names
+
+    def size(self) -> int:
+        return len(self._names)
+
+    def _ids_containing(self, token: str) -> Set[int]:
+        ids = set()
+        position = bisect_left(self._entries, (token, -1))
+        while position < len(self._entries) and self._entries[position][0].startswith(token):
+            ids.add(self._entries[position][1])
+            position += 1
+        return ids
+
+
+class AuthorNameIndexRefresher:
+    """ Hilo que reconstruye el índice cuando cambia la versión de la tabla de autores. """
+
+    def __init__(self, index: AuthorNameIndex):
+        self.index = index
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self, session_factory: Callable[[], Session]) -> None:
+        """ Inicia el hilo; la primera construcción se hace en él, sin demorar el arranque. """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, args=(session_factory,), name="author-name-index",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self, session_factory: Callable[[], Session]) -> None:
+        while not self._stopping.is_set():
+            try:
+                self.refresh(session_factory)
+            except Exception:
+                logger.exception("Error al reconstruir el índice de nombres de autores")
+            self._stopping.wait(_refresh_seconds())
+
+    def refresh(self, session_factory: Callable[[], Session]) -> bool:
+        """ Reconstruye el índice si la versión de los autores cambió; devuelve True si lo hizo. """
+        with session_factory() as session:
+            # La versión se lee antes que los nombres: si cambia entre ambas lecturas el índice queda con
+            # datos más nuevos que su versión y se vuelve a construir en la siguiente revisión
+            version = TableVersionRepoImpl(session).get_versions(["authors"])["authors"]
+            if version == self.index.version:
+                return False
+            self.index.rebuild(AuthorRepoImpl(session).get_name_entries(), version)
+        logger.info("Índice de nombres reconstruido: %s autores (versión %s)", self.index.size(), version)
+        return True
+
+
+# Instancias compartidas por el proceso
+author_name_index = AuthorNameIndex()
+name_index_refresher = AuthorNameIndexRefresher(author_name_index)
@@ -0,0 +1,24 @@
+""" Normalización de nombres para búsquedas insensibles a mayúsculas y tildes. """
+import re
+import unicodedata
+from typing import List
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(text: str) -> str:
+    """ Convierte un texto a minúsculas, sin tildes ni espacios repetidos ("Peña  Álvarez" -> "pena alvarez"). """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    without_marks = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WHITESPACE.sub(" ", without_marks).strip().casefold()
+
+
+def name_tokens(text: str) -> List[str]:
+    """ Divide un texto normalizado en sus palabras. """
+    normalized = normalize_name(text)
+    return normalized.split(" ") if normalized else []
+
+
+def full_search_name(first_name: str, last_name: str) -> str:
+    """ Nombre completo normalizado que se almacena en la columna de búsqueda. """
+    return normalize_name(f"{first_name} {last_name}")
@@ -0,0 +1,98 @@
+"""
+Métricas de SQL por petición: número de consultas, tiempo total en la BD y la sentencia más lenta.
+
+Los eventos ``before_cursor_execute``/``after_cursor_execute`` de cada motor miden cada sentencia y la
+suman a las métricas de la petición en curso, que se guardan en una ContextVar: la copia del contexto
+que hacen el threadpool de Starlette y los greenlets de ``run_sync`` comparte el mismo objeto, así que
+se atribuyen también las consultas que corren en otro hilo. Las sentencias fuera de una petición (workers
+de reportes, CLI) no se registran, ni las de las tareas en segundo plano que se ejecutan tras enviar la
+respuesta (heredan la ContextVar, pero las métricas ya están cerradas).
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Caracteres de la sentencia más lenta que se conservan (sin parámetros)
+MAX_STATEMENT_LENGTH = 500
+
+
+class RequestSqlMetrics:
+    """ Consultas y tiempo de BD acumulados durante una petición. """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.closed = False
+
+    def close(self) -> None:
+        """ Deja de acumular: las sentencias posteriores ya no pertenecen a la petición. """
+        with self._lock:
+            self.closed = True
+
+    def record(self, statement: str, seconds: float) -> None:
+        with self._lock:
+            if self.closed:
+                return
+            self.queries += 1
+            self.db_seconds += seconds
+            if seconds > self.slowest_seconds:
+                self.slowest_seconds = seconds
+                self.slowest_statement = statement
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            slowest = self.slowest_statement
+            return {
+                "queries": self.queries,
+                "db_ms": round(self.db_seconds * 1000, 3),
+                "slowest_ms": round(self.slowest_seconds * 1000, 3),
+                "slowest_statement": " ".join(slowest.split())[:MAX_STATEMENT_LENGTH] if slowest else None,
+            }
+
+
+_current_metrics: ContextVar[Optional[RequestSqlMetrics]] = ContextVar("request_sql_metrics", default=None)
+
+
+def start_request_metrics() -> RequestSqlMetrics:
+    """ Empieza a acumular las métricas de la petición actual y las devuelve. """
+    metrics = RequestSqlMetrics()
+    _current_metrics.set(metrics)
+    return metrics
+
+
+def current_request_metrics() -> Optional[RequestSqlMetrics]:
+    """ Métricas de la petición en curso; None fuera de una petición. """
+    return _current_metrics.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started_at"].pop()
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record(statement, time.perf_counter() - started)
+
+
+def _handle_error(exception_context):
+    # La sentencia falló: no habrá after_cursor_execute que retire su marca de inicio
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """ Registra la medición de sentencias en el motor (síncrono, o el ``sync_engine`` del asíncrono). """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
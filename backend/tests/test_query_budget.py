@@ -0,0 +1,51 @@
+"""
+Presupuesto de consultas SQL por endpoint (ver ``benchmarks.query_budget``).
+
+Cada caso se comprueba por separado con cada tamaño de datos de QUERY_BUDGET_SIZES (números de autores
+separados por comas, por defecto 50 y 500). Los casos se miden en orden una sola vez por sesión, porque
+las escrituras dependen de las anteriores.
+"""
+import asyncio
+import os
+
+import pytest
+
+from benchmarks.query_budget import cases, dataset_for, format_statements, run_cases
+
+SEED = 42
+SIZES = sorted({int(size) for size in os.getenv("QUERY_BUDGET_SIZES", "50,500").split(",") if size.strip()})
+CASES = cases(dataset_for(SIZES[0], SEED))
+
+
+@pytest.fixture(scope="session")
+def budget_runs(tmp_path_factory):
+    database_url = f"sqlite:///{tmp_path_factory.mktemp('query_budget') / 'query_budget.db'}"
+    datasets = [dataset_for(size, SEED) for size in SIZES]
+    runs, routes = asyncio.run(run_cases(database_url, datasets))
+    measurements = {dataset.authors: runs[dataset] for dataset in datasets}
+    return measurements, routes
+
+
+def _case(size: int, name: str):
+    return next(case for case in cases(dataset_for(size, SEED)) if case.name == name)
+
+
+@pytest.mark.parametrize("size", SIZES, ids=lambda size: f"n={size}")
+@pytest.mark.parametrize("name", [case.name for case in CASES])
+def test_case_within_budget(budget_runs, name, size):
+    case, measurement = _case(size, name), budget_runs[0][size][name]
+    assert measurement.status == case.status, measurement.body
+    assert measurement.queries <= case.allowed, (
+        f"{measurement.queries} consultas, presupuesto {case.allowed}:\n{format_statements(measurement.statements)}"
+    )
+
+
+@pytest.mark.parametrize("name", [case.name for case in CASES])
+def test_case_queries_do_not_grow_with_data(budget_runs, name):
+    counts = {size: budget_runs[0][size][name].queries - _case(size, name).stream_batches for size in SIZES}
+    assert len(set(counts.values())) == 1, f"Consultas fijas por tamaño: {counts}"
+
+
+def test_every_route_has_a_case(budget_runs):
+    covered = {(case.method, case.route) for case in CASES}
+    assert budget_runs[1] <= covered, f"Rutas sin caso: {sorted(budget_runs[1] - covered)}"